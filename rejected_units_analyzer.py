@@ -1,25 +1,129 @@
+import time
+IMPORT_STARTED = time.perf_counter()  # Start of the startup timing report
 import sys
 import os
-import pandas as pd
-import numpy as np
+import re
+import json
+import argparse
+import multiprocessing
+import shutil
+import hashlib
+import importlib
+import threading
+import tempfile
+import datetime as dt
+from operator import itemgetter
+from contextlib import contextmanager
+from collections import namedtuple, OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.patheffects
-from pandas.core.frame import com
-import seaborn as sns
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, 
                            QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
-                           QPushButton, QFileDialog, QTableWidget, QTableWidgetItem,
+                           QPushButton, QFileDialog,
                            QScrollArea, QFrame, QTextEdit, QMessageBox, QHeaderView,
                            QComboBox, QDateEdit, QCheckBox, QGroupBox, QSpinBox,
-                           QProgressBar, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QDate, QThread, pyqtSlot, QTimer
-from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap
+                           QProgressBar, QSplitter, QStatusBar, QListView, QLineEdit, QTableView,
+                           QStyledItemDelegate, QStyleOptionViewItem, QStyle)
+from PyQt5.QtCore import (Qt, pyqtSignal, QDate, QThread, pyqtSlot, QTimer, QObject, QAbstractListModel,
+                          QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QRect, QEvent)
+from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap, QPainter
 import warnings
 warnings.filterwarnings('ignore')
 
+# Module name -> seconds its first import took (None until imported)
+DEFERRED_IMPORT_SECONDS = {}
+
+class LazyModule:                                       #Stand-in for a heavy module, imported on first attribute access
+    """pandas, numpy and openpyxl dominate import time, so the window can show before
+    they are needed. On first use the real module replaces the stand-in in this
+    module's globals. Its own attributes are underscored so they never hide the
+    module's (e.g. np.load)."""
+
+    def __init__(self, name, alias=None):
+        self._name = name
+        self._alias = alias or name
+        DEFERRED_IMPORT_SECONDS[name] = None
+
+    def _import(self):
+        started = time.perf_counter()
+        module = importlib.import_module(self._name)
+        if DEFERRED_IMPORT_SECONDS[self._name] is None:
+            DEFERRED_IMPORT_SECONDS[self._name] = time.perf_counter() - started
+        globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._import(), attr)
+
+pd = LazyModule('pandas', 'pd')
+np = LazyModule('numpy', 'np')
+openpyxl = LazyModule('openpyxl')
+
+# Bump whenever clean_data / replace_skus_with_descriptions change their output,
+# so cached frames built by an older pipeline are rebuilt automatically
+CLEANING_PIPELINE_VERSION = 5
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SKU_MASTER_FILE = os.path.join(APP_DIR, 'E80 Item Master - Master Excel.xlsx')
+# Columns the analyzer reads from an E80 "GetRejectedStockUnitsList" export
+E80_COLUMNS = ['Reject datetime', 'Source', 'Reject reason', 'Lpn', 'Sku', 'Log text']
+E80_REQUIRED_COLUMNS = ['Reject datetime', 'Source', 'Reject reason']
+# Text columns clean_data stores as categoricals (Log text and Lpn are dictionary-encoded the same way)
+E80_TEXT_COLUMNS = ['Source', 'Reject reason', 'Lpn', 'Sku', 'Log text']
+# Cleaned data keeps missing values missing; charts, filters and tables show them as this
+MISSING_LABEL = 'Unknown'
+# Cell texts pandas.read_excel treats as missing by default
+EXCEL_NA_STRINGS = {'', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                    'n/a', 'nan', 'null'}
+# Source pattern -> consolidated production line, checked in order (first match wins).
+# Patterns are matched against the upper-cased Source; IBC comes first because
+# its names also end in digits.
+LINE_CONSOLIDATION_RULES = [
+    ('contains', 'IBC', 'IBC (Inbound Conveyor)'),
+    ('contains', 'EOL01', 'Aquafina/Propel 1'),
+    ('contains', 'EOL_01', 'Aquafina/Propel 1'),
+    ('contains', 'EOL02', 'Aquafina/Propel 2'),
+    ('contains', 'EOL_02', 'Aquafina/Propel 2'),
+    ('contains', 'EOL03', 'Can Line 3'),
+    ('contains', 'EOL_03', 'Can Line 3'),
+    ('contains', 'EOL04', 'Can Line 4'),
+    ('contains', 'EOL_04', 'Can Line 4'),
+    ('contains', 'EOL05', 'Bottle Line 5'),
+    ('contains', 'EOL_05', 'Bottle Line 5'),
+    ('contains', 'EOL06', 'Bottle Line 6'),
+    ('contains', 'EOL_06', 'Bottle Line 6'),
+    ('endswith', '1', 'Aquafina/Propel 1'),
+    ('endswith', '2', 'Aquafina/Propel 2'),
+    ('endswith', '3', 'Can Line 3'),
+    ('endswith', '4', 'Can Line 4'),
+    ('endswith', '5', 'Bottle Line 5'),
+    ('endswith', '6', 'Bottle Line 6'),
+]
+# Units produced per consolidated line - EXACT numbers Oscar provided
+PRODUCTION_TOTALS = {
+    'Aquafina/Propel 1': 36720,  # Aquafina/Propel 1
+    'Aquafina/Propel 2': 34407,  # Aquafina/Propel 2
+    'Can Line 3': 54269,         # Can line 3
+    'Can Line 4': 70981,         # Can line 4
+    'Bottle Line 5': 62106,      # Bottle line 5
+    'Bottle Line 6': 53596       # Bottle line 6
+}
+# Reject reason categories in priority order (a reason gets the first category
+# with a matching keyword); everything else is Uncategorized
+DIMENSIONAL_CATEGORY = 'Dimensional Issues'
+TAG_TRACKING_CATEGORY = 'Tag/Tracking/System Issues'
+UNCATEGORIZED_CATEGORY = 'Uncategorized'
+REJECT_CATEGORY_KEYWORDS = [
+    (DIMENSIONAL_CATEGORY, ['dimension', 'size', 'measurement', 'weight', 'position', 'height', 'width',
+                            'length', 'tolerance', 'maximum']),
+    (TAG_TRACKING_CATEGORY, ['tag', 'label', 'lpn', 'barcode', 'duplicate', 'unit data not found', 'tracking',
+                             'expected', 'exist', 'system', 'error', 'timeout', 'failed', 'check error']),
+]
+# Shift names and start hours (24h clock); a shift runs until the next one starts
+SHIFT_SCHEDULE = [('1st Shift', 7), ('2nd Shift', 15), ('3rd Shift', 23)]
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CACHE_DIR = os.environ.get('E80_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.e80_analyzer_cache'))
+
 class ModernTheme:                                      #Dark theme for UI
     def __init__(self):
         # Always use dark theme
@@ -66,6 +170,7 @@ class MetricCard(QFrame):
         value_label.setAlignment(Qt.AlignCenter)
         value_label.setFont(QFont("Segoe UI", 32, QFont.Bold))
         value_label.setStyleSheet("color: white; background: transparent;")
+        self.value_label = value_label
         
         # Title label (bigger)
         title_label = QLabel(title)
@@ -85,6 +190,414 @@ class MetricCard(QFrame):
                 border: none;
             }}
         """)
+        
+    def set_value(self, value):
+        self.value_label.setText(value)
+
+class ChartPanel:                                       #Figure whose axes and artists survive refreshes
+    """A tab's figure and canvas, rebuilt only when the chart layout changes.
+
+    begin(shape) clears the figure and returns True when shape (e.g. the number
+    of bars per axes) differs from the last layout, so the caller creates its
+    axes and artists; otherwise the caller updates the kept artists in place.
+    draw() repaints when the event loop is idle. Headless panels have no
+    canvas; their figure is rendered when it is saved.
+    """
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self.shape = None
+        self.artists = {}
+        self.labels = None
+        self.rebuilds = 0
+        self.updates = 0
+
+    def begin(self, shape):
+        if shape == self.shape:
+            self.updates += 1
+            return False
+        self.figure.clear()
+        self.shape = shape
+        self.artists = {}
+        self.labels = None
+        self.rebuilds += 1
+        return True
+
+    def draw(self, labels=()):
+        """Repaint; the layout is only recomputed after a rebuild or when category labels or tick widths change"""
+        # The widest value tick label moves the axes as much as a new category label does
+        widths = tuple(max((len(tick) for tick in axis.get_major_formatter().format_ticks(axis.get_majorticklocs())), default=0)
+                       for ax in self.figure.axes for axis in (ax.xaxis, ax.yaxis))
+        if (labels, widths) != self.labels:
+            self.figure.tight_layout()
+            self.labels = (labels, widths)
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
+    def clear(self):
+        self.figure.clear()
+        self.shape = None
+        self.artists = {}
+        self.labels = None
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
+class ValueBars:                                        #Bar series with boxed value labels, updated in place
+    """Bars at fixed positions with a value label above (or beside) each one."""
+    def __init__(self, ax, positions, horizontal=False, label_offset=0.1, fontsize=None, pad=0.3, label_alpha=0.8,
+                 tick_kwargs=None, **bar_kwargs):
+        self.ax = ax
+        self.positions = list(positions)
+        self.horizontal = horizontal
+        self.label_offset = label_offset
+        self.tick_kwargs = tick_kwargs or {}
+        zeros = [0] * len(self.positions)
+        if horizontal:
+            self.bars = ax.barh(self.positions, zeros, **bar_kwargs)
+        else:
+            self.bars = ax.bar(self.positions, zeros, **bar_kwargs)
+        label_kwargs = dict(ha='left', va='center') if horizontal else dict(ha='center', va='bottom')
+        if fontsize:
+            label_kwargs['fontsize'] = fontsize
+        self.labels = [ax.text(0, 0, '', color='white', fontweight='bold',
+                               bbox=dict(boxstyle=f"round,pad={pad}", facecolor='black', alpha=label_alpha), **label_kwargs)
+                       for _ in self.positions]
+
+    def update(self, values, tick_labels=None, label_texts=None, label_colors=None, bar_colors=None, label_offset=None):
+        """Set bar lengths, label text/colour and (optionally) tick labels, then rescale the value axis"""
+        label_texts = label_texts or [f'{int(value)}' for value in values]
+        label_offset = self.label_offset if label_offset is None else label_offset
+        for i, (bar, label, value) in enumerate(zip(self.bars, self.labels, values)):
+            if self.horizontal:
+                bar.set_width(value)
+                label.set_position((value + label_offset, bar.get_y() + bar.get_height()/2.))
+            else:
+                bar.set_height(value)
+                label.set_position((bar.get_x() + bar.get_width()/2., value + label_offset))
+            label.set_text(label_texts[i])
+            if label_colors:
+                label.get_bbox_patch().set_facecolor(label_colors[i])
+            if bar_colors:
+                bar.set_facecolor(bar_colors[i])
+        if tick_labels is not None:
+            if self.horizontal:
+                self.ax.set_yticks(self.positions)
+                self.ax.set_yticklabels([str(label) for label in tick_labels], **self.tick_kwargs)
+            else:
+                self.ax.set_xticks(self.positions)
+                self.ax.set_xticklabels([str(label) for label in tick_labels], **self.tick_kwargs)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+class PieSlices:                                        #Pie wedges and labels, updated in place
+    """Pie chart whose wedge angles, labels and percentages are set by update()."""
+    def __init__(self, ax, count, colors, labeldistance=1.1, pctdistance=0.6, **text_kwargs):
+        self.labeldistance = labeldistance
+        self.pctdistance = pctdistance
+        self.wedges, self.texts, self.autotexts = ax.pie([1] * count, labels=[''] * count, autopct='%1.1f%%',
+                                                         colors=colors[:count], labeldistance=labeldistance,
+                                                         pctdistance=pctdistance, textprops=text_kwargs)
+
+    def update(self, values, labels):
+        # Same geometry as Axes.pie (start angle 0, counterclockwise, radius 1)
+        total = float(sum(values))
+        theta1 = 0.0
+        for wedge, text, autotext, value, label in zip(self.wedges, self.texts, self.autotexts, values, labels):
+            frac = value / total
+            theta2 = theta1 + frac
+            thetam = np.pi * (theta1 + theta2)
+            wedge.set_theta1(360. * theta1)
+            wedge.set_theta2(360. * theta2)
+            xt = self.labeldistance * np.cos(thetam)
+            text.set_position((xt, self.labeldistance * np.sin(thetam)))
+            text.set_horizontalalignment('left' if xt > 0 else 'right')
+            text.set_text(label)
+            autotext.set_position((self.pctdistance * np.cos(thetam), self.pctdistance * np.sin(thetam)))
+            autotext.set_text(f'{100. * frac:1.1f}%')
+            theta1 = theta2
+
+class FilterListModel(QAbstractListModel):              #Checkable filter values shown in a QListView
+    """Filter values with a check state per row.
+
+    The view only draws the rows that are scrolled into sight, so a list of
+    thousands of SKUs costs no more widgets than a list of ten. Disabled rows
+    (e.g. periods without data) are greyed out and cannot be checked.
+    checkStatesChanged is emitted once per click or bulk operation.
+    """
+    checkStatesChanged = pyqtSignal()
+    ValueRole = Qt.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = []
+        self.labels = []
+        self.rows = {}
+        self.checked = []  # bool arrays once set_items has run
+        self.enabled = []
+        
+    def set_items(self, values, labels=None, checked=True, enabled=True):
+        """Replace the rows; checked and enabled are one bool for every row or one per row"""
+        self.beginResetModel()
+        self.values = list(values)
+        self.labels = [str(value) for value in self.values] if labels is None else list(labels)
+        self.rows = {value: row for row, value in enumerate(self.values)}
+        self.enabled = np.broadcast_to(np.asarray(enabled, dtype=bool), len(self.values)).copy()
+        self.checked = np.broadcast_to(np.asarray(checked, dtype=bool), len(self.values)) & self.enabled
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.values)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self.labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.checked[row] else Qt.Unchecked
+        if role == Qt.ForegroundRole:
+            return QColor('white' if self.enabled[row] else 'gray')
+        if role == self.ValueRole:
+            return self.values[row]
+        return None
+        
+    def flags(self, index):
+        if not index.isValid() or not self.enabled[index.row()]:
+            return Qt.ItemNeverHasChildren
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemNeverHasChildren
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or not self.enabled[index.row()]:
+            return False
+        self.checked[index.row()] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.checkStatesChanged.emit()
+        return True
+        
+    def set_checked(self, checked):
+        """Check the enabled rows; checked is one bool for every row or one per row"""
+        checked = np.broadcast_to(np.asarray(checked, dtype=bool), len(self.values)) & self.enabled
+        if np.array_equal(checked, self.checked):
+            return
+        self.checked = checked
+        self.dataChanged.emit(self.index(0), self.index(len(self.values) - 1), [Qt.CheckStateRole])
+        self.checkStatesChanged.emit()
+        
+    def solo(self, value):
+        """Check only the row holding value"""
+        self.set_checked(np.arange(len(self.values)) == self.rows.get(value, -1))
+        
+    def checked_values(self):
+        return [self.values[row] for row in np.flatnonzero(self.checked)]
+
+class RejectTableModel(QAbstractTableModel):           #Detail rows read straight from the filtered column arrays
+    """Table model over the rows of a cleaned frame, without a widget or item per cell.
+
+    Each column is kept as one array (categoricals as codes plus their
+    categories) and only the cells the view asks for are formatted. Filtering
+    and sorting reorder an index array with vectorized operations, and rows
+    are handed to the view a page at a time through fetchMore().
+    """
+    COLUMNS = [("Reject DateTime", 'Reject datetime'), ("Source", 'Source'), ("SKU", 'Sku'),
+               ("Reject Reason", 'Reject reason'), ("LPN", 'Lpn'), ("Log Text", 'Log text'), ("Quantity", 'Quantity')]
+    SEARCH_COLUMNS = ['Lpn', 'Log text']
+    PAGE_SIZE = 500
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = []  # (values, categories or None) per COLUMNS entry, None if missing
+        self.row_count = 0
+        self.filters = {}
+        self.search = ''
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+        self.rows = np.zeros(0, dtype=np.int64)
+        self.search_hits = None  # (text, mask over rows) of the last search
+        self.order = np.zeros(0, dtype=np.int64)  # Row positions shown, after filtering and sorting
+        self.loaded = 0
+        
+    def set_frame(self, frame, rows=None):
+        """Show frame's rows (only those at positions rows when given)"""
+        self.beginResetModel()
+        self.columns = []
+        for _, column in self.COLUMNS:
+            if column not in frame.columns:
+                self.columns.append(None)
+                continue
+            values = frame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                self.columns.append((values.cat.codes.to_numpy(), values.cat.categories))
+            else:
+                self.columns.append((np.asarray(values.array), None))  # The frame's own buffer, not a copy
+        self.row_count = len(frame)
+        self.rows = np.arange(self.row_count) if rows is None else np.asarray(rows, dtype=np.int64)
+        self.search_hits = None
+        self._update_order()
+        self.endResetModel()
+        
+    def set_filter(self, column, value=None):
+        """Only show rows whose column equals value (None removes the filter)"""
+        if value is None:
+            self.filters.pop(column, None)
+        else:
+            self.filters[column] = value
+        self.refresh()
+        
+    def set_search(self, text):
+        """Only show rows whose LPN or log text contains text (case-insensitive)"""
+        self.search = text
+        self.refresh()
+        
+    def refresh(self):
+        self.beginResetModel()
+        self._update_order()
+        self.endResetModel()
+        
+    def _column(self, column):
+        return self.columns[[name for _, name in self.COLUMNS].index(column)]
+        
+    def _update_order(self):
+        mask = np.ones(len(self.rows), dtype=bool)
+        for column, value in self.filters.items():
+            array = self._column(column)
+            if array is None:
+                continue
+            values, categories = array
+            if categories is not None:
+                code = categories.get_indexer([value])[0]
+                mask &= values[self.rows] == code
+            else:
+                mask &= values[self.rows] == value
+        if self.search:
+            mask &= self._search_mask()
+        self.order = self.rows[mask]
+        if self.sort_column is not None and self.columns[self.sort_column] is not None:
+            self.order = self.order[np.argsort(self._sort_key(self.sort_column)[self.order], kind='stable')]
+            if self.sort_order == Qt.DescendingOrder:
+                self.order = self.order[::-1]
+        self.loaded = min(self.PAGE_SIZE, len(self.order))
+        
+    def _search_mask(self):
+        """Rows matching the search text (reused while only the other filters change)"""
+        if self.search_hits is None or self.search_hits[0] != self.search:
+            found = np.zeros(len(self.rows), dtype=bool)
+            for column in self.SEARCH_COLUMNS:
+                array = self._column(column)
+                if array is None:
+                    continue
+                values, categories = array
+                if categories is not None:
+                    # Search the dictionary once, then look rows up by code
+                    hits = np.append(categories.astype(str).str.contains(self.search, case=False, regex=False), False)
+                    found |= hits[values[self.rows]]
+                else:
+                    found |= pd.Series(values[self.rows]).astype(str).str.contains(self.search, case=False, regex=False).to_numpy()
+            self.search_hits = (self.search, found)
+        return self.search_hits[1]
+        
+    def _sort_key(self, section):
+        """Integer or numeric key per row that orders the column's values"""
+        values, categories = self.columns[section]
+        if categories is not None:
+            rank = np.empty(len(categories) + 1, dtype=np.int64)
+            rank[:-1] = np.argsort(np.argsort(categories.astype(str), kind='stable'), kind='stable')
+            rank[-1] = -1  # Missing (code -1) sorts first
+            return rank[values]
+        if values.dtype.kind == 'M':
+            return values.view(np.int64)
+        if values.dtype.kind in 'iufb':
+            return values
+        return pd.factorize(values, sort=True)[0]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.order)
+        
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.PAGE_SIZE, len(self.order) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole) or self.columns[index.column()] is None:
+            return None
+        values, categories = self.columns[index.column()]
+        value = values[self.order[index.row()]]
+        if categories is not None:
+            return str(categories[value]) if value >= 0 else MISSING_LABEL
+        if values.dtype.kind == 'M':
+            return '' if np.isnat(value) else str(pd.Timestamp(value).strftime('%Y-%m-%d %H:%M:%S'))
+        return '' if pd.isna(value) else str(value)
+        
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0 or not self.columns or self.columns[column] is None:
+            column = None  # Unsorted (file order)
+        self.sort_column = column
+        self.sort_order = order
+        self.refresh()
+
+class SoloButtonDelegate(QStyledItemDelegate):          #Paints a "Solo" button on every filter list row
+    """Draws each row with a Solo button at its right edge.
+
+    Clicking the button emits soloClicked with the row's value; clicking
+    anywhere else on the row toggles its check box.
+    """
+    soloClicked = pyqtSignal(object)
+    BUTTON_WIDTH = 40
+    
+    def button_rect(self, rect):
+        return QRect(rect.right() - self.BUTTON_WIDTH - 4, rect.top() + 2, self.BUTTON_WIDTH, rect.height() - 4)
+        
+    def text_option(self, option):
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect = option.rect.adjusted(0, 0, -self.BUTTON_WIDTH - 8, 0)
+        return text_option
+        
+    def paint(self, painter, option, index):
+        super().paint(painter, self.text_option(option), index)
+        if not index.flags() & Qt.ItemIsEnabled:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor('#e67e22' if option.state & QStyle.State_MouseOver else '#f39c12'))
+        rect = self.button_rect(option.rect)
+        painter.drawRoundedRect(rect, 2, 2)
+        font = QFont(option.font)
+        font.setPixelSize(10)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor('white'))
+        painter.drawText(rect, Qt.AlignCenter, "Solo")
+        painter.restore()
+        
+    def editorEvent(self, event, model, option, index):
+        if not index.flags() & Qt.ItemIsEnabled:
+            return False
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
+            return True
+        if event.type() == QEvent.MouseButtonRelease:
+            if self.button_rect(option.rect).contains(event.pos()):
+                self.soloClicked.emit(index.data(FilterListModel.ValueRole))
+            else:
+                checked = index.data(Qt.CheckStateRole) == Qt.Checked
+                model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+            return True
+        return super().editorEvent(event, model, self.text_option(option), index)
 
 class ModernCard(QFrame):
     def __init__(self, title=None, theme=None):
@@ -129,56 +642,2450 @@ class ModernCard(QFrame):
                 }}
             """)
 
-class RejectedUnitsAnalyzer(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.theme = ModernTheme()
-        self.current_data = None
-        self.filtered_data = None
-        self.analysis_results = None
-        self.current_file = None
+def iter_e80_batches(path, columns=E80_COLUMNS, batch_size=5000, since=None):
+    """Stream an E80 export as DataFrame batches in a single pass over the workbook.
+
+    The workbook is opened once in streaming (read-only) mode, the data sheet is
+    found from its header row ('Reject datetime'), and only the requested
+    columns are kept. Yields (sheet_name, rows_read, total_rows, batch) where
+    total_rows comes from the sheet dimension and may be None. Yields nothing
+    when no sheet has the expected header.
+
+    With since set, rows whose 'Reject datetime' cell is a datetime earlier
+    than since are skipped before any DataFrame is built for them.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header or 'Reject datetime' not in header:
+                continue
+            header = [str(h).strip() if h is not None else None for h in header]
+            selected = [col for col in columns if col in header]
+            positions = [header.index(col) for col in selected]
+            width = max(positions) + 1
+            pick = itemgetter(*positions)
+            datetime_pos = header.index('Reject datetime')
+            since_value = pd.Timestamp(since).to_pydatetime() if since is not None else None
+            total_rows = worksheet.max_row - 1 if worksheet.max_row else None
+            records, blank_run, rows_read = [], [], 0
+            for row in rows:
+                rows_read += 1
+                if since_value is not None and datetime_pos < len(row):
+                    stamp = row[datetime_pos]
+                    if isinstance(stamp, dt.datetime) and stamp < since_value:
+                        continue
+                if len(row) < width:
+                    row = tuple(row) + (None,) * (width - len(row))
+                values = pick(row) if len(positions) > 1 else (pick(row),)
+                record = tuple(None if isinstance(value, str) and value in EXCEL_NA_STRINGS else value
+                               for value in values)
+                # Hold back blank rows until a data row follows, so trailing
+                # blank rows are dropped as pandas.read_excel does
+                if all(value is None for value in record):
+                    blank_run.append(record)
+                    continue
+                if blank_run:
+                    records.extend(blank_run)
+                    blank_run = []
+                records.append(record)
+                if len(records) >= batch_size:
+                    yield worksheet.title, rows_read, total_rows, pd.DataFrame.from_records(records, columns=selected)
+                    records = []
+            yield worksheet.title, rows_read, total_rows, pd.DataFrame.from_records(records, columns=selected)
+            return
+    finally:
+        workbook.close()
+
+def read_e80_workbook(path, columns=E80_COLUMNS):
+    """Read a whole E80 export; returns (sheet_name, DataFrame) or (None, None)"""
+    sheet_name, batches = None, []
+    for sheet_name, _, _, batch in iter_e80_batches(path, columns):
+        batches.append(batch)
+    if sheet_name is None:
+        return None, None
+    return sheet_name, pd.concat(batches, ignore_index=True)
+
+def validate_e80_export(data_sheet, df):
+    """Raise InvalidExportError unless a data sheet was found and has the expected columns (E80 format)"""
+    if data_sheet is None:
+        raise InvalidExportError("Could not find a sheet with 'Reject datetime' column.\n\n"
+                                 "Please ensure this is a valid E80 rejected units export.")
+    missing_columns = [col for col in E80_REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise InvalidExportError(f"Missing expected columns: {', '.join(missing_columns)}\n\n"
+                                 f"Please ensure this is a valid E80 rejected units export.\n"
+                                 f"Expected columns: {', '.join(E80_COLUMNS)}")
+
+def benchmark_workbook_load(path, repeat=3):
+    """Compare the old multi-open pandas load against read_e80_workbook"""
+    def legacy_load():
+        excel_file = pd.ExcelFile(path)
+        data_sheet = None
+        for sheet_name in excel_file.sheet_names:
+            temp_df = pd.read_excel(path, sheet_name=sheet_name, nrows=0)
+            if 'Reject datetime' in temp_df.columns:
+                data_sheet = sheet_name
+                break
+        return data_sheet, pd.read_excel(path, sheet_name=data_sheet)
+
+    results = {}
+    for name, loader in [('pandas (per-sheet header reads)', legacy_load),
+                         ('single-pass projected read', lambda: read_e80_workbook(path))]:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sheet, df = loader()
+            timings.append(time.perf_counter() - start)
+        results[name] = min(timings)
+        print(f"{name:34s} best of {repeat}: {min(timings):7.3f}s  ({len(df):,} rows, sheet '{sheet}')")
+    legacy, single = results.values()
+    print(f"Speedup: {legacy / single:.2f}x")
+    return results
+
+def consolidate_line(source):
+    """Consolidate one Source value using LINE_CONSOLIDATION_RULES"""
+    if pd.isna(source):
+        return MISSING_LABEL
+    source_str = str(source).upper()
+    for match, pattern, line in LINE_CONSOLIDATION_RULES:
+        if (match == 'contains' and pattern in source_str) or (match == 'endswith' and source_str.endswith(pattern)):
+            return line
+    return source_str  # Keep original if no pattern matches
+
+def consolidate_sources(sources):
+    """Consolidated line for a whole Source column as a Categorical.
+
+    The rules run once per distinct Source value; rows only get an integer
+    code lookup. Rows without a Source stay missing.
+    """
+    source_codes, distinct_sources = pd.factorize(sources)
+    lines = [consolidate_line(source) for source in distinct_sources]
+    line_codes, categories = pd.factorize(pd.Series(lines, dtype=object))
+    lookup = np.append(line_codes, -1)  # Code -1 (missing) maps to itself
+    return pd.Categorical.from_codes(lookup[source_codes], categories=list(categories))
+
+def text_categorical(values):
+    """Stripped text of a raw export column as a Categorical; missing cells stay missing.
+
+    Text conversion and stripping run once per distinct value.
+    """
+    codes, uniques = pd.factorize(values)
+    text_codes, categories = pd.factorize(pd.Index(uniques).astype(str).str.strip())
+    lookup = np.append(text_codes, -1)
+    return pd.Categorical.from_codes(lookup[codes], categories=categories)
+
+def labelled_codes(values, observed=False):
+    """(int64 codes, pd.Index of labels) of a column, with missing values labelled MISSING_LABEL.
+
+    Categoricals keep all their categories in order (calendar order for
+    Period) unless observed is set; otherwise labels are the values present,
+    in order of appearance.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype) and not observed:
+        codes = values.cat.codes.to_numpy().astype(np.int64)
+        labels = pd.Index(values.cat.categories)
+    else:
+        codes, labels = pd.factorize(values)
+        labels = pd.Index(labels)
+    missing = codes < 0
+    if missing.any():
+        if MISSING_LABEL in labels:
+            codes[missing] = labels.get_loc(MISSING_LABEL)
+        else:
+            codes[missing] = len(labels)
+            labels = labels.append(pd.Index([MISSING_LABEL]))
+    return codes, labels
+
+class RejectReasonClassifier:                           #Keyword classifier for reject reasons
+    """Classifies reject reasons into the REJECT_CATEGORY_KEYWORDS categories.
+
+    Each keyword set is compiled into a single case-insensitive alternation
+    regex. Every distinct reason is classified once and memoized, so the cost
+    scales with the number of distinct reasons, not rows.
+    """
+    def __init__(self, category_keywords=REJECT_CATEGORY_KEYWORDS):
+        self.patterns = [(category, re.compile('|'.join(re.escape(k) for k in keywords), re.IGNORECASE))
+                         for category, keywords in category_keywords]
+        self.categories = [category for category, _ in category_keywords] + [UNCATEGORIZED_CATEGORY]
+        self._memo = {}
+
+    def classify_reason(self, reason):
+        if pd.isna(reason):
+            return UNCATEGORIZED_CATEGORY
+        reason = str(reason)
+        if reason not in self._memo:
+            self._memo[reason] = next((category for category, pattern in self.patterns if pattern.search(reason)),
+                                      UNCATEGORIZED_CATEGORY)
+        return self._memo[reason]
+
+    def classify(self, reasons):
+        """Category of every row as a Categorical (one regex pass per distinct reason)"""
+        reason_codes, distinct_reasons = pd.factorize(reasons)
+        category_index = {category: i for i, category in enumerate(self.categories)}
+        lookup = np.array([category_index[self.classify_reason(r)] for r in distinct_reasons]
+                          + [category_index[UNCATEGORIZED_CATEGORY]], dtype=np.int8)
+        return pd.Categorical.from_codes(lookup[reason_codes], categories=self.categories)
+
+class ParsedWorkbookCache:                              #On-disk columnar cache of cleaned E80 data
+    """Stores fully cleaned DataFrames as one .npy file per column.
+
+    Entries live under <cache_dir>/<file sha256>/<sheet>__<pipeline key>/ so an
+    unchanged export is found by its content hash alone, and a new pipeline key
+    (cleaning version or SKU master change) simply misses and rebuilds.
+    """
+    MANIFEST = 'manifest.json'
+    SKU_INDEX_DIR = 'sku_master'  # SkuMasterService's index, kept out of pruning
+
+    def __init__(self, cache_dir=CACHE_DIR, max_files=20):
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self._hash_memo = {}
+
+    def file_hash(self, path):
+        """SHA-256 of the file contents (memoized per path/size/mtime)"""
+        stat = os.stat(path)
+        memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._hash_memo:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            self._hash_memo[memo_key] = digest.hexdigest()
+        return self._hash_memo[memo_key]
+
+    def _entry_name(self, sheet_name, pipeline_key):
+        sheet_id = hashlib.sha1(str(sheet_name).encode('utf-8')).hexdigest()[:12]
+        return f"{sheet_id}__{pipeline_key}"
+
+    def find(self, file_hash, pipeline_key, sheet_name=None):
+        """Return (sheet_name, DataFrame) for a cached entry, or None on a miss"""
+        file_dir = os.path.join(self.cache_dir, file_hash)
+        if not os.path.isdir(file_dir):
+            return None
+        if sheet_name is not None:
+            candidates = [self._entry_name(sheet_name, pipeline_key)]
+        else:
+            candidates = [d for d in os.listdir(file_dir) if d.endswith(f"__{pipeline_key}")]
+        for name in candidates:
+            entry_dir = os.path.join(file_dir, name)
+            try:
+                sheet, df = self._load_entry(entry_dir)
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable cache entry {entry_dir}: {e}")
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                continue
+            os.utime(file_dir)  # Mark as recently used for pruning
+            return sheet, df
+        return None
+
+    def store(self, file_hash, sheet_name, pipeline_key, df):
+        """Write a cleaned frame to the cache, replacing entries from older pipelines"""
+        file_dir = os.path.join(self.cache_dir, file_hash)
+        os.makedirs(file_dir, exist_ok=True)
+        entry_name = self._entry_name(sheet_name, pipeline_key)
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=file_dir)
+        try:
+            columns = []
+            for i, col in enumerate(df.columns):
+                columns.append(self._write_column(tmp_dir, i, col, df[col]))
+            manifest = {
+                'sheet_name': sheet_name,
+                'pipeline_key': pipeline_key,
+                'rows': len(df),
+                'columns': columns,
+            }
+            with open(os.path.join(tmp_dir, self.MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            # Drop entries of this workbook built by any other pipeline version
+            for name in os.listdir(file_dir):
+                if name != os.path.basename(tmp_dir) and not name.startswith('.tmp-'):
+                    shutil.rmtree(os.path.join(file_dir, name), ignore_errors=True)
+            os.replace(tmp_dir, os.path.join(file_dir, entry_name))
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        self._prune()
+
+    def _prune(self):
+        """Keep only the most recently used workbooks"""
+        try:
+            file_dirs = [os.path.join(self.cache_dir, d) for d in os.listdir(self.cache_dir) if d != self.SKU_INDEX_DIR]
+        except OSError:
+            return
+        file_dirs = sorted((d for d in file_dirs if os.path.isdir(d)), key=os.path.getmtime, reverse=True)
+        for stale in file_dirs[self.max_files:]:
+            shutil.rmtree(stale, ignore_errors=True)
+
+    @staticmethod
+    def _encode_value(value):
+        if isinstance(value, (dt.date, dt.datetime)):
+            return {'__date__': value.isoformat()}
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    @staticmethod
+    def _decode_value(value):
+        if isinstance(value, dict) and '__date__' in value:
+            text = value['__date__']
+            return dt.datetime.fromisoformat(text) if 'T' in text else dt.date.fromisoformat(text)
+        return value
+
+    def _write_column(self, entry_dir, index, name, series):
+        file_name = f"col{index}.npy"
+        info = {'name': name, 'file': file_name, 'dtype': str(series.dtype)}
+        if pd.api.types.is_datetime64_any_dtype(series):
+            info['kind'] = 'datetime'
+            np.save(os.path.join(entry_dir, file_name), series.to_numpy('datetime64[ns]').view('i8'))
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            # Keep every category and its order, not just the observed values
+            info['kind'] = 'categorical'
+            info['categories'] = [self._encode_value(v) for v in series.cat.categories]
+            info['ordered'] = bool(series.cat.ordered)
+            np.save(os.path.join(entry_dir, file_name), series.cat.codes.to_numpy().astype(np.int32))
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            info['kind'] = 'numeric'
+            np.save(os.path.join(entry_dir, file_name), series.to_numpy())
+        else:
+            # Dictionary-encode text/object columns: int32 codes + JSON categories
+            codes, uniques = pd.factorize(series)
+            info['kind'] = 'dictionary'
+            info['categories'] = [self._encode_value(v) for v in uniques]
+            np.save(os.path.join(entry_dir, file_name), codes.astype(np.int32))
+        return info
+
+    def _load_entry(self, entry_dir):
+        with open(os.path.join(entry_dir, self.MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+        data = {}
+        for info in manifest['columns']:
+            values = np.load(os.path.join(entry_dir, info['file']), mmap_mode='r')
+            if info['kind'] == 'datetime':
+                column = pd.Series(np.asarray(values).view('datetime64[ns]'))
+                if info['dtype'] != str(column.dtype):
+                    column = column.astype(info['dtype'])
+                data[info['name']] = column
+            elif info['kind'] == 'numeric':
+                data[info['name']] = pd.Series(np.array(values))
+            elif info['kind'] == 'categorical':
+                categories = [self._decode_value(v) for v in info['categories']]
+                data[info['name']] = pd.Series(pd.Categorical.from_codes(np.asarray(values), categories=categories,
+                                                                         ordered=info['ordered']))
+            else:
+                categories = [self._decode_value(v) for v in info['categories']]
+                lookup = np.empty(len(categories) + 1, dtype=object)
+                lookup[:len(categories)] = categories
+                lookup[-1] = None  # factorize marks missing values with code -1
+                column = pd.Series(lookup[np.asarray(values)])
+                if info['dtype'] != 'object':
+                    column = column.astype(info['dtype'])
+                data[info['name']] = column
+            if len(data[info['name']]) != manifest['rows']:
+                raise ValueError(f"column {info['name']!r} has the wrong length")
+        return manifest['sheet_name'], pd.DataFrame(data)
+
+# Keys of perform_analysis results that hold value counts
+ANALYSIS_COUNT_KEYS = ['rejection_reasons', 'line_breakdown', 'monthly_trends', 'period_trends', 'product_breakdown']
+# Dimensions of the rejection count cube that the charts are drawn from
+CUBE_DIMENSIONS = ['Period', 'Consolidated_Line', 'Source', 'Sku', 'Reject reason', 'Category', 'Hour', 'DayOfWeek']
+# Rows with the same key are the same rejection when YTD exports overlap
+DEDUP_KEY_COLUMNS = ['Lpn', 'Reject datetime', 'Source']
+
+def merge_analysis(base, delta):
+    """Combine two perform_analysis results by adding their counts"""
+    merged = dict(base)
+    merged['total_rejections'] = base.get('total_rejections', 0) + delta.get('total_rejections', 0)
+    merged['total_quantity'] = base.get('total_quantity', 0) + delta.get('total_quantity', 0)
+    for key in ANALYSIS_COUNT_KEYS:
+        if key not in delta:
+            continue
+        counts = dict(base.get(key, {}))
+        for value, count in delta[key].items():
+            counts[value] = counts.get(value, 0) + count
+        merged[key] = counts
+    starts = [r[0] for r in (base.get('date_range'), delta.get('date_range')) if r and r[0] is not None]
+    ends = [r[1] for r in (base.get('date_range'), delta.get('date_range')) if r and r[1] is not None]
+    merged['date_range'] = (min(starts) if starts else None, max(ends) if ends else None)
+    if 'cube' in base and 'cube' in delta:
+        merged['cube'] = RejectionCube.combine([base['cube'], delta['cube']])
+    return merged
+
+def concat_cleaned(frames):
+    """Concatenate cleaned frames, keeping categorical columns categorical.
+
+    pandas falls back to object (or str) when the frames' categories differ, so
+    such columns are re-coded against the union of the categories; for ordered
+    ones the frame with the most categories (e.g. the longest period
+    calendar) sets the order.
+    """
+    combined = pd.concat(frames, ignore_index=True)
+    for column, dtype in frames[0].dtypes.items():
+        if not isinstance(dtype, pd.CategoricalDtype) or isinstance(combined[column].dtype, pd.CategoricalDtype):
+            continue
+        parts = [frame[column].array for frame in frames if column in frame.columns]
+        if len(parts) < len(frames) or not all(isinstance(part, pd.Categorical) for part in parts):
+            continue
+        categories = pd.Index([], dtype=parts[0].categories.dtype)
+        for part in sorted(parts, key=lambda part: -len(part.categories)):
+            categories = categories.append(part.categories[~part.categories.isin(categories)])
+        codes = np.concatenate([np.append(categories.get_indexer(part.categories), -1)[part.codes] for part in parts])
+        combined[column] = pd.Categorical.from_codes(codes, categories=categories, ordered=dtype.ordered)
+    return combined
+
+def rows_since(df, cutoff):
+    """Rows of a cleaned frame rejected at or after cutoff, for an incremental append.
+
+    Rows without a reject time (NaT) are dropped: they cannot be placed after
+    the cutoff, and a cumulative export would otherwise append them again on
+    every incremental load. A full load keeps them.
+    """
+    return df[(df['Reject datetime'] >= cutoff).to_numpy()].reset_index(drop=True)
+
+def drop_overlapping_rows(base, delta, cutoff):
+    """Remove delta rows already present in base (matched on DEDUP_KEY_COLUMNS)"""
+    keys = [col for col in DEDUP_KEY_COLUMNS if col in base.columns and col in delta.columns]
+    if not keys or len(delta) == 0:
+        return delta
+    base_times = pd.to_datetime(base['Reject datetime'], errors='coerce')
+    overlap = base.loc[base_times >= cutoff, keys]
+    if len(overlap) == 0:
+        return delta
+    seen = pd.MultiIndex.from_frame(overlap)
+    return delta[~pd.MultiIndex.from_frame(delta[keys]).isin(seen)]
+
+def merge_exports(frames):
+    """One cleaned frame from several exports; returns (merged, duplicates dropped).
+
+    Rows of an export that an earlier export already holds (matched on
+    DEDUP_KEY_COLUMNS) are dropped, so overlapping date ranges count once.
+    The frames are concatenated once; each key is then kept only in the
+    first export it appears in. Rows without a reject time never match.
+    """
+    merged = concat_cleaned(frames) if len(frames) > 1 else frames[0]
+    keys = [col for col in DEDUP_KEY_COLUMNS if all(col in frame.columns for frame in frames)]
+    if len(frames) == 1 or 'Reject datetime' not in keys:
+        return merged, 0
+    export = np.repeat(np.arange(len(frames)), [len(frame) for frame in frames])
+    key_codes = merged.groupby(keys, sort=False, dropna=False, observed=True).ngroup().to_numpy()
+    # Rows are in export order, so a key's first row is in the first export holding it
+    _, first_rows = np.unique(key_codes, return_index=True)
+    first_export = np.empty(len(first_rows), dtype=export.dtype)
+    first_export[key_codes[first_rows]] = export[first_rows]
+    duplicate = (export > first_export[key_codes]) & merged['Reject datetime'].notna().to_numpy()
+    if not duplicate.any():
+        return merged, 0
+    return merged[~duplicate].reset_index(drop=True), int(duplicate.sum())
+
+class SkuMasterService:                                 #Indexed SKU number -> product description lookup
+    """Parses the E80 item master once and keeps a sorted integer index of it.
+
+    The index (sorted int64 SKU numbers, int32 description codes and the
+    description strings) is persisted in the cache directory and rebuilt only
+    when the master file's mtime/size and content hash no longer match.
+    """
+    def __init__(self, master_path=SKU_MASTER_FILE, cache=None):
+        self.master_path = master_path
+        self.cache = cache if cache is not None else ParsedWorkbookCache()
+        self.index_dir = os.path.join(self.cache.cache_dir, self.cache.SKU_INDEX_DIR)
+        self.sku_numbers = None
+        self.description_codes = None
+        self.descriptions = None
+        self._stat = None
+        self._lock = threading.Lock()
+        self.last_stats = {}
+
+    def fingerprint(self):
+        """Short content hash of the master file, or 'nomaster' when it is missing"""
+        if not os.path.exists(self.master_path):
+            return 'nomaster'
+        return self.cache.file_hash(self.master_path)[:16]
+
+    def _current_stat(self):
+        stat = os.stat(self.master_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def load(self):
+        """Make sure the index matches the master file on disk"""
+        with self._lock:
+            stat = self._current_stat()
+            if self.sku_numbers is not None and stat == self._stat:
+                return
+            meta_path = os.path.join(self.index_dir, 'meta.json')
+            index_path = os.path.join(self.index_dir, 'index.npz')
+            meta = None
+            if os.path.exists(meta_path) and os.path.exists(index_path):
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+            # mtime/size is the cheap check; fall back to the content hash when the file was only touched
+            if meta is not None and (meta['stat'] == stat or meta['sha256'] == self.cache.file_hash(self.master_path)):
+                index = self._read_index(index_path, meta['sha256'])
+            else:
+                index = None
+            if index is not None:
+                self.sku_numbers, self.description_codes, self.descriptions = index
+                if meta['stat'] != stat:
+                    meta['stat'] = stat
+                    self._replace_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+            else:
+                self._build_index(stat)
+            self._stat = stat
+
+    @staticmethod
+    def _read_index(index_path, sha256):
+        """(numbers, codes, descriptions) from index.npz, or None if it was built from another master"""
+        with np.load(index_path) as index:
+            if 'sha256' not in index or str(index['sha256']) != sha256:
+                return None
+            return index['sku_numbers'], index['description_codes'], index['descriptions'].astype(object)
+
+    def _replace_file(self, path, write):
+        """Write a file under the index dir through a temp file and os.replace, so readers never see half of it"""
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=self.index_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _build_index(self, stat):
+        master = pd.read_excel(self.master_path, usecols=['Name', 'Description'])
+        master = master.dropna(subset=['Description'])
+        numbers = pd.to_numeric(master['Name'], errors='coerce')
+        master = master[numbers.notna() & (numbers % 1 == 0)]
+        master = master.assign(Name=numbers.loc[master.index].astype(np.int64))
+        # Later rows win, matching the old dict(zip(...)) mapping
+        master = master.drop_duplicates(subset='Name', keep='last').sort_values('Name')
+        codes, descriptions = pd.factorize(master['Description'].astype(str))
+        self.sku_numbers = master['Name'].to_numpy(np.int64)
+        self.description_codes = codes.astype(np.int32)
+        self.descriptions = np.asarray(descriptions, dtype=object)
+        
+        # The index carries the master hash too, so a meta.json from another build is never paired with it
+        sha256 = self.cache.file_hash(self.master_path)
+        os.makedirs(self.index_dir, exist_ok=True)
+        self._replace_file(os.path.join(self.index_dir, 'index.npz'), lambda f: np.savez(
+            f, sku_numbers=self.sku_numbers, description_codes=self.description_codes,
+            descriptions=self.descriptions.astype(str), sha256=np.array(sha256)))
+        meta = {'stat': stat, 'sha256': sha256}
+        self._replace_file(os.path.join(self.index_dir, 'meta.json'), lambda f: f.write(json.dumps(meta).encode('utf-8')))
+
+    def resolve(self, skus):
+        """Replace SKU numbers with descriptions using a sorted integer join.
+
+        skus holds SKU text as exported (e.g. '300043010.0'); missing SKUs stay
+        missing. Each distinct SKU is resolved once. Numeric SKUs missing from
+        the master keep their number as text. Returns a categorical Series;
+        hit/miss row counts go to last_stats.
+        """
+        self.load()
+        codes, distinct = pd.factorize(skus)
+        rows_per_sku = np.bincount(codes[codes >= 0], minlength=len(distinct))
+        # Normalise the export format ('300043010.0' -> '300043010')
+        sku_text = pd.Series(pd.Index(distinct).astype(str)).str.replace('.0', '', regex=False)
+        numeric_mask = sku_text.str.match(r'^\d+$', na=False).to_numpy()
+        numbers = np.full(len(sku_text), -1, dtype=np.int64)
+        numbers[numeric_mask] = sku_text[numeric_mask].astype(np.int64).to_numpy()
+        
+        positions = np.searchsorted(self.sku_numbers, numbers)
+        positions = np.minimum(positions, max(len(self.sku_numbers) - 1, 0))
+        hits = numeric_mask & (len(self.sku_numbers) > 0)
+        if len(self.sku_numbers):
+            hits &= self.sku_numbers[positions] == numbers
+        
+        resolved = sku_text.to_numpy(dtype=object).copy()
+        resolved[numeric_mask] = numbers[numeric_mask].astype(str)  # Drop leading zeros
+        resolved[hits] = self.descriptions[self.description_codes[positions[hits]]]
+        
+        self.last_stats = {
+            'rows': len(skus),
+            'hits': int(rows_per_sku[hits].sum()),
+            'misses': int(rows_per_sku[numeric_mask & ~hits].sum()),
+            'unknown': len(skus) - int(rows_per_sku[numeric_mask].sum()),
+            'master_skus': len(self.sku_numbers),
+        }
+        # Several SKUs can share a description
+        resolved_codes, categories = pd.factorize(pd.Index(resolved, dtype=str))
+        lookup = np.append(resolved_codes, -1)
+        return pd.Series(pd.Categorical.from_codes(lookup[codes], categories=categories), index=skus.index)
+
+class PepsiPeriodCalendar:                              #Fiscal period/week calendar driven by a boundary table
+    """Assigns Pepsi fiscal periods and weeks with a single searchsorted.
+
+    A fiscal year runs from the Sunday after the last Saturday of December
+    through the last Saturday of the following December (52 or 53 weeks).
+    Each year is split into periods by period_weeks: thirteen 4-week
+    (28-day) periods by default, or e.g. (4, 4, 5) * 4 for 4-4-5 quarters.
+    The extra week of a 53-week year goes to the last period. The boundary
+    table grows automatically when data falls outside the covered years.
+    """
+    UNKNOWN = 'Unknown'
+    _NAT = -2 ** 63  # np.iinfo(np.int64).min
+    _DAY_NS = 86400 * 10**9
+
+    def __init__(self, period_weeks=(4,) * 13, first_year=2020, last_year=None):
+        self.period_weeks = tuple(period_weeks)
+        self._lock = threading.Lock()
+        self._initial_years = (first_year, last_year or dt.date.today().year + 5)
+        self._boundaries = None
+
+    @staticmethod
+    def fiscal_year_end(year):
+        """Last Saturday of December"""
+        dec31 = dt.date(year, 12, 31)
+        return dec31 - dt.timedelta(days=(dec31.weekday() - 5) % 7)
+
+    @classmethod
+    def fiscal_year_start(cls, year):
+        return cls.fiscal_year_end(year - 1) + dt.timedelta(days=1)
+
+    @classmethod
+    def fiscal_year_of(cls, date):
+        return date.year if date <= cls.fiscal_year_end(date.year) else date.year + 1
+
+    @staticmethod
+    def label(year, period):
+        return f"FY{year} Period {period}"
+
+    def _build(self, first_year, last_year):
+        rows = []
+        year_starts = []
+        for year in range(first_year, last_year + 1):
+            start = self.fiscal_year_start(year)
+            year_starts.append(start)
+            year_weeks = (self.fiscal_year_end(year) - start).days // 7 + 1
+            weeks = list(self.period_weeks)
+            weeks[-1] += year_weeks - sum(weeks)
+            if weeks[-1] <= 0:
+                raise ValueError(f"period_weeks {self.period_weeks} do not fit fiscal {year} ({year_weeks} weeks)")
+            for number, period_weeks in enumerate(weeks, 1):
+                end = start + dt.timedelta(weeks=period_weeks)
+                rows.append((self.label(year, number), year, number, start, end - dt.timedelta(days=1)))
+                start = end
+        year_starts.append(start)
+        
+        table = pd.DataFrame(rows, columns=['label', 'fiscal_year', 'period', 'start', 'end'])
+        to_ns = lambda dates: np.array(dates, dtype='datetime64[D]').astype('datetime64[ns]').view('i8')
+        # Swap the whole state in one go so readers on other threads never see a mix
+        self._boundaries = {
+            'first_year': first_year,
+            'last_year': last_year,
+            'table': table,
+            'starts': to_ns(list(table['start']) + [start]),
+            'year_starts': to_ns(year_starts),
+            'categories': list(table['label']) + [self.UNKNOWN],
+            'rows': {row.label: row for row in table.itertuples(index=False)},
+        }
+
+    @property
+    def _state(self):
+        # Built on first use, so creating a calendar does not import pandas
+        if self._boundaries is None:
+            with self._lock:
+                if self._boundaries is None:
+                    self._build(*self._initial_years)
+        return self._boundaries
+
+    @property
+    def table(self):
+        """Boundary table: label, fiscal_year, period, start, end (inclusive dates)"""
+        return self._state['table']
+
+    @property
+    def categories(self):
+        """Period labels in calendar order, followed by 'Unknown'"""
+        return self._state['categories']
+
+    def _as_ns(self, values):
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            series = pd.to_datetime(series, errors='coerce')
+        ns = series.to_numpy(dtype='datetime64[ns]').view('i8')
+        valid = ns[ns != self._NAT]
+        if len(valid):
+            state = self._state
+            first = self.fiscal_year_of(pd.Timestamp(valid.min()).date())
+            last = self.fiscal_year_of(pd.Timestamp(valid.max()).date())
+            if first < state['first_year'] or last > state['last_year']:
+                with self._lock:
+                    self._build(min(first, state['first_year']), max(last, state['last_year']))
+        return ns
+
+    def period_codes(self, values):
+        """Index of each timestamp's period in table order (-1 when unknown)"""
+        ns = self._as_ns(values)
+        starts = self._state['starts']
+        codes = np.searchsorted(starts, ns, side='right') - 1
+        codes[(ns == self._NAT) | (codes >= len(starts) - 1)] = -1
+        return codes.astype(np.int32)
+
+    def assign(self, values):
+        """Ordered Categorical of period labels, 'Unknown' outside the calendar"""
+        codes = self.period_codes(values)
+        categories = self.categories
+        codes[codes < 0] = len(categories) - 1
+        return pd.Categorical.from_codes(codes, categories=categories, ordered=True)
+
+    def fiscal_weeks(self, values):
+        """(fiscal_year, week) arrays; both are 0 for missing timestamps"""
+        ns = self._as_ns(values)
+        state = self._state
+        year_starts = state['year_starts']
+        index = np.searchsorted(year_starts, ns, side='right') - 1
+        valid = (ns != self._NAT) & (index >= 0) & (index < len(year_starts) - 1)
+        safe_index = np.clip(index, 0, len(year_starts) - 1)
+        years = np.where(valid, state['first_year'] + index, 0).astype(np.int16)
+        weeks = np.where(valid, (ns - year_starts[safe_index]) // (7 * self._DAY_NS) + 1, 0).astype(np.int8)
+        return years, weeks
+
+    def describe(self, label):
+        """Date range of a period label, e.g. 'Dec 29, 2024 - Jan 25, 2025'"""
+        row = self._state['rows'][label]
+        fmt = lambda d: f"{d:%b} {d.day}, {d.year}"
+        return f"{fmt(row.start)} - {fmt(row.end)}"
+
+    def periods_of_years(self, years):
+        """Labels of every period in the given fiscal years, in calendar order"""
+        table = self.table
+        return list(table.loc[table['fiscal_year'].isin(list(years)), 'label'])
+
+    def fiscal_year_of_label(self, label):
+        return self._state['rows'][label].fiscal_year
+
+    def short_labels(self, labels):
+        """Compact axis labels: period numbers, prefixed with the year when several years are shown"""
+        rows = [self._state['rows'][label] for label in labels]
+        if len({row.fiscal_year for row in rows}) <= 1:
+            return [str(row.period) for row in rows]
+        return [f"P{row.period}\n{row.fiscal_year}" for row in rows]
+
+DerivedColumn = namedtuple('DerivedColumn', ['name', 'inputs', 'compute'])
+
+class DerivedColumnRegistry:                            #Derived features declared with their inputs, materialized once
+    """Period, FiscalWeek, Month, Hour, DayOfWeek, Shift, Consolidated_Line and Category.
+
+    Each derived column declares the columns it is computed from (cleaned
+    columns or earlier derived ones) and is stored as a compact typed column:
+    categoricals, or nullable Int8 for Hour. materialize() only fills in:
+    it computes the columns a frame lacks, and those derived from them (Shift
+    when Hour is rebuilt), and leaves every other column as stored. Input
+    values are not fingerprinted, so code that changes an input column in
+    place must drop the columns derived from it. Appended rows get theirs
+    before concat_cleaned(). Consumers read the columns, never recompute them.
+    """
+    def __init__(self, calendar=None, classifier=None, shifts=SHIFT_SCHEDULE):
+        self.calendar = calendar if calendar is not None else PepsiPeriodCalendar()
+        self.classifier = classifier if classifier is not None else RejectReasonClassifier()
+        self.shifts = shifts
+        self.columns = OrderedDict()
+        self.register('Consolidated_Line', ['Source'], consolidate_sources)
+        self.register('Category', ['Reject reason'], self.classifier.classify)
+        self.register('Period', ['Reject datetime'], self.calendar.assign)
+        self.register('FiscalWeek', ['Reject datetime'], self.fiscal_week)
+        self.register('Month', ['Reject datetime'], self.month)
+        self.register('Hour', ['Reject datetime'], self.hour)
+        self.register('DayOfWeek', ['Reject datetime'], self.day_of_week)
+        self.register('Shift', ['Hour'], self.shift)
+
+    def register(self, name, inputs, compute):
+        """Declare a derived column computed as compute(*input Series); inputs must already be registered or cleaned columns"""
+        self.columns[name] = DerivedColumn(name, tuple(inputs), compute)
+
+    def missing(self, df):
+        """Derived columns df lacks (or that read one of those) and has the inputs for, in build order"""
+        available, names = set(df.columns), []
+        for name, column in self.columns.items():
+            if (name not in available or set(names).intersection(column.inputs)) and available.issuperset(column.inputs):
+                names.append(name)
+                available.add(name)
+        return names
+
+    def materialize(self, df, names=None):
+        """Add the missing() derived columns (or recompute names) to df in place; returns df"""
+        for name in self.missing(df) if names is None else names:
+            column = self.columns[name]
+            df[name] = column.compute(*(df[input_name] for input_name in column.inputs))
+        return df
+
+    def fiscal_week(self, times):
+        """Ordered categorical such as 'FY2025 W07'"""
+        years, weeks = self.calendar.fiscal_weeks(times)
+        keys = years.astype(np.int32) * 100 + weeks
+        codes, uniques = pd.factorize(np.where(keys > 0, keys, -1), sort=True, use_na_sentinel=True)
+        if len(uniques) and uniques[0] == -1:
+            codes, uniques = codes - 1, uniques[1:]  # -1 (no week) becomes the missing code
+        labels = [f"FY{key // 100} W{key % 100:02d}" for key in uniques]
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+    @staticmethod
+    def month(times):
+        return pd.Categorical(pd.to_datetime(times, errors='coerce').dt.to_period('M'))
+
+    @staticmethod
+    def hour(times):
+        return pd.to_datetime(times, errors='coerce').dt.hour.astype('Int8')
+
+    @staticmethod
+    def day_of_week(times):
+        days = pd.to_datetime(times, errors='coerce').dt.dayofweek.to_numpy(dtype=float, na_value=np.nan)
+        codes = np.where(np.isnan(days), -1, days).astype(np.int8)
+        return pd.Categorical.from_codes(codes, categories=DAY_NAMES, ordered=True)
+
+    def shift(self, hours):
+        """Shift of each hour from the shift schedule (missing when the hour is)"""
+        starts = sorted((start, code) for code, (_, start) in enumerate(self.shifts))
+        lookup = np.empty(25, dtype=np.int8)
+        for hour in range(24):
+            before = [code for start, code in starts if start <= hour]
+            lookup[hour] = before[-1] if before else starts[-1][1]  # Before the first start: the overnight shift
+        lookup[24] = -1
+        codes = lookup[hours.fillna(24).to_numpy(dtype=np.int64)]
+        return pd.Categorical.from_codes(codes, categories=[name for name, _ in self.shifts])
+
+class FilterBitmapIndex:                                #Packed-bit row index per filter value
+    """Row selection structures for the filter columns, built once per dataset.
+
+    Low-cardinality columns (Period, Source) keep one packed bitmap per
+    distinct value: select() ORs the bitmaps of the checked values within a
+    column and ANDs the columns together. Columns with more than
+    BITMAP_MAX_VALUES values (Sku) keep only their row codes and select
+    through a per-value lookup table, so their cost stays O(rows) however
+    many values there are.
+    """
+    BITMAP_MAX_VALUES = 64
+
+    def __init__(self, df, columns=('Period', 'Source', 'Sku')):
+        self.row_count = len(df)
+        self.values = {}
+        self.positions = {}
+        self.bitmaps = {}
+        self.codes = {}  # Row codes of the columns without bitmaps
+        for column in columns:
+            if column in df.columns:
+                self._index_column(column, df[column])
+
+    def _index_column(self, column, series):
+        # Observed values only; missing rows are selected as MISSING_LABEL
+        codes, values = labelled_codes(series, observed=True)
+        values = list(values)
+        self.values[column] = values
+        self.positions[column] = {value: code for code, value in enumerate(values)}
+        if len(values) > self.BITMAP_MAX_VALUES:
+            self.codes[column] = codes.astype(np.int32)
+            return
+        bitmaps = np.empty((len(values), (self.row_count + 7) // 8), dtype=np.uint8)
+        for code in range(len(values)):
+            bitmaps[code] = np.packbits(codes == code)
+        self.bitmaps[column] = bitmaps
+
+    def _chosen(self, column, selected):
+        """Boolean per value of column for the selected ones, or None when all are selected"""
+        positions = self.positions[column]
+        chosen = np.zeros(len(positions), dtype=bool)
+        for value in selected:
+            code = positions.get(value)
+            if code is not None:
+                chosen[code] = True
+        return None if chosen.all() else chosen
+
+    def _column_bits(self, column, chosen):
+        bitmaps = self.bitmaps[column]
+        # OR whichever side is smaller; the complement covers "everything but a few"
+        if chosen.sum() * 2 <= len(chosen):
+            if not chosen.any():
+                return np.zeros(bitmaps.shape[1], dtype=np.uint8)
+            return np.bitwise_or.reduce(bitmaps[chosen], axis=0)
+        return np.invert(np.bitwise_or.reduce(bitmaps[~chosen], axis=0))
+
+    def normalize(self, selections):
+        """Canonical form of {column: selected values}: ((column, values in index order), ...).
+
+        Columns whose selection is empty or covers every value filter nothing and
+        are dropped, so equivalent filter states normalize to the same tuple.
+        """
+        normalized = []
+        for column, selected in sorted(dict(selections).items()):
+            if column not in self.positions or not selected:
+                continue
+            positions = self.positions[column]
+            codes = sorted({positions[value] for value in selected if value in positions})
+            if len(codes) == len(positions):
+                continue
+            if codes:
+                normalized.append((column, tuple(self.values[column][code] for code in codes)))
+            else:
+                normalized.append((column, tuple(sorted(selected, key=str))))  # Matches no rows
+        return tuple(normalized)
+
+    def select(self, selections):
+        """Boolean row mask for {column: selected values}, or None when nothing is filtered out.
+
+        An empty selection leaves that column unfiltered (same as no checkbox checked).
+        """
+        packed, mask = None, None
+        for column, selected in selections.items():
+            if column not in self.positions or not selected:
+                continue
+            chosen = self._chosen(column, selected)
+            if chosen is None:
+                continue
+            if column in self.codes:
+                rows = chosen[self.codes[column]]
+                mask = rows if mask is None else np.logical_and(mask, rows, out=mask)
+                continue
+            column_bits = self._column_bits(column, chosen)
+            packed = column_bits if packed is None else np.bitwise_and(packed, column_bits, out=packed)
+        if packed is not None:
+            rows = np.unpackbits(packed, count=self.row_count).view(bool)
+            mask = rows if mask is None else np.logical_and(mask, rows, out=mask)
+        return mask
+
+class FilteredRows:                                     #Read-only row selection over the engine's frame
+    """The rows a filter keeps, as positions into the shared cleaned frame.
+
+    Filtering copies no columns: column() gathers one column's selected values
+    when it is read, and the Analysis table indexes the base arrays through
+    rows directly. The base frame is never written to.
+    """
+    def __init__(self, data, rows=None):
+        self.data = data
+        self.rows = rows  # int64 positions into data, None for every row
+
+    def __len__(self):
+        return len(self.data) if self.rows is None else len(self.rows)
+
+    @property
+    def columns(self):
+        return self.data.columns
+
+    def column(self, name):
+        """Values of one column in the selected rows"""
+        values = self.data[name]
+        return values if self.rows is None else values.take(self.rows)
+
+    @property
+    def nbytes(self):
+        return 0 if self.rows is None else int(self.rows.nbytes)
+
+class RejectionCube:                                    #Sparse reject counts over the chart dimensions
+    """Reject count for every observed combination of CUBE_DIMENSIONS values.
+
+    Built once per dataset at ingest. Charts narrow it with where() and sum it
+    with counts(), so redraw cost depends on the number of occupied cells, not
+    rows. Each cell also keeps its first/last reject time for the date range.
+    """
+    NO_FIRST = 2 ** 63 - 1  # np.iinfo(np.int64).max
+    NO_LAST = -2 ** 63  # np.iinfo(np.int64).min
+
+    def __init__(self, labels, codes, cell_counts, first, last):
+        self.labels = labels  # {dimension: pd.Index of values}
+        self.codes = codes  # {dimension: label position per cell}
+        self.cell_counts = cell_counts
+        self.first = first  # int64 ns, NO_FIRST when no valid time
+        self.last = last
+        self.dimensions = list(labels)
+
+    @classmethod
+    def from_frame(cls, df):
+        times = pd.to_datetime(df['Reject datetime'], errors='coerce') if 'Reject datetime' in df.columns \
+            else pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        labels, codes = {}, {}
+        for dimension in CUBE_DIMENSIONS:
+            values = df.get(dimension)  # Hour, DayOfWeek, Period, ... come from DerivedColumnRegistry
+            if values is None:
+                continue
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Keep the category order (calendar order for Period); missing values count as MISSING_LABEL
+                dimension_codes, dimension_labels = labelled_codes(values)
+            else:
+                dimension_codes, uniques = pd.factorize(values, use_na_sentinel=False)
+                dimension_labels = pd.Index(uniques)
+            labels[dimension], codes[dimension] = dimension_labels, dimension_codes
+        
+        ns = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        valid = ~np.isnat(times.to_numpy(dtype='datetime64[ns]'))
+        first = np.where(valid, ns, cls.NO_FIRST)
+        last = np.where(valid, ns, cls.NO_LAST)
+        return cls._group(labels, codes, np.ones(len(df), dtype=np.int64), first, last)
+
+    @classmethod
+    def combine(cls, cubes):
+        """Merge cubes of disjoint row sets (incremental appends) into one"""
+        labels, codes = {}, {}
+        for dimension in cubes[0].dimensions:
+            merged = cubes[0].labels[dimension]
+            for cube in cubes[1:]:
+                merged = merged.append(cube.labels[dimension])
+            labels[dimension] = merged.unique()
+            codes[dimension] = np.concatenate([labels[dimension].get_indexer(cube.labels[dimension])[cube.codes[dimension]]
+                                               for cube in cubes])
+        return cls._group(labels, codes, np.concatenate([cube.cell_counts for cube in cubes]),
+                          np.concatenate([cube.first for cube in cubes]), np.concatenate([cube.last for cube in cubes]))
+
+    @classmethod
+    def _group(cls, labels, codes, cell_counts, first, last):
+        dimensions = list(labels)
+        if len(cell_counts) == 0:
+            return cls(labels, {d: np.zeros(0, dtype=np.int64) for d in dimensions}, cell_counts, first, last)
+        
+        # One integer key per row/cell, then a sort-based group-by on it
+        sizes = [max(len(labels[d]), 1) for d in dimensions]
+        keys = np.ravel_multi_index([codes[d] for d in dimensions], sizes)
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        cell_codes = np.unravel_index(keys[starts], sizes)
+        return cls(labels, dict(zip(dimensions, cell_codes)),
+                   np.add.reduceat(cell_counts[order], starts),
+                   np.minimum.reduceat(first[order], starts),
+                   np.maximum.reduceat(last[order], starts))
+
+    def where(self, selections):
+        """Cells whose values are in the selections ({dimension: values}); an empty selection leaves a dimension unfiltered"""
+        keep = None
+        for dimension, selected in selections.items():
+            if dimension not in self.codes or not selected:
+                continue
+            allowed = self.labels[dimension].isin(list(selected))
+            if allowed.all():
+                continue
+            dimension_keep = allowed[self.codes[dimension]]
+            keep = dimension_keep if keep is None else keep & dimension_keep
+        if keep is None:
+            return self
+        return RejectionCube(self.labels, {d: c[keep] for d, c in self.codes.items()},
+                             self.cell_counts[keep], self.first[keep], self.last[keep])
+
+    def counts(self, dimension, sort=True):
+        """Reject count per value of a dimension, like value_counts (empty and NaN values dropped)"""
+        dimension_labels = self.labels[dimension]
+        totals = np.bincount(self.codes[dimension], weights=self.cell_counts,
+                             minlength=len(dimension_labels)).astype(np.int64)
+        series = pd.Series(totals, index=dimension_labels)
+        series = series[(totals > 0) & dimension_labels.notna()]
+        return series.sort_values(ascending=False, kind='stable') if sort else series
+
+    def total(self):
+        return int(self.cell_counts.sum())
+
+    @property
+    def nbytes(self):
+        return int(sum(c.nbytes for c in self.codes.values()) + self.cell_counts.nbytes + self.first.nbytes + self.last.nbytes)
+
+    def date_range(self):
+        """(first, last) reject Timestamp of the cells, or (None, None) when there are no valid times"""
+        if len(self.cell_counts) == 0 or self.first.min() == self.NO_FIRST:
+            return None, None
+        return pd.Timestamp(self.first.min()), pd.Timestamp(self.last.max())
+
+class RejectAnalyticsEngine:                            #GUI-free metrics behind every dashboard tab
+    """Computes every metric and series the dashboard tabs draw, without Qt or matplotlib.
+
+    Built from a cleaned frame (clean_data output). filter() resolves a filter
+    specification such as {'Period': [...], 'Source': [...], 'Sku': [...]} to
+    the filtered rows and count cube; metrics() returns one view's numbers from
+    a cube and evaluate() returns every view's.
+    """
+    VIEWS = ('dashboard', 'trends', 'production', 'production_lines', 'categories',
+             'dimensional', 'tag_tracking', 'time', 'products', 'rejection_rates')
+    FILTER_COLUMNS = ('Period', 'Source', 'Sku')
+    DAY_ORDER = DAY_NAMES
+
+    def __init__(self, data, cube=None, calendar=None, production_totals=PRODUCTION_TOTALS, derived=None):
+        self.calendar = calendar if calendar is not None else PepsiPeriodCalendar()
+        self.derived = derived if derived is not None else DerivedColumnRegistry(self.calendar)
+        if self.derived.missing(data):
+            data = self.derived.materialize(data.copy(deep=False))
+        self.data = data
+        self.cube = cube if cube is not None else RejectionCube.from_frame(data)
+        self.index = FilterBitmapIndex(data, self.FILTER_COLUMNS)
+        self.production_totals = production_totals
+
+    def normalize(self, selections):
+        return self.index.normalize(selections or {})
+
+    def filter(self, selections=None):
+        """(FilteredRows, filtered cube) for a filter specification"""
+        selections = dict(self.normalize(selections))
+        mask = self.index.select(selections)
+        rows = FilteredRows(self.data, None if mask is None else np.flatnonzero(mask))
+        return rows, self.cube.where(selections)
+
+    def metrics(self, view, cube=None, view_selections=()):
+        """Numbers drawn by one view, from the full cube or a filtered one.
+
+        view_selections is the view's own normalized filter; it narrows the
+        given cube further, so the result is the intersection of both filters.
+        """
+        cube = self.cube if cube is None else cube
+        if view_selections:
+            cube = cube.where(dict(view_selections))
+        return getattr(self, f'{view}_metrics')(cube)
+
+    def evaluate(self, selections=None, views=VIEWS):
+        """Metrics of the given views under a filter specification"""
+        _, cube = self.filter(selections)
+        return {view: self.metrics(view, cube) for view in views}
+
+    def dashboard_metrics(self, cube):
+        reason_counts = cube.counts('Reject reason') if 'Reject reason' in cube.dimensions else pd.Series(dtype=np.int64)
+        return {'total_rejections': cube.total(),
+                'top_reason': reason_counts.index[0] if len(reason_counts) > 0 else None,
+                'date_range': cube.date_range()}
+
+    def trends_metrics(self, cube, top_reasons=5):
+        metrics = {}
+        if 'Reject reason' in cube.dimensions:
+            reason_counts = cube.counts('Reject reason')
+            metrics['top_reasons'] = reason_counts.head(top_reasons)
+            metrics['other_count'] = int(reason_counts.iloc[top_reasons:].sum())
+        if 'Period' in cube.dimensions:
+            # One reject per row, so counts equal quantities; categorical order is calendar order
+            period_counts = cube.counts('Period', sort=False).drop(PepsiPeriodCalendar.UNKNOWN, errors='ignore')
+            metrics['periods'] = [str(period) for period in period_counts.index]
+            metrics['period_labels'] = self.calendar.short_labels(metrics['periods'])
+            metrics['period_counts'] = list(period_counts.values)
+        return metrics
+
+    def production_metrics(self, cube, top_products=8):
+        metrics = {}
+        if 'Source' in cube.dimensions:
+            metrics['line_counts'] = cube.counts('Source')
+        if 'Sku' in cube.dimensions:
+            metrics['product_counts'] = cube.counts('Sku').head(top_products)
+        return metrics
+
+    def production_lines_metrics(self, cube):
+        if 'Consolidated_Line' not in cube.dimensions:
+            return {}
+        consolidated_counts = cube.counts('Consolidated_Line')
+        individual_lines = [(line, cube.where({'Consolidated_Line': [line]}).counts('Source'))
+                            for line in consolidated_counts.index]
+        return {'consolidated_counts': consolidated_counts, 'individual_lines': individual_lines}
+
+    def categories_metrics(self, cube, top_reasons=8):
+        if 'Category' not in cube.dimensions:
+            return {'category_counts': {DIMENSIONAL_CATEGORY: 0, TAG_TRACKING_CATEGORY: 0},
+                    'top_reasons': [], 'uncategorized': []}
+        issues = {category: list(cube.where({'Category': [category]}).counts('Reject reason').items())
+                  for category in (DIMENSIONAL_CATEGORY, TAG_TRACKING_CATEGORY, UNCATEGORIZED_CATEGORY)}
+        categorized = sorted(issues[DIMENSIONAL_CATEGORY] + issues[TAG_TRACKING_CATEGORY], key=itemgetter(1), reverse=True)
+        return {'category_counts': {category: sum(count for _, count in issues[category])
+                                    for category in (DIMENSIONAL_CATEGORY, TAG_TRACKING_CATEGORY)},
+                'top_reasons': categorized[:top_reasons],
+                'uncategorized': issues[UNCATEGORIZED_CATEGORY]}
+
+    def category_rejects_metrics(self, cube, category, top_reasons=10):
+        if 'Category' not in cube.dimensions:
+            return {'total': 0, 'reason_counts': pd.Series(dtype=np.int64), 'line_counts': pd.Series(dtype=np.int64)}
+        category_cube = cube.where({'Category': [category]})
+        return {'total': category_cube.total(),
+                'reason_counts': category_cube.counts('Reject reason').head(top_reasons),
+                'line_counts': category_cube.counts('Source')}
+
+    def dimensional_metrics(self, cube):
+        return self.category_rejects_metrics(cube, DIMENSIONAL_CATEGORY)
+
+    def tag_tracking_metrics(self, cube):
+        return self.category_rejects_metrics(cube, TAG_TRACKING_CATEGORY)
+
+    def time_metrics(self, cube):
+        if 'Hour' not in cube.dimensions:
+            return {}
+        hourly_counts = cube.counts('Hour').sort_index()
+        if len(hourly_counts) == 0:
+            return {}
+        dow_counts = cube.counts('DayOfWeek')
+        dow_counts = dow_counts.reindex([day for day in self.DAY_ORDER if day in dow_counts.index])
+        return {'hourly_counts': hourly_counts, 'dow_counts': dow_counts}
+
+    def products_metrics(self, cube, top_products=20):
+        if 'Sku' not in cube.dimensions:
+            return {}
+        sku_counts = cube.counts('Sku')
+        total_rejections = int(sku_counts.sum())
+        top_counts = sku_counts.head(top_products)
+        return {'top_products': top_products, 'sku_counts': top_counts,
+                'percentage_top': top_counts.sum() / total_rejections * 100 if total_rejections else 0.0}
+
+    def rejection_rates_metrics(self, cube):
+        if 'Consolidated_Line' not in cube.dimensions:
+            return {}
+        consolidated_rejections = cube.counts('Consolidated_Line').to_dict()
+        
+        # Every production line, including those with 0 rejections
+        lines = {}
+        for line, production_total in self.production_totals.items():
+            rejection_count = consolidated_rejections.get(line, 0)
+            lines[line] = {'rejections': rejection_count, 'production': production_total,
+                           'rate': rejection_count / production_total * 100}
+        total_rejections = cube.total()
+        total_production = sum(self.production_totals.values())
+        return {'lines': lines, 'total_rejections': total_rejections, 'total_production': total_production,
+                'overall_rate': total_rejections / total_production * 100}
+
+class IngestCancelled(Exception):
+    """Raised inside the ingestion pipeline when the user cancels a load"""
+
+class InvalidExportError(ValueError):
+    """Raised when a workbook is not a usable E80 rejected units export"""
+
+class RejectPipeline:                                   #GUI-free clean and analyze steps for E80 exports
+    """clean_data() and perform_analysis() as run by the window's ingest worker and the batch CLI.
+
+    Holds the SKU master, period calendar, reason classifier and derived
+    column registry those steps use; cache_key() identifies its cleaned output
+    in the ParsedWorkbookCache.
+    """
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else ParsedWorkbookCache()
+        self.sku_master = SkuMasterService(cache=self.cache)
+        self.period_calendar = PepsiPeriodCalendar()
+        self.reason_classifier = RejectReasonClassifier()
+        self.derived_columns = DerivedColumnRegistry(self.period_calendar, self.reason_classifier)
+        
+    def cache_key(self):
+        """Cache key component for everything besides the workbook that shapes the cleaned data"""
+        return f"v{CLEANING_PIPELINE_VERSION}-{self.sku_master.fingerprint()}"
         
-        self.setup_ui()
-        self.apply_theme()
+    def clean_data(self, df):
+        """Clean and standardize the data into compact typed columns.
+
+        Timestamps stay datetime64 and text columns become categoricals.
+        Missing values stay missing (shown as MISSING_LABEL) instead of being
+        filled with a string.
+        """
+        # Convert date column to datetime (E80 format uses 'Reject datetime')
+        if 'Reject datetime' in df.columns:
+            df['Reject datetime'] = pd.to_datetime(df['Reject datetime'], errors='coerce')
+            
+        # Standardize text columns (E80 format), stripped once per distinct value
+        for col in E80_TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = text_categorical(df[col])
         
-    def setup_ui(self):
-        self.setWindowTitle("Gaelen Collins - E80 Rejected Units Analyzer")
-        self.setGeometry(100, 100, 1600, 1000)
+        # Replace SKU numbers with product descriptions
+        df = self.replace_skus_with_descriptions(df)
         
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        # Create quantity column (each row represents 1 rejected unit)
+        df['Quantity'] = np.ones(len(df), dtype=np.int8)
         
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
+        return df
         
-        # Header
-        self.create_header(main_layout)
+    def replace_skus_with_descriptions(self, df):
+        """Replace SKU numbers with product descriptions from the master file"""
+        if 'Sku' not in df.columns:
+            return df
+            
+        self.sku_master.last_stats = {}
+        try:
+            df['Sku'] = self.sku_master.resolve(df['Sku'])
+        except Exception as e:
+            # Continue with the original SKU numbers
+            self.sku_master.last_stats = {'error': str(e)}
+            
+        return df
         
-        # Global Filters Section (persistent across all tabs)
-        self.create_global_filters(main_layout)
+    def store_cleaned(self, file_hash, sheet_name, pipeline_key, df):
+        """Cache a clean_data() frame, unless its SKU lookup failed so the next load retries it"""
+        if 'error' in self.sku_master.last_stats:
+            print(f"Warning: Not caching {sheet_name}: SKU lookup failed ({self.sku_master.last_stats['error']})")
+            return
+        self.cache.store(file_hash, sheet_name, pipeline_key, df)
         
-        # Tab widget
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setTabPosition(QTabWidget.North)
-        main_layout.addWidget(self.tab_widget)
+    def build_engine(self, df, analysis):
+        """Analytics engine (filter index included) over a perform_analysis() result"""
+        return RejectAnalyticsEngine(df, cube=analysis['cube'], calendar=self.period_calendar, derived=self.derived_columns)
         
-        # Create all the analysis tabs
-        self.create_upload_tab()
-        self.create_dashboard_tab()
-        self.create_trends_tab()
-        self.create_production_analysis_tab()
-        self.create_production_lines_tab()
-        self.create_advanced_tracking_tab()
-        self.create_dimensional_rejects_tab()
-        self.create_tag_tracking_rejects_tab()
-        self.create_time_analysis_tab()
-        self.create_sku_analysis_tab()
-        self.create_rejection_rate_tab()
+    def perform_analysis(self, df):
+        """Perform comprehensive analysis of rejected units"""
+        analysis = {}
         
-        central_widget.setLayout(main_layout)
+        # Period, Month, Hour, Category, ... computed once for this dataset
+        self.derived_columns.materialize(df)
+        
+        # Basic statistics
+        analysis['total_rejections'] = len(df)
+        analysis['total_quantity'] = int(df['Quantity'].sum()) if 'Quantity' in df.columns else 0
+        analysis['date_range'] = (None, None)
+        if 'Reject datetime' in df.columns and df['Reject datetime'].notna().any():
+            analysis['date_range'] = (df['Reject datetime'].min().date(), df['Reject datetime'].max().date())
+            
+        # Value counts of a column, missing values counted under MISSING_LABEL
+        value_counts = lambda column: {MISSING_LABEL if pd.isna(value) else value: count
+                                       for value, count in df[column].value_counts(dropna=False).items() if count}
+        
+        # Rejection reasons analysis (E80 format uses 'Reject reason')
+        if 'Reject reason' in df.columns:
+            analysis['rejection_reasons'] = value_counts('Reject reason')
+            
+        # Source/Line analysis (E80 format uses 'Source')
+        if 'Source' in df.columns:
+            analysis['line_breakdown'] = value_counts('Source')
+            
+        # Time-based analysis - convert to periods
+        if 'Reject datetime' in df.columns:
+            analysis['monthly_trends'] = df.groupby('Month', observed=True)['Quantity'].sum().to_dict()
+            
+            # Period analysis based on Pepsi's period calendar
+            analysis['period_trends'] = df.groupby('Period', observed=True)['Quantity'].sum().to_dict()
+        
+        # Sparse count cube that every chart is drawn from
+        analysis['cube'] = RejectionCube.from_frame(df)
+            
+        # Product analysis (E80 format uses 'Sku')
+        if 'Sku' in df.columns:
+            analysis['product_breakdown'] = value_counts('Sku')
+            
+        return analysis
+
+# RejectPipeline of a process running ingest_export() tasks, built on its first task
+_EXPORT_PIPELINE = None
+
+def ingest_export(path, cache_dir=CACHE_DIR):
+    """Process pool task: read and clean one export through the parsed-workbook cache.
+
+    Returns {'path', 'sheet', 'data', 'rows', 'seconds', 'from_cache', 'sku_stats'}.
+    """
+    global _EXPORT_PIPELINE
+    if _EXPORT_PIPELINE is None or _EXPORT_PIPELINE.cache.cache_dir != cache_dir:
+        _EXPORT_PIPELINE = RejectPipeline(ParsedWorkbookCache(cache_dir))
+    pipeline = _EXPORT_PIPELINE
+    started = time.perf_counter()
+    file_hash = pipeline.cache.file_hash(path)
+    cached = pipeline.cache.find(file_hash, pipeline.cache_key())
+    sku_stats = {}
+    if cached is not None:
+        data_sheet, df = cached
+    else:
+        data_sheet, df = read_e80_workbook(path)
+        try:
+            validate_e80_export(data_sheet, df)
+        except InvalidExportError as e:
+            raise InvalidExportError(f"{os.path.basename(path)}: {e}")
+        df = pipeline.clean_data(df)
+        sku_stats = pipeline.sku_master.last_stats
+        try:
+            pipeline.store_cleaned(file_hash, data_sheet, pipeline.cache_key(), df)
+        except Exception as e:
+            print(f"Warning: Could not write cache entry: {e}")
+    return {'path': path, 'sheet': data_sheet, 'data': df, 'rows': len(df),
+            'seconds': time.perf_counter() - started, 'from_cache': cached is not None, 'sku_stats': sku_stats}
+
+def describe_export_throughput(result):
+    """One line with an ingest_export() result's rows and rows/second"""
+    seconds = max(result['seconds'], 1e-9)
+    return (f"{os.path.basename(result['path'])}: {result['rows']:,} rows in {result['seconds']:.2f}s "
+            f"({result['rows'] / seconds:,.0f} rows/s{', cached' if result['from_cache'] else ''})")
+
+class IngestWorker(QObject):                            #Loads, cleans and analyzes an export off the GUI thread
+    """Runs the ingestion pipeline on a QThread and reports back through signals.
+
+    The workbook is streamed in row batches so progress can be reported and a
+    cancel request is honoured between batches.
+    """
+    progress = pyqtSignal(int, str)
+    loaded = pyqtSignal(object)
+    invalid = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, path, cache, pipeline_key, clean, analyze, batch_size=2000, base=None, store=None,
+                 build_engine=None):
+        super().__init__()
+        self.path = path
+        self.base = base  # (data, analysis) to append to, or None for a full load
+        self.cache = cache
+        self.pipeline_key = pipeline_key
+        self.clean = clean
+        self.store = store or cache.store  # (file_hash, sheet, pipeline_key, df), e.g. RejectPipeline.store_cleaned
+        self.build_engine = build_engine  # (data, analysis) -> RejectAnalyticsEngine, e.g. RejectPipeline.build_engine
+        self.analyze = analyze
+        self.batch_size = batch_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise IngestCancelled()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.ingest()
+        except IngestCancelled:
+            self.cancelled.emit()
+        except InvalidExportError as e:
+            self.invalid.emit(str(e))
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.loaded.emit(result)
+
+    def ingest(self):
+        """Load, clean and analyze the workbook; returns a result dict"""
+        cutoff = None
+        if self.base is not None:
+            cutoff = pd.to_datetime(self.base[0]['Reject datetime'], errors='coerce').max()
+            if pd.isna(cutoff):
+                cutoff = None
+        data_sheet, df, from_cache = self.load(cutoff)
+        
+        if self.base is None:
+            self.progress.emit(90, f"Analyzing {len(df):,} rows...")
+            analysis = self.analyze(df)
+            self._check_cancelled()
+            result = {'data': df, 'analysis': analysis, 'sheet': data_sheet, 'from_cache': from_cache}
+        else:
+            # Incremental mode: analyze only the new rows and fold them into the base results
+            base_data, base_analysis = self.base
+            new_rows = len(df)
+            if cutoff is not None:
+                df = drop_overlapping_rows(base_data, df, cutoff)
+            self.progress.emit(90, f"Analyzing {len(df):,} new rows...")
+            delta_analysis = self.analyze(df)
+            self._check_cancelled()
+            result = {'data': concat_cleaned([base_data, df]), 'analysis': merge_analysis(base_analysis, delta_analysis),
+                      'sheet': data_sheet, 'from_cache': from_cache, 'appended': len(df), 'duplicates': new_rows - len(df)}
+        
+        # The filter index is built here too, so the GUI thread only attaches the engine
+        if self.build_engine is not None:
+            self.progress.emit(96, f"Indexing {len(result['data']):,} rows...")
+            result['engine'] = self.build_engine(result['data'], result['analysis'])
+            self._check_cancelled()
+        self.progress.emit(100, "Rendering charts...")
+        return result
+        
+    def load(self, cutoff=None):
+        """(sheet, cleaned frame, from_cache) for the export, through the cache; only rows from cutoff on when given"""
+        name = os.path.basename(self.path)
+        self.progress.emit(0, f"Checking cache for {name}...")
+        file_hash = self.cache.file_hash(self.path)
+        cached = self.cache.find(file_hash, self.pipeline_key)
+        self._check_cancelled()
+        
+        if cached is not None:
+            data_sheet, df = cached
+            return data_sheet, df if cutoff is None else rows_since(df, cutoff), True
+        
+        # Reading skips older rows early; rows_since() then applies the same cutoff as a cache hit
+        data_sheet, df = self.read_workbook(name, since=cutoff)
+        self.progress.emit(82, f"Cleaning {len(df):,} rows...")
+        df = self.clean(df)
+        self._check_cancelled()
+        if cutoff is not None:
+            return data_sheet, rows_since(df, cutoff), False
+        try:
+            self.store(file_hash, data_sheet, self.pipeline_key, df)
+        except Exception as e:
+            print(f"Warning: Could not write cache entry: {e}")
+        return data_sheet, df, False
+        
+    def read_workbook(self, name, since=None):
+        """Stream the export in batches, reporting progress; returns (sheet, raw frame)"""
+        data_sheet, batches = None, []
+        for data_sheet, rows_read, total_rows, batch in iter_e80_batches(self.path, batch_size=self.batch_size, since=since):
+            batches.append(batch)
+            self._check_cancelled()
+            if total_rows:
+                percent = 5 + int(75 * min(rows_read, total_rows) / total_rows)
+                self.progress.emit(percent, f"Reading {name}: {rows_read:,} of {total_rows:,} rows")
+            else:
+                self.progress.emit(-1, f"Reading {name}: {rows_read:,} rows")
+        
+        df = pd.concat(batches, ignore_index=True) if data_sheet is not None else None
+        validate_e80_export(data_sheet, df)
+        return data_sheet, df
+
+class MultiFileIngestWorker(IngestWorker):              #Parses several exports in a process pool and merges them
+    """Loads several exports (e.g. one per line or date range) as one dataset.
+
+    Each workbook is read and cleaned by ingest_export() in its own process,
+    with the same clean_data() semantics and cache as a single load. The
+    frames are then merged by merge_exports(), dropping rows already present
+    in an earlier export, and analyzed (or appended) like a single export.
+    """
+    def __init__(self, paths, cache, pipeline_key, clean, analyze, base=None, max_workers=None, build_engine=None):
+        super().__init__(paths[0], cache, pipeline_key, clean, analyze, base=base, build_engine=build_engine)
+        self.paths = list(paths)
+        self.max_workers = max_workers or min(len(self.paths), os.cpu_count() or 1)
+        self.file_stats = []  # One ingest_export() result (without its frame) per export, in completion order
+        self.merged_duplicates = 0
+        
+    def ingest(self):
+        result = super().ingest()
+        result['files'] = sorted(self.file_stats, key=lambda f: self.paths.index(f['path']))
+        result['merged_duplicates'] = self.merged_duplicates
+        return result
+        
+    def load(self, cutoff=None):
+        results = self.parse_exports()
+        frames = [results[path].pop('data') for path in self.paths]
+        if cutoff is not None:
+            frames = [rows_since(frame, cutoff) for frame in frames]
+        self.progress.emit(86, f"Merging {sum(len(frame) for frame in frames):,} rows from {len(frames)} exports...")
+        df, self.merged_duplicates = merge_exports(frames)
+        self._check_cancelled()
+        data_sheet = ', '.join(dict.fromkeys(results[path]['sheet'] for path in self.paths))
+        return data_sheet, df, all(results[path]['from_cache'] for path in self.paths)
+        
+    def parse_exports(self):
+        """ingest_export() result per path, run concurrently; reports each export's throughput as it finishes"""
+        self.progress.emit(0, f"Parsing {len(self.paths)} exports in {self.max_workers} processes...")
+        # Spawned, not forked: this process runs Qt and worker threads
+        executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+        results = {}
+        try:
+            futures = {executor.submit(ingest_export, path, self.cache.cache_dir): path for path in self.paths}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                self._check_cancelled()
+                for future in done:
+                    result = future.result()
+                    results[futures[future]] = result
+                    self.file_stats.append({key: value for key, value in result.items() if key != 'data'})
+                    self.progress.emit(5 + int(80 * len(results) / len(self.paths)), describe_export_throughput(result))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+class RefreshScheduler(QObject):                        #Debounces filter changes into one refresh
+    """Coalesces refresh requests that arrive within delay_ms into a single call.
+
+    Bulk check changes (select all, solo) reach it as one request, since
+    FilterListModel.set_checked() emits checkStatesChanged once per call.
+    requested/executed count every request and every refresh that actually ran.
+    """
+    def __init__(self, callback, delay_ms=60, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+        self.requested = 0
+        self.executed = 0
+        self._dirty = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def skipped(self):
+        return self.requested - self.executed - int(self._dirty)
+
+    def pending(self):
+        return self._dirty
+
+    def request(self, *_):
+        """Schedule a refresh (extra signal arguments are ignored)"""
+        self.requested += 1
+        self._dirty = True
+        self._timer.start()  # Restarting the timer pushes the refresh back
+
+    def flush(self):
+        """Run the pending refresh now, if there is one"""
+        self._timer.stop()
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.executed += 1
+        self.callback()
+
+    def cancel(self):
+        self._timer.stop()
+        self._dirty = False
+
+    def stats(self):
+        return {'requested': self.requested, 'executed': self.executed, 'skipped': self.skipped}
+
+# Everything a filter resolution reads; the engine's frame, index and cube are never modified after load.
+# view_selections holds each of the views' own normalized filter, as ((view, selections), ...)
+FilterSnapshot = namedtuple('FilterSnapshot', ['engine', 'selections', 'views', 'view_selections'])
+
+def resolve_filters(snapshot):
+    """Filtered rows, cube and the given views' metrics for a FilterSnapshot (safe to run off the GUI thread)"""
+    filtered_data, filtered_cube = snapshot.engine.filter(dict(snapshot.selections))
+    view_selections = dict(snapshot.view_selections)
+    view_metrics = {view: snapshot.engine.metrics(view, filtered_cube, view_selections.get(view, ()))
+                    for view in snapshot.views}
+    return filtered_data, filtered_cube, view_metrics
+
+def filtered_result_nbytes(result):
+    """Extra memory held by a filtered (rows, cube) pair (the frame itself is shared, not copied)"""
+    filtered_rows, filtered_cube = result
+    return filtered_rows.nbytes + filtered_cube.nbytes
+
+def estimate_nbytes(value):
+    """Rough memory held by a metrics dict (Series, arrays and nested containers)"""
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+def filter_state_key(dataset_version, selections, view=None, view_selections=()):
+    """Canonical hash of a normalized filter state, for AggregateCache"""
+    state = [dataset_version, view,
+             [[column, [str(value) for value in values]] for column, values in selections],
+             [[column, [str(value) for value in values]] for column, values in view_selections]]
+    return hashlib.sha1(json.dumps(state).encode('utf-8')).hexdigest()
+
+class AggregateCache:                                   #Memory-bounded LRU of aggregate results
+    """LRU cache of aggregate results keyed by filter_state_key().
+
+    Each entry is stored with an estimate of the memory it holds on to; least
+    recently used entries are evicted once the total exceeds max_bytes.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (value, nbytes)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes):
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        if nbytes > self.max_bytes:
+            return
+        self.entries[key] = (value, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'entries': len(self.entries), 'bytes': self.total_bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+class AggregationRunner(QObject):                       #Runs aggregation jobs on a worker pool
+    """Runs jobs on a thread pool and hands the latest result back to the GUI thread.
+
+    Each submit() starts a new generation. Jobs of older generations are
+    cancelled if they have not started, and their results are discarded by
+    accept() if they have.
+    """
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, max_workers=2, parent=None):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='aggregate')
+        self.generation = 0
+        self.discarded = 0
+        self._future = None
+
+    def submit(self, job, *args):
+        """Run job(*args) on the pool; returns its generation"""
+        self.generation += 1
+        if self._future is not None and self._future.cancel():
+            self.discarded += 1
+        self._future = self.executor.submit(self._run, self.generation, job, args)
+        return self.generation
+
+    def _run(self, generation, job, args):
+        if generation != self.generation:
+            return  # Superseded while queued
+        try:
+            result = job(*args)
+        except Exception as e:
+            self.failed.emit(generation, str(e))
+        else:
+            self.finished.emit(generation, result)
+
+    def accept(self, generation):
+        """True if a delivered result is still the latest one"""
+        if generation != self.generation:
+            self.discarded += 1
+            return False
+        return True
+
+    def invalidate(self):
+        """Discard whatever is in flight (dataset replaced or cleared)"""
+        self.generation += 1
+
+    def shutdown(self):
+        self.invalidate()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class DashboardCharts:                                  #Chart drawing shared by the window and the batch renderer
+    """Draws every chart tab from its RejectAnalyticsEngine view metrics.
+
+    The host provides theme, a <prefix>_figure and <prefix>_panel (ChartPanel)
+    for each entry of CHARTS, and view_metrics(view) for calls made without
+    metrics. Nothing here touches Qt widgets.
+    """
+    # Engine view -> (figure/panel attribute prefix, drawing method, Figure keyword arguments)
+    CHARTS = {
+        'trends': ('trends', 'update_trends', {'figsize': (12, 6), 'dpi': 100}),
+        'production': ('production', 'update_production_analysis', {'figsize': (12, 8), 'dpi': 100}),
+        'production_lines': ('production_lines', 'update_production_lines', {'figsize': (12, 8), 'dpi': 100}),
+        'categories': ('category', 'update_advanced_tracking', {'figsize': (12, 8), 'dpi': 100}),
+        'dimensional': ('dimensional', 'update_dimensional_rejects', {'figsize': (12, 8), 'dpi': 100}),
+        'tag_tracking': ('tag_tracking', 'update_tag_tracking_rejects', {'figsize': (12, 8), 'dpi': 100}),
+        'time': ('time', 'update_time_analysis', {'figsize': (12, 8), 'dpi': 100}),
+        'products': ('sku', 'update_sku_analysis', {'figsize': (12, 8)}),
+        'rejection_rates': ('rejection', 'update_rejection_rate_analysis', {'figsize': (12, 10)}),
+    }
+    
+    def update_trends(self, metrics=None):
+        metrics = metrics if metrics is not None else self.view_metrics('trends')
+        if metrics is None:
+            return
+        
+        # Top 5 reasons plus everything else
+        top_reasons = metrics.get('top_reasons', pd.Series(dtype=np.int64))
+        pie_labels = list(top_reasons.index)
+        pie_counts = list(top_reasons.values)
+        
+        # Add "Other" slice if there are more than 5 reasons
+        if metrics.get('other_count', 0) > 0:
+            pie_labels.append('One of the other 20 Reasons')
+            pie_counts.append(metrics['other_count'])
+        periods = metrics.get('periods')
+        
+        # Axes and artists are only rebuilt when the number of slices or periods changes
+        panel = self.trends_panel
+        if panel.begin((len(pie_counts), None if periods is None else len(periods))):
+            ax1 = self.trends_figure.add_subplot(1, 2, 1)
+            ax2 = self.trends_figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme for plots
+            self.trends_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            # Plot 1: Rejection reasons pie chart (filtered) with accurate percentages
+            if pie_counts:
+                colors = ['#e74c3c', '#f39c12', '#f1c40f', '#2ecc71', '#3498db', '#9b59b6']
+                panel.artists['reasons'] = PieSlices(ax1, len(pie_counts), colors, color='white', fontweight='bold')
+                ax1.set_title('Top Rejection Reasons', color='white', fontweight='bold', fontsize=16)
+        
+            # Plot 2: Period trends (filtered)
+            if periods is not None:
+                panel.artists['trend'], = ax2.plot(range(len(periods)), [0] * len(periods), marker='o', color='#e74c3c',
+                                                   linewidth=3, markersize=8)
+                ax2.set_title('Period Rejection Trends', color='white', fontweight='bold', fontsize=16)
+                ax2.set_xlabel('Period', color='white', fontsize=12)
+                ax2.set_ylabel('Rejected Quantity', color='white', fontsize=12)
+                ax2.set_xticks(range(len(periods)))
+                ax2.tick_params(axis='x', rotation=0, colors='white')
+                ax2.tick_params(axis='y', colors='white')
+                ax2.grid(True, alpha=0.3, color='white')
+        
+                # Value labels on line plot points
+                panel.artists['trend_labels'] = [ax2.text(i, 0, '', ha='center', va='bottom', color='white', fontweight='bold',
+                                                          fontsize=8, bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
+                                                 for i in range(len(periods))]
+        
+            # Style all axes
+            for ax in [ax1, ax2]:
+                ax.tick_params(colors='white')
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        artists = panel.artists
+        
+        if pie_counts:
+            artists['reasons'].update(pie_counts, pie_labels)
+        
+        if periods is not None:
+            # Periods in calendar order, with clean labels (just the numbers, plus the year across years)
+            quantities = metrics['period_counts']
+            max_quantity = max(quantities) if quantities else 0
+            artists['trend'].set_ydata(quantities)
+            for i, (label, quantity) in enumerate(zip(artists['trend_labels'], quantities)):
+                label.set_position((i, quantity + max_quantity * 0.02))
+                label.set_text(f'{int(quantity)}')
+            ax2 = artists['trend'].axes
+            ax2.set_xticklabels(metrics['period_labels'])
+            ax2.relim()
+            ax2.autoscale_view()
+        
+        panel.draw(labels=(tuple(pie_labels), tuple(metrics.get('period_labels', ()))))
+        
+    def update_production_analysis(self, metrics=None):
+        """Update production line and product analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('production')
+        if metrics is None:
+            return
+        
+        line_counts = metrics.get('line_counts')
+        product_counts = metrics.get('product_counts')
+        
+        # Axes and bars are only rebuilt when the number of lines or products changes
+        panel = self.production_panel
+        if panel.begin((None if line_counts is None else len(line_counts),
+                        None if product_counts is None else len(product_counts))):
+            ax1 = self.production_figure.add_subplot(1, 2, 1)
+            ax2 = self.production_figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme
+            self.production_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            # Plot 1: Line breakdown (using filtered data)
+            if line_counts is not None:
+                panel.artists['lines'] = ValueBars(ax1, range(len(line_counts)), color='#3498db', edgecolor='white', linewidth=1)
+                ax1.set_title('Rejections by Production Line', color='white', fontweight='bold', fontsize=16)
+                ax1.set_ylabel('Number of Rejections', color='white', fontsize=12)
+                ax1.tick_params(axis='x', colors='white', rotation=45)
+                ax1.tick_params(axis='y', colors='white')
+                ax1.grid(True, alpha=0.3, color='white', axis='y')
+        
+            # Plot 2: Product breakdown (using filtered data)
+            if product_counts is not None:
+                panel.artists['products'] = ValueBars(ax2, range(len(product_counts)), horizontal=True,
+                                                      color='#9b59b6', edgecolor='white', linewidth=1)
+                ax2.set_title('Rejections by Product', color='white', fontweight='bold', fontsize=16)
+                ax2.set_xlabel('Number of Rejections', color='white', fontsize=12)
+                ax2.tick_params(axis='x', colors='white')
+                ax2.tick_params(axis='y', colors='white')
+                ax2.grid(True, alpha=0.3, color='white', axis='x')
+        
+            # Style all axes
+            for ax in [ax1, ax2]:
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        
+        if line_counts is not None:
+            panel.artists['lines'].update(line_counts.values, tick_labels=line_counts.index)
+        if product_counts is not None:
+            panel.artists['products'].update(product_counts.values, tick_labels=product_counts.index)
+        
+        panel.draw(labels=tuple(tuple(counts.index) for counts in (line_counts, product_counts) if counts is not None))
+        
+    def update_production_lines(self, metrics=None):
+        """Update production lines consolidation analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('production_lines')
+        if metrics is None:
+            return
+        
+        consolidated_counts = metrics.get('consolidated_counts')
+        
+        # Plot 2 data: individual lines within each consolidated group
+        detailed_labels = []
+        detailed_counts = []
+        detailed_colors = []
+        
+        if consolidated_counts is not None:
+            color_palette = ['#e74c3c', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e', '#e67e22', '#95a5a6']
+        
+            for consolidated_line, individual_lines in metrics['individual_lines']:
+                # Individual lines that map to this consolidated line
+        
+                for i, (individual_line, count) in enumerate(individual_lines.items()):
+                    detailed_labels.append(f"{individual_line}\n({consolidated_line})")
+                    detailed_counts.append(count)
+                    detailed_colors.append(color_palette[i % len(color_palette)])
+        
+        # Axes and bars are only rebuilt when the number of consolidated or individual lines changes
+        panel = self.production_lines_panel
+        if panel.begin(None if consolidated_counts is None else (len(consolidated_counts), len(detailed_counts))):
+            ax1 = self.production_lines_figure.add_subplot(1, 2, 1)
+            ax2 = self.production_lines_figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme
+            self.production_lines_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            if consolidated_counts is not None:
+                # Plot 1: Consolidated production lines (derived at load time)
+                colors = ['#e74c3c', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e']
+                panel.artists['consolidated'] = ValueBars(ax1, range(len(consolidated_counts)),
+                                                          color=colors[:len(consolidated_counts)], edgecolor='white', linewidth=1)
+                ax1.set_title('Rejections by Consolidated Production Line', color='white', fontweight='bold', fontsize=14)
+                ax1.set_ylabel('Number of Rejections', color='white', fontsize=12)
+                ax1.tick_params(axis='x', colors='white', rotation=45)
+                ax1.tick_params(axis='y', colors='white')
+                ax1.grid(True, alpha=0.3, color='white', axis='y')
+        
+                # Plot 2: Detailed breakdown showing individual lines within consolidated groups
+                panel.artists['individual'] = ValueBars(ax2, range(len(detailed_counts)), fontsize=8, pad=0.2,
+                                                        tick_kwargs=dict(rotation=45, ha='right'),
+                                                        edgecolor='white', linewidth=1)
+                ax2.set_title('Individual Lines Within Consolidated Groups', color='white', fontweight='bold', fontsize=14)
+                ax2.set_ylabel('Number of Rejections', color='white', fontsize=12)
+                ax2.tick_params(axis='x', colors='white')
+                ax2.tick_params(axis='y', colors='white')
+                ax2.grid(True, alpha=0.3, color='white', axis='y')
+            else:
+                # No data available
+                ax1.text(0.5, 0.5, 'No Production Line Data Available', ha='center', va='center',
+                        transform=ax1.transAxes, color='white', fontsize=16)
+                ax2.text(0.5, 0.5, 'No Production Line Data Available', ha='center', va='center',
+                        transform=ax2.transAxes, color='white', fontsize=16)
+        
+            # Style all axes
+            for ax in [ax1, ax2]:
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        
+        if consolidated_counts is not None:
+            panel.artists['consolidated'].update(consolidated_counts.values, tick_labels=consolidated_counts.index)
+            panel.artists['individual'].update(detailed_counts, tick_labels=detailed_labels, bar_colors=detailed_colors)
+        
+        panel.draw(labels=(tuple(consolidated_counts.index) if consolidated_counts is not None else (), tuple(detailed_labels)))
+        
+    def update_advanced_tracking(self, metrics=None):
+        """Update advanced tracking with rejection reason categories"""
+        metrics = metrics if metrics is not None else self.view_metrics('categories')
+        if metrics is None:
+            return
+        
+        # Show uncategorized issues for user to categorize
+        uncategorized_issues = metrics['uncategorized']
+        if uncategorized_issues:
+            print("Uncategorized rejection reasons that need categorization:")
+            for reason, count in uncategorized_issues:
+                print(f"  - '{reason}': {count} occurrences")
+        
+        # Category breakdown (two categories now) and top reasons by category
+        categories = [DIMENSIONAL_CATEGORY, TAG_TRACKING_CATEGORY]
+        category_counts = [metrics['category_counts'][category] for category in categories]
+        top_reasons = metrics['top_reasons']
+        reasons = [reason for reason, _ in top_reasons]
+        counts = [count for _, count in top_reasons]
+        
+        # Axes and artists are only rebuilt when the pie appears/disappears or the number of reasons changes
+        panel = self.category_panel
+        if panel.begin((sum(category_counts) > 0, len(reasons))):
+            ax1 = self.category_figure.add_subplot(1, 2, 1)
+            ax2 = self.category_figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme
+            self.category_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            # Plot 1: Category breakdown
+            colors = ['#e74c3c', '#f39c12']
+            if sum(category_counts) > 0:
+                panel.artists['categories'] = PieSlices(ax1, len(categories), colors, color='white', fontweight='bold')
+            ax1.set_title('Rejection Categories', color='white', fontweight='bold', fontsize=14)
+        
+            # Plot 2: Top reasons by category
+            panel.artists['reasons'] = ValueBars(ax2, range(len(reasons)), horizontal=True,
+                                                 color='#3498db', edgecolor='white', linewidth=1)
+            ax2.set_title('Top Rejection Reasons', color='white', fontweight='bold', fontsize=14)
+            ax2.set_xlabel('Number of Rejections', color='white', fontsize=12)
+            ax2.tick_params(axis='x', colors='white')
+            ax2.tick_params(axis='y', colors='white')
+            ax2.grid(True, alpha=0.3, color='white', axis='x')
+        
+            # Style axes
+            for ax in [ax1, ax2]:
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        
+        if 'categories' in panel.artists:
+            panel.artists['categories'].update(category_counts, categories)
+        panel.artists['reasons'].update(counts, tick_labels=reasons)
+        
+        panel.draw(labels=tuple(reasons))
+        
+    def update_category_rejects(self, panel, metrics, name, reason_color, line_color):
+        """Draw a category's rejection reasons and its rejects per production line into panel"""
+        reason_counts = metrics['reason_counts']
+        line_counts = metrics['line_counts']
+        figure = panel.figure
+        
+        # Axes and bars are only rebuilt when the number of reasons or lines changes
+        if panel.begin((len(reason_counts), len(line_counts)) if metrics['total'] > 0 else None):
+            ax1 = figure.add_subplot(1, 2, 1)
+            ax2 = figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme
+            figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            if metrics['total'] > 0:
+                # Plot 1: Rejection reasons breakdown
+                panel.artists['reasons'] = ValueBars(ax1, range(len(reason_counts)), horizontal=True,
+                                                     tick_kwargs=dict(color='white'),
+                                                     color=reason_color, edgecolor='white', linewidth=1)
+                ax1.set_xlabel('Number of Rejections', color='white', fontsize=12)
+                ax1.set_title(f'{name} Rejection Reasons', color='white', fontweight='bold', fontsize=16)
+                ax1.tick_params(axis='x', colors='white')
+                ax1.grid(True, alpha=0.3, color='white', axis='x')
+        
+                # Plot 2: Rejects by production line
+                panel.artists['lines'] = ValueBars(ax2, range(len(line_counts)), color=line_color, edgecolor='white', linewidth=1)
+                ax2.set_xlabel('Production Line', color='white', fontsize=12)
+                ax2.set_ylabel('Number of Rejections', color='white', fontsize=12)
+                ax2.set_title(f'{name} Rejects by Production Line', color='white', fontweight='bold', fontsize=16)
+                ax2.tick_params(axis='x', colors='white', rotation=45)
+                ax2.tick_params(axis='y', colors='white')
+                ax2.grid(True, alpha=0.3, color='white', axis='y')
+            else:
+                # No data for this category
+                ax1.text(0.5, 0.5, f'No {name} Rejects Found', ha='center', va='center',
+                        transform=ax1.transAxes, color='white', fontsize=16)
+                ax2.text(0.5, 0.5, f'No {name} Rejects Found', ha='center', va='center',
+                        transform=ax2.transAxes, color='white', fontsize=16)
+        
+            # Style all axes
+            for ax in [ax1, ax2]:
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        
+        reason_labels = [reason[:30] + '...' if len(reason) > 30 else reason for reason in reason_counts.index]
+        if metrics['total'] > 0:
+            panel.artists['reasons'].update(reason_counts.values, tick_labels=reason_labels)
+            panel.artists['lines'].update(line_counts.values, tick_labels=line_counts.index)
+        
+        panel.draw(labels=(tuple(reason_labels), tuple(line_counts.index)))
+        
+    def update_dimensional_rejects(self, metrics=None):
+        """Update dimensional rejects analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('dimensional')
+        if metrics is None:
+            return
+        
+        # Dimensional rejects (Category column is classified at load time)
+        self.update_category_rejects(self.dimensional_panel, metrics, 'Dimensional', '#e74c3c', '#f39c12')
+        
+    def update_tag_tracking_rejects(self, metrics=None):
+        """Update tag/tracking rejects analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('tag_tracking')
+        if metrics is None:
+            return
+        
+        # Tag/tracking/system rejects (Category column is classified at load time)
+        self.update_category_rejects(self.tag_tracking_panel, metrics, 'Tag/Tracking', '#3498db', '#9b59b6')
+        
+    def update_time_analysis(self, metrics=None):
+        """Update time-of-day analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('time')
+        if metrics is None:
+            return
+        
+        # Hour and weekday counts derived from the reject datetime
+        hourly_counts = metrics.get('hourly_counts')
+        dow_counts = metrics.get('dow_counts')
+        
+        # Axes and bars are only rebuilt when the hours or weekdays present change
+        panel = self.time_panel
+        if panel.begin(None if hourly_counts is None else (tuple(hourly_counts.index), tuple(dow_counts.index))):
+            ax1 = self.time_figure.add_subplot(1, 2, 1)
+            ax2 = self.time_figure.add_subplot(1, 2, 2)
+        
+            # Set dark theme
+            self.time_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+        
+            if hourly_counts is not None:
+                # Plot 1: Rejections by hour
+                panel.artists['hours'] = ValueBars(ax1, hourly_counts.index, fontsize=8, pad=0.2,
+                                                   color='#e74c3c', edgecolor='white', linewidth=1)
+                ax1.set_title('Rejections by Hour of Day', color='white', fontweight='bold', fontsize=12)
+                ax1.set_xlabel('Hour', color='white')
+                ax1.set_ylabel('Number of Rejections', color='white')
+                ax1.tick_params(axis='x', colors='white')
+                ax1.tick_params(axis='y', colors='white')
+                ax1.grid(True, alpha=0.3, color='white', axis='y')
+        
+                # Plot 2: Rejections by day of week
+                panel.artists['days'] = ValueBars(ax2, range(len(dow_counts)), fontsize=8, pad=0.2,
+                                                  color='#3498db', edgecolor='white', linewidth=1)
+                ax2.set_title('Rejections by Day of Week', color='white', fontweight='bold', fontsize=12)
+                ax2.set_xlabel('Day of Week', color='white')
+                ax2.set_ylabel('Number of Rejections', color='white')
+                ax2.tick_params(axis='x', colors='white', rotation=45)
+                ax2.tick_params(axis='y', colors='white')
+                ax2.grid(True, alpha=0.3, color='white', axis='y')
+        
+            # Style all axes
+            for ax in [ax1, ax2]:
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+        
+        if hourly_counts is not None:
+            worst_hour = hourly_counts.idxmax()
+            best_hour = hourly_counts.idxmin()
+        
+            comparison_labels = [f'Worst Hour\n({worst_hour}:00)'+'\n', f'Best Hour\n({best_hour}:00)'+'\n']
+            colors = ['#e74c3c', '#2ecc71']
+        
+            max_height = hourly_counts.max()
+            min_height = hourly_counts.min()
+        
+            # Value labels on top of bars, highlighting the worst and best hours
+            label_texts = []
+            label_colors = []
+            for height in hourly_counts.values:
+                if height == max_height:
+                    label_texts.append(comparison_labels[0] + f'{int(height)}')
+                    label_colors.append(colors[0])
+                elif height == min_height:
+                    label_texts.append(comparison_labels[1] + f'{int(height)}')
+                    label_colors.append('green')
+                else:
+                    label_texts.append(f'{int(height)}')
+                    label_colors.append('black')
+            panel.artists['hours'].update(hourly_counts.values, label_texts=label_texts, label_colors=label_colors)
+            panel.artists['days'].update(dow_counts.values, tick_labels=dow_counts.index)
+        
+        panel.draw()
+        
+    def update_sku_analysis(self, metrics=None):
+        """Update Product analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('products')
+        if metrics is None:
+            return
+            
+        sku_counts = metrics.get('sku_counts')
+        
+        # Axes and bars are only rebuilt when the number of products changes
+        panel = self.sku_panel
+        if panel.begin(None if sku_counts is None else len(sku_counts)):
+            # Create subplots
+            ax1 = self.sku_figure.add_subplot(1, 1, 1)
+            # ax2 = self.sku_figure.add_subplot(1, 2, 2)
+            
+            # Set dark theme
+            self.sku_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+            
+            # Plot 1: Top Products by rejection count (with full product descriptions)
+            if sku_counts is not None:
+                panel.artists['products'] = ValueBars(ax1, range(len(sku_counts)), label_offset=0.5,
+                                                      tick_kwargs=dict(rotation=-90, color='white'),
+                                                      color='#e74c3c', edgecolor='white', linewidth=1)
+                panel.artists['title'] = ax1.set_title('', color='white', fontsize=12, fontweight='bold')
+                ax1.set_xlabel('Product', color='white')
+                ax1.set_ylabel('Number of Rejections', color='white')
+                ax1.tick_params(colors='white')
+                ax1.grid(True, alpha=0.3, color='white')
+                
+                # Set dark theme for subplot
+                ax1.set_facecolor(self.theme.get_color('card_bg'))
+                for spine in ax1.spines.values():
+                    spine.set_color('white')
+                    
+        if sku_counts is not None:
+            num_products = metrics['top_products']
+            percentage_top = metrics['percentage_top']
+            panel.artists['title'].set_text('Top Products by Rejection Count (Top ' + str(num_products) + ' account for ' + f'{percentage_top:.3f}' + '% of all rejections)')
+            panel.artists['products'].update(sku_counts.values, tick_labels=sku_counts.index)
+        
+        # # Plot 2: Pie chart of all Products
+        # if 'Sku' in filtered_data.columns:
+        #     sku_counts = filtered_data['Sku'].value_counts()
+            
+        #     # Get top 8 SKUs and group the rest as "Other"
+        #     top_skus = sku_counts.head(8)
+        #     other_count = sku_counts.iloc[8:].sum() if len(sku_counts) > 8 else 0
+            
+        #     if other_count > 0:
+        #         pie_data = list(top_skus.values) + [other_count]
+        #         pie_labels = list(top_skus.index) + ['Other']
+        #     else:
+        #         pie_data = list(top_skus.values)
+        #         pie_labels = list(top_skus.index)
+            
+        #     colors = ['#e74c3c', '#3498db', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e', '#e67e22', '#95a5a6']
+            
+        #     wedges, texts, autotexts = ax2.pie(pie_data, labels=pie_labels, autopct='%1.1f%%', 
+        #                                       colors=colors[:len(pie_data)], startangle=90)
+        #     ax2.set_title('Product Distribution', color='white', fontsize=12, fontweight='bold')
+            
+        #     # Set text colors to white
+        #     for text in texts:
+        #         text.set_color('white')
+        #     for autotext in autotexts:
+        #         autotext.set_color('white')
+        #         autotext.set_fontweight('bold')
+            
+        #     # Set dark theme for subplot
+        #     ax2.set_facecolor(self.theme.get_color('card_bg'))
+        
+        # # Plot 3: Product rejection rate by production line (with full product descriptions)
+        # if 'Sku' in filtered_data.columns and 'Source' in filtered_data.columns:
+        #     # Get top 5 SKUs
+        #     top_skus = filtered_data['Sku'].value_counts().head(5).index
+            
+        #     # Create heatmap-style data
+        #     line_sku_data = filtered_data.groupby(['Source', 'Sku']).size().unstack(fill_value=0)
+        #     line_sku_data = line_sku_data[top_skus]  # Only show top SKUs
+            
+        #     # Create bar chart showing SKU rejections by line
+        #     x = np.arange(len(line_sku_data.index))
+        #     width = 0.15
+            
+        #     for i, sku in enumerate(top_skus):
+        #         ax3.bar(x + i * width, line_sku_data[sku], width, 
+        #                label=sku, edgecolor='white', linewidth=1)
+            
+        #     ax3.set_title('Product Rejections by Production Line', color='white', fontsize=12, fontweight='bold')
+        #     ax3.set_xlabel('Production Line', color='white')
+        #     ax3.set_ylabel('Number of Rejections', color='white')
+        #     ax3.set_xticks(x + width * 2)
+        #     ax3.set_xticklabels(line_sku_data.index, rotation=45, color='white')
+        #     ax3.tick_params(colors='white')
+        #     ax3.legend(fontsize=8)
+        #     ax3.grid(True, alpha=0.3, color='white')
+            
+        #     # Set dark theme for subplot
+        #     ax3.set_facecolor(self.theme.get_color('card_bg'))
+        #     for spine in ax3.spines.values():
+        #         spine.set_color('white')
+        
+        # # Plot 4: Product rejection trends by period (with full product descriptions)
+        # if 'Sku' in filtered_data.columns and 'Period' in filtered_data.columns:
+        #     # Get top 3 SKUs for trend analysis
+        #     top_skus = filtered_data['Sku'].value_counts().head(3).index
+            
+        #     # Create period series data
+        #     for i, sku in enumerate(top_skus):
+        #         sku_data = filtered_data[filtered_data['Sku'] == sku]
+        #         period_counts = sku_data.groupby('Period').size()
+                
+        #         # Sort periods numerically
+        #         period_counts = period_counts.sort_index()
+                
+        #         ax4.plot(period_counts.index, period_counts.values, 
+        #                 marker='o', linewidth=2, label=sku, markersize=4)
+            
+        #     ax4.set_title('Product Rejection Trends by Period', color='white', fontsize=12, fontweight='bold')
+        #     ax4.set_xlabel('Period', color='white')
+        #     ax4.set_ylabel('Rejections per Period', color='white')
+        #     ax4.tick_params(colors='white')
+        #     ax4.legend(fontsize=8)
+        #     ax4.grid(True, alpha=0.3, color='white')
+            
+        #     # Set dark theme for subplot
+        #     ax4.set_facecolor(self.theme.get_color('card_bg'))
+        #     for spine in ax4.spines.values():
+        #         spine.set_color('white')
+        
+        panel.draw(labels=tuple(sku_counts.index) if sku_counts is not None else ())
+        
+    def update_rejection_rate_analysis(self, metrics=None):
+        """Update rejection rate analysis"""
+        metrics = metrics if metrics is not None else self.view_metrics('rejection_rates')
+        if metrics is None:
+            return
+            
+        # Rejection rates against PRODUCTION_TOTALS (lines with 0 rejections included)
+        rejection_details = metrics.get('lines') or {}  # Store raw numbers for display
+        lines = list(rejection_details)
+        
+        # Axes and bars are only rebuilt when the set of production lines changes
+        panel = self.rejection_panel
+        if panel.begin(tuple(lines)):
+            # Create 2 subplots - overall rate and per production line
+            ax1 = self.rejection_figure.add_subplot(1, 2, 1)
+            ax2 = self.rejection_figure.add_subplot(1, 2, 2)
+            
+            # Set dark theme
+            self.rejection_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
+            
+            if lines:
+                # Plot 1: Overall rejection rate (single bar chart)
+                panel.artists['overall'] = ValueBars(ax1, [0], fontsize=12, label_alpha=0.7,
+                                                     color=['#e74c3c'], edgecolor='white', linewidth=1)
+                panel.artists['overall_title'] = ax1.set_title('', color='white', fontsize=16, fontweight='bold')
+                ax1.set_ylabel('Rejection Rate (%)', color='white')
+                ax1.tick_params(colors='white')
+                ax1.grid(True, alpha=0.3, color='white')
+                
+                # Set dark theme for subplot
+                ax1.set_facecolor(self.theme.get_color('card_bg'))
+                for spine in ax1.spines.values():
+                    spine.set_color('white')
+                    
+                # Plot 2: Rejection rates by production line
+                panel.artists['lines'] = ValueBars(ax2, range(len(lines)), fontsize=10, label_alpha=0.7,
+                                                   tick_kwargs=dict(rotation=45, color='white'),
+                                                   color='#e74c3c', edgecolor='white', linewidth=1)
+                ax2.set_title('Rejection Rate by Production Line', color='white', fontsize=16, fontweight='bold')
+                ax2.set_xlabel('Production Line', color='white')
+                ax2.set_ylabel('Rejection Rate (%)', color='white')
+                ax2.tick_params(colors='white')
+                ax2.grid(True, alpha=0.3, color='white')
+                
+                # Set dark theme for subplot
+                ax2.set_facecolor(self.theme.get_color('card_bg'))
+                for spine in ax2.spines.values():
+                    spine.set_color('white')
+            else:
+                # If no rejection rates calculated, show a message
+                ax2.text(0.5, 0.5, 'No production line data available\nfor rejection rate calculation', 
+                        ha='center', va='center', transform=ax2.transAxes, 
+                        color='white', fontsize=14, fontweight='bold')
+                ax2.set_title('Rejection Rate by Production Line', color='white', fontsize=16, fontweight='bold')
+                ax2.set_facecolor(self.theme.get_color('card_bg'))
+                
+        if lines:
+            total_rejections = metrics['total_rejections']
+            total_production = metrics['total_production']
+            overall_rate = metrics['overall_rate']
+            
+            # Value labels on bars with raw numbers
+            panel.artists['overall_title'].set_text(f'Overall Rejection Rate: {overall_rate:.2f}%')
+            panel.artists['overall'].update([overall_rate], tick_labels=['Overall Rejection Rate'],
+                                            label_texts=[f'{overall_rate:.2f}%\n({total_rejections:,}/{total_production:,})'])
+            
+            rates = [details['rate'] for details in rejection_details.values()]
+            panel.artists['lines'].update(rates, tick_labels=lines, label_offset=max(rates)*0.01,
+                                          label_texts=[f'{details["rate"]:.2f}%\n({details["rejections"]:,}/{details["production"]:,})'
+                                                       for details in rejection_details.values()])
+        
+        panel.draw(labels=tuple(lines))
+
+class RejectedUnitsAnalyzer(QMainWindow, DashboardCharts):
+    def __init__(self):
+        super().__init__()
+        self.theme = ModernTheme()
+        self.current_data = None
+        self.filtered_data = None
+        self.engine = None
+        self.filter_selections = ()
+        self.filtered_cube = None
+        self.analysis_results = None
+        self.current_file = None
+        self.current_files = []  # Every selected export; more than one are parsed in parallel and merged
+        self.data_cache = ParsedWorkbookCache()
+        self.pipeline = RejectPipeline(self.data_cache)
+        self.sku_master = self.pipeline.sku_master
+        self.period_calendar = self.pipeline.period_calendar
+        self.reason_classifier = self.pipeline.reason_classifier
+        self.derived_columns = self.pipeline.derived_columns
+        self.refresh_scheduler = RefreshScheduler(self.update_all_tabs, parent=self)
+        self.aggregation_runner = AggregationRunner(parent=self)
+        self.aggregate_cache = AggregateCache()
+        self.dataset_version = 0
+        self.pending_filter_key = None
+        self.pending_snapshot = None
+        self.aggregation_runner.finished.connect(self.on_filters_resolved)
+        self.aggregation_runner.failed.connect(self.on_filters_failed)
+        self.view_renderers = {}  # Tab page -> update method, rendered only while visible
+        self.view_names = {}  # Tab page -> RejectAnalyticsEngine view it draws
+        self.view_selections = {}  # View -> its tab's own normalized filter, applied on top of the global one
+        self.view_filter_models = {}  # View -> {filter column: FilterListModel} of its tab filters
+        self.dirty_views = set()
+        self.prerender_next_tab = True
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setSingleShot(True)
+        self.prerender_timer.setInterval(400)
+        self.prerender_timer.timeout.connect(self.prerender_next_view)
+        self.ingest_thread = None
+        self.ingest_worker = None
+        self.lazy_tabs = {}  # Placeholder tab page -> method that builds its widgets on first visit
+        self.tab_build_seconds = OrderedDict()  # Tab title -> seconds its lazy build took, for the startup report
+        self.chart_panels = []
+        self.analysis_model = None
+        
+        self.setup_ui()
+        self.apply_theme()
+        
+    def setup_ui(self):
+        self.setWindowTitle("Gaelen Collins - E80 Rejected Units Analyzer")
+        self.setGeometry(100, 100, 1600, 1000)
+        
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        
+        # Header
+        self.create_header(main_layout)
+        
+        # Global Filters Section (persistent across all tabs)
+        self.create_global_filters(main_layout)
+        
+        # Tab widget
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setTabPosition(QTabWidget.North)
+        self.tab_widget.currentChanged.connect(self.render_visible_view)
+        main_layout.addWidget(self.tab_widget)
+        
+        # Create all the analysis tabs; the chart and detail tabs (and matplotlib)
+        # are only built when first shown so the window comes up quickly
+        self.create_upload_tab()
+        self.create_dashboard_tab()
+        self.add_lazy_tab("📈 Trends", self.create_trends_tab)
+        self.add_lazy_tab("🏭 Production Analysis", self.create_production_analysis_tab)
+        self.add_lazy_tab("🏭 Production Lines", self.create_production_lines_tab)
+        self.add_lazy_tab("🔍 Advanced Tracking", self.create_advanced_tracking_tab)
+        self.add_lazy_tab("📏 Dimensional Rejects", self.create_dimensional_rejects_tab)
+        self.add_lazy_tab("🏷️ Tag/Tracking Rejects", self.create_tag_tracking_rejects_tab)
+        self.add_lazy_tab("⏰ Time Analysis", self.create_time_analysis_tab)
+        self.add_lazy_tab("📦 Product Analysis", self.create_sku_analysis_tab)
+        self.add_lazy_tab("📊 Rejection Rates", self.create_rejection_rate_tab)
+        self.add_lazy_tab("🔍 Analysis", self.create_analysis_tab)
+        
+        central_widget.setLayout(main_layout)
+        
+        # Status bar with load progress and cancel
+        self.create_status_bar()
+        
+    def create_status_bar(self):
+        status_bar = QStatusBar()
+        self.setStatusBar(status_bar)
+        
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setMaximumWidth(250)
+        self.load_progress.setVisible(False)
+        
+        self.cancel_load_btn = QPushButton("Cancel")
+        self.cancel_load_btn.clicked.connect(self.cancel_ingest)
+        self.cancel_load_btn.setVisible(False)
+        
+        status_bar.addPermanentWidget(self.load_progress)
+        status_bar.addPermanentWidget(self.cancel_load_btn)
+        
+    def add_lazy_tab(self, title, create):
+        """Add an empty tab page that create(page) fills in the first time it is shown"""
+        page = QWidget()
+        self.tab_widget.addTab(page, title)
+        self.lazy_tabs[page] = create
+        return page
+        
+    def build_tab(self, page):
+        """Build a lazily added tab page if it has not been built yet"""
+        create = self.lazy_tabs.pop(page, None)
+        if create is None:
+            return
+        started = time.perf_counter()
+        create(page)
+        self.tab_build_seconds[self.tab_widget.tabText(self.tab_widget.indexOf(page))] = time.perf_counter() - started
+        
+        # Its charts have never been drawn for the loaded data
+        if self.filtered_cube is not None:
+            self.dirty_views.add(page)
+            
+    def create_chart(self, **figure_kwargs):
+        """Figure, Qt canvas and ChartPanel for a chart tab"""
+        # Imported here so startup does not pay for matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        figure = Figure(**figure_kwargs)
+        canvas = FigureCanvas(figure)
+        panel = ChartPanel(figure, canvas)
+        self.chart_panels.append(panel)
+        return figure, canvas, panel
         
     def create_global_filters(self, parent_layout): #Global filters that affect all tabs
         # Create a custom card with minimize button
@@ -304,18 +3211,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         
         period_buttons_layout.addWidget(self.period_select_all_btn)
         period_buttons_layout.addWidget(self.period_reset_btn)
-        period_buttons_layout.addStretch()
         period_layout.addLayout(period_buttons_layout)
         
-        self.global_period_checkboxes = {}
-        self.global_period_scroll = QScrollArea()
-        self.global_period_scroll.setWidgetResizable(True)
-        self.global_period_scroll.setMaximumHeight(120)
-        global_period_widget = QWidget()
-        self.global_period_widget_layout = QVBoxLayout()
-        global_period_widget.setLayout(self.global_period_widget_layout)
-        self.global_period_scroll.setWidget(global_period_widget)
-        period_layout.addWidget(self.global_period_scroll)
+        self.global_period_model, self.global_period_view = self.create_filter_list(period_layout, period_buttons_layout, self.solo_period)
         period_group.setLayout(period_layout)
         
         # Line filter
@@ -372,18 +3270,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         
         line_buttons_layout.addWidget(self.line_select_all_btn)
         line_buttons_layout.addWidget(self.line_reset_btn)
-        line_buttons_layout.addStretch()
         line_layout.addLayout(line_buttons_layout)
         
-        self.global_line_checkboxes = {}
-        self.global_line_scroll = QScrollArea()
-        self.global_line_scroll.setWidgetResizable(True)
-        self.global_line_scroll.setMaximumHeight(120)
-        global_line_widget = QWidget()
-        self.global_line_widget_layout = QVBoxLayout()
-        global_line_widget.setLayout(self.global_line_widget_layout)
-        self.global_line_scroll.setWidget(global_line_widget)
-        line_layout.addWidget(self.global_line_scroll)
+        self.global_line_model, self.global_line_view = self.create_filter_list(line_layout, line_buttons_layout, self.solo_line)
         line_group.setLayout(line_layout)
         
         # Product filter
@@ -440,18 +3329,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         
         sku_buttons_layout.addWidget(self.sku_select_all_btn)
         sku_buttons_layout.addWidget(self.sku_reset_btn)
-        sku_buttons_layout.addStretch()
         sku_layout.addLayout(sku_buttons_layout)
         
-        self.global_sku_checkboxes = {}
-        self.global_sku_scroll = QScrollArea()
-        self.global_sku_scroll.setWidgetResizable(True)
-        self.global_sku_scroll.setMaximumHeight(120)
-        global_sku_widget = QWidget()
-        self.global_sku_widget_layout = QVBoxLayout()
-        global_sku_widget.setLayout(self.global_sku_widget_layout)
-        self.global_sku_scroll.setWidget(global_sku_widget)
-        sku_layout.addWidget(self.global_sku_scroll)
+        self.global_sku_model, self.global_sku_view = self.create_filter_list(sku_layout, sku_buttons_layout, self.solo_sku)
         sku_group.setLayout(sku_layout)
         
         filters_layout.addWidget(period_group)
@@ -460,6 +3340,128 @@ class RejectedUnitsAnalyzer(QMainWindow):
         
         parent_layout.addWidget(self.filters_card)
         
+    def create_filter_list(self, group_layout, buttons_layout, solo, on_change=None):
+        """Checkable list view with a type-ahead search box for one filter (a global one unless on_change is given)"""
+        model = FilterListModel(self)
+        model.checkStatesChanged.connect(on_change if on_change is not None else self.refresh_scheduler.request)
+        
+        # Typing in the search box narrows the rows shown (check states are kept)
+        proxy = QSortFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        search = QLineEdit()
+        search.setPlaceholderText("Search...")
+        search.setClearButtonEnabled(True)
+        search.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {self.theme.get_color('card_bg')};
+                color: {self.theme.get_color('fg')};
+                border: 1px solid {self.theme.get_color('hover')};
+                border-radius: 3px;
+                padding: 3px 5px;
+            }}
+        """)
+        search.textChanged.connect(proxy.setFilterFixedString)
+        buttons_layout.addWidget(search)
+        
+        view = QListView()
+        view.setModel(proxy)
+        view.setUniformItemSizes(True)
+        view.setMouseTracking(True)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)  # Long labels are elided; Solo stays in view
+        view.setMaximumHeight(120)
+        view.setStyleSheet(f"""
+            QListView {{
+                background-color: {self.theme.get_color('card_bg')};
+                color: {self.theme.get_color('fg')};
+                border: 1px solid {self.theme.get_color('hover')};
+            }}
+            QListView::indicator {{
+                width: 14px;
+                height: 14px;
+                border: 2px solid {self.theme.get_color('hover')};
+                border-radius: 3px;
+                background-color: {self.theme.get_color('card_bg')};
+            }}
+            QListView::indicator:checked {{
+                background-color: {self.theme.get_color('accent')};
+                border-color: {self.theme.get_color('accent')};
+            }}
+        """)
+        delegate = SoloButtonDelegate(view)
+        delegate.soloClicked.connect(solo)
+        view.setItemDelegate(delegate)
+        group_layout.addWidget(view)
+        return model, view
+        
+    def create_view_filters(self, layout, view):
+        """Tab filter card: period and line lists narrowing only this tab, on top of the global filters"""
+        card = ModernCard("🎛️ Tab Filters", self.theme)
+        lists_layout = QHBoxLayout()
+        models = {}
+        on_change = lambda: self.set_view_selection(view, {column: model.checked_values() for column, model in models.items()})
+        for title, column in (("Periods", 'Period'), ("Production Lines", 'Source')):
+            group = QGroupBox(title)
+            group.setStyleSheet(f"""
+                QGroupBox {{
+                    font-weight: bold;
+                    border: 1px solid {self.theme.get_color('accent')};
+                    border-radius: 3px;
+                    margin-top: 1ex;
+                    color: {self.theme.get_color('fg')};
+                }}
+                QGroupBox::title {{
+                    subcontrol-origin: margin;
+                    left: 10px;
+                    padding: 0 5px 0 5px;
+                }}
+            """)
+            group_layout = QVBoxLayout()
+            buttons_layout = QHBoxLayout()
+            all_btn = QPushButton("All")
+            all_btn.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: {self.theme.get_color('accent')};
+                    color: white;
+                    border: none;
+                    padding: 5px 10px;
+                    border-radius: 3px;
+                    font-weight: bold;
+                }}
+                QPushButton:hover {{
+                    background-color: {self.theme.get_color('accent_hover')};
+                }}
+            """)
+            buttons_layout.addWidget(all_btn)
+            group_layout.addLayout(buttons_layout)
+            model, _ = self.create_filter_list(group_layout, buttons_layout, lambda value, column=column: models[column].solo(value),
+                                               on_change=on_change)
+            all_btn.clicked.connect(lambda _, model=model: model.set_checked(True))
+            models[column] = model
+            group.setLayout(group_layout)
+            lists_layout.addWidget(group)
+        card.content_layout.addLayout(lists_layout)
+        layout.addWidget(card)
+        self.view_filter_models[view] = models
+        if self.engine is not None:
+            self.populate_view_filters(view)
+        
+    def populate_view_filters(self, view):
+        """Fill a tab's filter lists with the loaded values, all checked (no tab filter)"""
+        for column, model in self.view_filter_models[view].items():
+            values = [value for value in self.engine.index.values.get(column, []) if pd.notna(value)]
+            if column == 'Period':
+                # Calendar order, like the global period list
+                order = {period: i for i, period in enumerate(self.period_calendar.categories)}
+                values = sorted(values, key=lambda period: order.get(period, len(order)))
+                labels = [period if period == PepsiPeriodCalendar.UNKNOWN else f"{period}: {self.period_calendar.describe(period)}"
+                          for period in values]
+            else:
+                values = sorted(values, key=str)
+                labels = None
+            model.set_items(values, labels)
+        self.view_selections.pop(view, None)
+        
     def toggle_filters_minimize(self):
         """Toggle the minimize/expand state of the filters box"""
         if self.filters_minimized:
@@ -578,17 +3580,17 @@ class RejectedUnitsAnalyzer(QMainWindow):
             QPushButton#process_btn_ready:hover {{
                 background-color: #27ae60;
             }}
-            QTableWidget {{
+            QTableView {{
                 background-color: {card_bg};
                 color: {fg};
                 gridline-color: {hover};
                 border: 1px solid {hover};
                 border-radius: 4px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {accent};
                 color: white;
             }}
@@ -661,6 +3663,21 @@ class RejectedUnitsAnalyzer(QMainWindow):
                 left: 10px;
                 padding: 0 5px 0 5px;
             }}
+            QStatusBar {{
+                background-color: {card_bg};
+                color: {fg};
+            }}
+            QProgressBar {{
+                background-color: {bg};
+                color: {fg};
+                border: 1px solid {hover};
+                border-radius: 4px;
+                text-align: center;
+            }}
+            QProgressBar::chunk {{
+                background-color: {accent};
+                border-radius: 3px;
+            }}
         """)
         
     def create_upload_tab(self):
@@ -708,6 +3725,11 @@ class RejectedUnitsAnalyzer(QMainWindow):
         """)
         main_card.content_layout.addWidget(self.clear_file_btn)
         
+        # Incremental mode for cumulative YTD exports
+        self.incremental_checkbox = QCheckBox("Append only new rows to the loaded data (for updated YTD exports)")
+        self.incremental_checkbox.setEnabled(False)
+        main_card.content_layout.addWidget(self.incremental_checkbox, alignment=Qt.AlignCenter)
+        
         # Status
         self.status_label = QLabel("Ready to upload rejected units data...")
         self.status_label.setFont(QFont("Segoe UI", 10))
@@ -756,10 +3778,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.addWidget(scroll)
         self.dashboard_tab.setLayout(tab_layout)
         self.tab_widget.addTab(self.dashboard_tab, "📊 Dashboard")
+        self.register_view(self.dashboard_tab, 'dashboard', self.update_dashboard)
         
-    def create_analysis_tab(self):
-        tab = QWidget()
-        
+    def create_analysis_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -770,97 +3791,48 @@ class RejectedUnitsAnalyzer(QMainWindow):
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         
-        # Filters section
+        # Filters section (rows are already limited by the global filters)
         filters_card = ModernCard("🔍 Analysis Filters", self.theme)
         filters_layout = QHBoxLayout()
         
-        # Period selection filter
-        period_group = QGroupBox("Period Selection")
-        period_layout = QVBoxLayout()
-        
-        # Period checkboxes
-        self.period_checkboxes = {}
-        self.period_scroll = QScrollArea()
-        self.period_scroll.setWidgetResizable(True)
-        self.period_scroll.setMaximumHeight(150)
-        period_widget = QWidget()
-        self.period_widget_layout = QVBoxLayout()
-        period_widget.setLayout(self.period_widget_layout)
-        self.period_scroll.setWidget(period_widget)
-        period_layout.addWidget(self.period_scroll)
-        
-        # Add period definitions
-        period_definitions = {
-            'Period 1': 'Dec 29, 2024 - Jan 25, 2025',
-            'Period 2': 'Jan 26 - Feb 22, 2025',
-            'Period 3': 'Feb 23 - Mar 22, 2025',
-            'Period 4': 'Mar 23 - Apr 19, 2025',
-            'Period 5': 'Apr 20 - May 17, 2025',
-            'Period 6': 'May 18 - Jun 14, 2025',
-            'Period 7': 'Jun 15 - Jul 12, 2025',
-            'Period 8': 'Jul 13 - Aug 9, 2025',
-            'Period 9': 'Aug 10 - Sep 6, 2025',
-            'Period 10': 'Sep 7 - Oct 4, 2025',
-            'Period 11': 'Oct 5 - Nov 1, 2025',
-            'Period 12': 'Nov 2 - Nov 29, 2025',
-            'Period 13': 'Nov 30 - Dec 27, 2025'
-        }
-        
-        for period, date_range in period_definitions.items():
-            checkbox = QCheckBox(f"{period}: {date_range}")
-            checkbox.setChecked(True)  # Default to all selected
-            checkbox.stateChanged.connect(self.apply_filters)  # Connect to filter function
-            self.period_checkboxes[period] = checkbox
-            self.period_widget_layout.addWidget(checkbox)
-        
-        period_group.setLayout(period_layout)
-        
-        # Line filter (multi-select)
-        line_group = QGroupBox("Production Lines")
-        line_layout = QVBoxLayout()
-        self.line_checkboxes = {}  # Dictionary to store checkboxes
-        self.line_scroll = QScrollArea()
-        self.line_scroll.setWidgetResizable(True)
-        self.line_scroll.setMaximumHeight(150)
-        line_widget = QWidget()
-        self.line_widget_layout = QVBoxLayout()
-        line_widget.setLayout(self.line_widget_layout)
-        self.line_scroll.setWidget(line_widget)
-        line_layout.addWidget(self.line_scroll)
-        line_group.setLayout(line_layout)
-        
         # Rejection reason filter
         reason_group = QGroupBox("Rejection Reason")
         reason_layout = QHBoxLayout()
         self.reason_filter = QComboBox()
         self.reason_filter.addItem("All Reasons")
+        self.reason_filter.currentTextChanged.connect(self.apply_analysis_table_filters)
         reason_layout.addWidget(QLabel("Reason:"))
         reason_layout.addWidget(self.reason_filter)
         reason_group.setLayout(reason_layout)
         
-        filters_layout.addWidget(period_group)
-        filters_layout.addWidget(line_group)
-        filters_layout.addWidget(reason_group)
+        # LPN / log text search
+        search_group = QGroupBox("Search")
+        search_layout = QHBoxLayout()
+        self.analysis_search = QLineEdit()
+        self.analysis_search.setPlaceholderText("LPN or log text...")
+        self.analysis_search.setClearButtonEnabled(True)
+        self.analysis_search.textChanged.connect(self.apply_analysis_table_filters)
+        search_layout.addWidget(self.analysis_search)
+        search_group.setLayout(search_layout)
         
-        # Apply filters button
-        self.apply_filters_btn = QPushButton("Apply Filters")
-        self.apply_filters_btn.clicked.connect(self.apply_filters)
-        filters_layout.addWidget(self.apply_filters_btn)
+        filters_layout.addWidget(reason_group)
+        filters_layout.addWidget(search_group)
         
         filters_card.content_layout.addLayout(filters_layout)
         layout.addWidget(filters_card)
         
-        # Analysis results table
-        self.analysis_table = QTableWidget()
-        self.analysis_table.setColumnCount(7)
-        self.analysis_table.setHorizontalHeaderLabels([
-            "Reject DateTime", "Source", "SKU", "Reject Reason", "LPN", 
-            "Log Text", "Quantity"
-        ])
+        # Analysis results table (rows are fetched a page at a time as it scrolls)
+        self.analysis_model = RejectTableModel(self)
+        self.analysis_table = QTableView()
+        self.analysis_table.setModel(self.analysis_model)
+        self.analysis_table.setSortingEnabled(True)
+        self.analysis_table.sortByColumn(0, Qt.AscendingOrder)
+        self.analysis_table.setMinimumHeight(500)
         
         header = self.analysis_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         self.analysis_table.verticalHeader().setVisible(False)
+        self.analysis_table.verticalHeader().setDefaultSectionSize(30)
         
         layout.addWidget(self.analysis_table)
         main_widget.setLayout(layout)
@@ -871,11 +3843,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "🔍 Analysis")
-        
-    def create_trends_tab(self):
-        tab = QWidget()
+        self.register_view(tab, None, self.update_analysis_table)
         
+    def create_trends_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -891,8 +3861,7 @@ class RejectedUnitsAnalyzer(QMainWindow):
         charts_card = ModernCard("📈 Period Trends", self.theme)
         
         # Create matplotlib figure for trends (only 2 charts now)
-        self.trends_figure = Figure(figsize=(12, 6), dpi=100)
-        self.trends_canvas = FigureCanvas(self.trends_figure)
+        self.trends_figure, self.trends_canvas, self.trends_panel = self.create_chart(figsize=(12, 6), dpi=100)
         charts_card.content_layout.addWidget(self.trends_canvas)
         
         layout.addWidget(charts_card)
@@ -904,11 +3873,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "📈 Trends")
-        
-    def create_production_analysis_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'trends', self.update_trends)
         
+    def create_production_analysis_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -923,8 +3890,7 @@ class RejectedUnitsAnalyzer(QMainWindow):
         production_card = ModernCard("🏭 Production Line & Product Analysis", self.theme)
         
         # Create matplotlib figure for production analysis
-        self.production_figure = Figure(figsize=(12, 8), dpi=100)
-        self.production_canvas = FigureCanvas(self.production_figure)
+        self.production_figure, self.production_canvas, self.production_panel = self.create_chart(figsize=(12, 8), dpi=100)
         production_card.content_layout.addWidget(self.production_canvas)
         
         layout.addWidget(production_card)
@@ -936,11 +3902,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "🏭 Production Analysis")
-        
-    def create_production_lines_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'production', self.update_production_analysis)
         
+    def create_production_lines_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -955,10 +3919,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         lines_card = ModernCard("🏭 Production Lines Consolidation", self.theme)
         
         # Create matplotlib figure for production lines
-        self.production_lines_figure = Figure(figsize=(12, 8), dpi=100)
-        self.production_lines_canvas = FigureCanvas(self.production_lines_figure)
+        self.production_lines_figure, self.production_lines_canvas, self.production_lines_panel = self.create_chart(figsize=(12, 8), dpi=100)
         lines_card.content_layout.addWidget(self.production_lines_canvas)
         
+        self.create_view_filters(layout, 'production_lines')
         layout.addWidget(lines_card)
         main_widget.setLayout(layout)
         scroll.setWidget(main_widget)
@@ -968,11 +3932,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "🏭 Production Lines")
-        
-    def create_advanced_tracking_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'production_lines', self.update_production_lines)
         
+    def create_advanced_tracking_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -987,8 +3949,7 @@ class RejectedUnitsAnalyzer(QMainWindow):
         category_card = ModernCard("🔍 Rejection Category Analysis", self.theme)
         
         # Create matplotlib figure for category analysis
-        self.category_figure = Figure(figsize=(12, 8), dpi=100)
-        self.category_canvas = FigureCanvas(self.category_figure)
+        self.category_figure, self.category_canvas, self.category_panel = self.create_chart(figsize=(12, 8), dpi=100)
         category_card.content_layout.addWidget(self.category_canvas)
         
         layout.addWidget(category_card)
@@ -1000,11 +3961,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "🔍 Advanced Tracking")
-        
-    def create_dimensional_rejects_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'categories', self.update_advanced_tracking)
         
+    def create_dimensional_rejects_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1019,10 +3978,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         dimensional_card = ModernCard("📏 Dimensional Rejects Analysis", self.theme)
         
         # Create matplotlib figure for dimensional analysis
-        self.dimensional_figure = Figure(figsize=(12, 8), dpi=100)
-        self.dimensional_canvas = FigureCanvas(self.dimensional_figure)
+        self.dimensional_figure, self.dimensional_canvas, self.dimensional_panel = self.create_chart(figsize=(12, 8), dpi=100)
         dimensional_card.content_layout.addWidget(self.dimensional_canvas)
         
+        self.create_view_filters(layout, 'dimensional')
         layout.addWidget(dimensional_card)
         main_widget.setLayout(layout)
         scroll.setWidget(main_widget)
@@ -1032,11 +3991,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "📏 Dimensional Rejects")
-        
-    def create_tag_tracking_rejects_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'dimensional', self.update_dimensional_rejects)
         
+    def create_tag_tracking_rejects_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1051,10 +4008,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tag_tracking_card = ModernCard("🏷️ Tag/Tracking Rejects Analysis", self.theme)
         
         # Create matplotlib figure for tag/tracking analysis
-        self.tag_tracking_figure = Figure(figsize=(12, 8), dpi=100)
-        self.tag_tracking_canvas = FigureCanvas(self.tag_tracking_figure)
+        self.tag_tracking_figure, self.tag_tracking_canvas, self.tag_tracking_panel = self.create_chart(figsize=(12, 8), dpi=100)
         tag_tracking_card.content_layout.addWidget(self.tag_tracking_canvas)
         
+        self.create_view_filters(layout, 'tag_tracking')
         layout.addWidget(tag_tracking_card)
         main_widget.setLayout(layout)
         scroll.setWidget(main_widget)
@@ -1064,11 +4021,9 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "🏷️ Tag/Tracking Rejects")
-        
-    def create_time_analysis_tab(self):
-        tab = QWidget()
+        self.register_view(tab, 'tag_tracking', self.update_tag_tracking_rejects)
         
+    def create_time_analysis_tab(self, tab):
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1083,10 +4038,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         time_card = ModernCard("⏰ Time-of-Day Analysis", self.theme)
         
         # Create matplotlib figure for time analysis
-        self.time_figure = Figure(figsize=(12, 8), dpi=100)
-        self.time_canvas = FigureCanvas(self.time_figure)
+        self.time_figure, self.time_canvas, self.time_panel = self.create_chart(figsize=(12, 8), dpi=100)
         time_card.content_layout.addWidget(self.time_canvas)
         
+        self.create_view_filters(layout, 'time')
         layout.addWidget(time_card)
         main_widget.setLayout(layout)
         scroll.setWidget(main_widget)
@@ -1096,11 +4051,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
         tab.setLayout(tab_layout)
-        self.tab_widget.addTab(tab, "⏰ Time Analysis")
+        self.register_view(tab, 'time', self.update_time_analysis)
         
-    def create_sku_analysis_tab(self):
+    def create_sku_analysis_tab(self, sku_tab):
         """Create SKU analysis tab"""
-        sku_tab = QWidget()
         sku_layout = QVBoxLayout()
         sku_tab.setLayout(sku_layout)
         
@@ -1126,8 +4080,7 @@ class RejectedUnitsAnalyzer(QMainWindow):
         sku_content_layout.addWidget(title)
         
         # Create matplotlib figure for SKU analysis
-        self.sku_figure = Figure(figsize=(12, 8), facecolor=self.theme.get_color('card_bg'))
-        self.sku_canvas = FigureCanvas(self.sku_figure)
+        self.sku_figure, self.sku_canvas, self.sku_panel = self.create_chart(figsize=(12, 8), facecolor=self.theme.get_color('card_bg'))
         self.sku_canvas.setStyleSheet(f"background-color: {self.theme.get_color('card_bg')};")
         
         sku_content_layout.addWidget(self.sku_canvas)
@@ -1135,11 +4088,10 @@ class RejectedUnitsAnalyzer(QMainWindow):
         sku_scroll.setWidget(sku_content)
         sku_layout.addWidget(sku_scroll)
         
-        self.tab_widget.addTab(sku_tab, "📦 Product Analysis")
+        self.register_view(sku_tab, 'products', self.update_sku_analysis)
     
-    def create_rejection_rate_tab(self):
+    def create_rejection_rate_tab(self, rejection_tab):
         """Create rejection rate analysis tab"""
-        rejection_tab = QWidget()
         rejection_layout = QVBoxLayout()
         rejection_tab.setLayout(rejection_layout)
         
@@ -1165,8 +4117,7 @@ class RejectedUnitsAnalyzer(QMainWindow):
         rejection_content_layout.addWidget(title)
         
         # Create matplotlib figure for rejection rate analysis
-        self.rejection_figure = Figure(figsize=(12, 10), facecolor=self.theme.get_color('card_bg'))
-        self.rejection_canvas = FigureCanvas(self.rejection_figure)
+        self.rejection_figure, self.rejection_canvas, self.rejection_panel = self.create_chart(figsize=(12, 10), facecolor=self.theme.get_color('card_bg'))
         self.rejection_canvas.setStyleSheet(f"background-color: {self.theme.get_color('card_bg')};")
         
         rejection_content_layout.addWidget(self.rejection_canvas)
@@ -1174,17 +4125,18 @@ class RejectedUnitsAnalyzer(QMainWindow):
         rejection_scroll.setWidget(rejection_content)
         rejection_layout.addWidget(rejection_scroll)
         
-        self.tab_widget.addTab(rejection_tab, "📊 Rejection Rates")
+        self.register_view(rejection_tab, 'rejection_rates', self.update_rejection_rate_analysis)
         
     def select_file(self):
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Select Rejected Units Excel File", "", 
+        filenames, _ = QFileDialog.getOpenFileNames(
+            self, "Select Rejected Units Excel File(s)", "", 
             "Excel files (*.xlsx *.xls);;All files (*.*)"
         )
         
-        if filename:
-            self.current_file = filename
-            self.status_label.setText(f"📁 File loaded: {os.path.basename(filename)}")
+        if filenames:
+            self.current_file = filenames[0]
+            self.current_files = filenames
+            self.status_label.setText(self.selected_files_text())
             self.process_btn.setEnabled(True)
             
             # Show clear button
@@ -1196,10 +4148,20 @@ class RejectedUnitsAnalyzer(QMainWindow):
             self.apply_theme()
     
     def clear_selected_file(self):
+        self.abort_ingest()
+        self.refresh_scheduler.cancel()
+        self.aggregation_runner.invalidate()
+        self.aggregate_cache.clear()
         self.current_file = None
+        self.current_files = []
         self.current_data = None
         self.filtered_data = None
+        self.engine = None
+        self.filter_selections = ()
+        self.filtered_cube = None
         self.analysis_results = None
+        self.incremental_checkbox.setChecked(False)
+        self.incremental_checkbox.setEnabled(False)
         self.status_label.setText("Ready to upload rejected units data...")
         self.process_btn.setEnabled(False)
         self.clear_file_btn.setVisible(False)
@@ -1210,1558 +4172,636 @@ class RejectedUnitsAnalyzer(QMainWindow):
         self.clear_displays()
         
     def clear_displays(self):
-        # Clear metrics
-        for i in reversed(range(self.metrics_layout.count())):
-            self.metrics_layout.itemAt(i).widget().setParent(None)
-            
-        # Clear summary
-        self.summary_text.setText("No data loaded. Please upload a rejected units file.")
-        
-        
-        # Clear trends chart
-        self.trends_figure.clear()
-        self.trends_canvas.draw()
-        
-        # Clear production analysis chart
-        self.production_figure.clear()
-        self.production_canvas.draw()
-        
-        # Clear production lines chart
-        self.production_lines_figure.clear()
-        self.production_lines_canvas.draw()
-        
-        # Clear advanced tracking chart
-        self.category_figure.clear()
-        self.category_canvas.draw()
-        
-        # Clear dimensional rejects chart
-        self.dimensional_figure.clear()
-        self.dimensional_canvas.draw()
-        
-        # Clear tag/tracking rejects chart
-        self.tag_tracking_figure.clear()
-        self.tag_tracking_canvas.draw()
-        
-        # Clear time analysis chart
-        self.time_figure.clear()
-        self.time_canvas.draw()
-        
-        # Clear SKU analysis chart
-        self.sku_figure.clear()
-        self.sku_canvas.draw()
-        
-        # Clear rejection rate analysis chart
-        self.rejection_figure.clear()
-        self.rejection_canvas.draw()
-        
-        
-    def process_data(self):
-        if not self.current_file:
-            QMessageBox.warning(self, "Error", "Please select a file first")
-            return
-            
-        try:
-            # Load the Excel file and detect the correct sheet
-            excel_file = pd.ExcelFile(self.current_file)
-            sheet_names = excel_file.sheet_names
-            
-            # Look for the sheet with the actual data (contains 'Reject datetime' column)
-            data_sheet = None
-            for sheet_name in sheet_names:
-                try:
-                    # Read just the header to check columns
-                    temp_df = pd.read_excel(self.current_file, sheet_name=sheet_name, nrows=0)
-                    if 'Reject datetime' in temp_df.columns:
-                        data_sheet = sheet_name
-                        break
-                except:
-                    continue
-            
-            if data_sheet is None:
-                QMessageBox.warning(self, "Invalid Data Format", 
-                                  "Could not find a sheet with 'Reject datetime' column.\n\n"
-                                  "Please ensure this is a valid E80 rejected units export.")
-                return
-                
-            # Load the data from the correct sheet
-            df = pd.read_excel(self.current_file, sheet_name=data_sheet)
-            
-            # Basic validation - check for expected columns (E80 format)
-            expected_columns = ['Reject datetime', 'Source', 'Reject reason']
-            missing_columns = [col for col in expected_columns if col not in df.columns]
-            
-            if missing_columns:
-                QMessageBox.warning(self, "Invalid Data Format", 
-                                  f"Missing expected columns: {', '.join(missing_columns)}\n\n"
-                                  f"Please ensure this is a valid E80 rejected units export.\n"
-                                  f"Expected columns: Reject datetime, Source, Reject reason, Lpn, Sku, Log text")
-                return
-                
-            # Clean and process the data
-            df = self.clean_data(df)
-            self.current_data = df
-            self.filtered_data = df.copy()  # Initialize filtered data
-            
-            # Perform analysis
-            self.analysis_results = self.perform_analysis(df)
-            
-            # Update filters first, then all displays
-            self.update_filters()
-            self.update_dashboard()
-            self.update_trends()
-            self.update_production_analysis()
-            self.update_production_lines()
-            self.update_advanced_tracking()
-            self.update_dimensional_rejects()
-            self.update_tag_tracking_rejects()
-            self.update_time_analysis()
-            self.update_sku_analysis()
-            self.update_rejection_rate_analysis()
-            
-            # Filter checkboxes are now populated in update_filters method
-            
-            # Switch to Dashboard tab (2nd page)
-            self.tab_widget.setCurrentIndex(1)
-            
-            self.status_label.setText(f"Data analyzed successfully! (Sheet: {data_sheet}) - Switched to Dashboard tab")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error processing file: {str(e)}")
-            
-    def clean_data(self, df):
-        """Clean and standardize the data"""
-        # Convert date column to datetime (E80 format uses 'Reject datetime')
-        if 'Reject datetime' in df.columns:
-            df['Reject datetime'] = pd.to_datetime(df['Reject datetime'], errors='coerce')
-            # Create a standard 'Date' column for compatibility - handle NaT values
-            df['Date'] = df['Reject datetime'].apply(lambda x: x.date() if pd.notna(x) else None)
-            
-        # Fill missing values
-        df = df.fillna('Unknown')
-        
-        # Standardize text columns (E80 format)
-        text_columns = ['Source', 'Reject reason', 'Lpn', 'Sku', 'Log text']
-        for col in text_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
-        
-        # Replace SKU numbers with product descriptions
-        df = self.replace_skus_with_descriptions(df)
-                
-        # Create quantity column (each row represents 1 rejected unit)
-        df['Quantity'] = 1
-        
-        return df
-    
-    def replace_skus_with_descriptions(self, df):
-        """Replace SKU numbers with product descriptions from the master file"""
-        if 'Sku' not in df.columns:
-            return df
-            
-        try:
-            # Load the SKU master file
-            sku_master_path = 'E80 Item Master - Master Excel.xlsx'
-            sku_master = pd.read_excel(sku_master_path)
-            
-            # Create a mapping dictionary from SKU number to description
-            # Convert both to strings for consistent matching
-            sku_mapping = dict(zip(sku_master['Name'].astype(str), sku_master['Description']))
-            
-            # Convert rejected SKUs to proper format (they come as floats ending with .0)
-            # Handle the .0 format and 'Unknown' values properly
-            df['Sku'] = df['Sku'].astype(str).str.replace('.0', '').str.replace('nan', 'Unknown')
-            
-            # Only convert numeric SKUs to int, leave 'Unknown' as is
-            numeric_mask = df['Sku'].str.match(r'^\d+$', na=False)
-            df.loc[numeric_mask, 'Sku'] = df.loc[numeric_mask, 'Sku'].astype(int).astype(str)
-            
-            # Replace SKU numbers with descriptions
-            df['Sku'] = df['Sku'].map(sku_mapping).fillna(df['Sku'])
-            
-            # Count how many were successfully mapped
-            mapped_count = len(df[df['Sku'].isin(sku_master['Description'])])
-            total_skus = len(df[df['Sku'] != '0'])  # Exclude NaN values converted to '0'
-            
-            print(f"Successfully mapped {mapped_count} out of {total_skus} SKU records to descriptions")
-            print(f"Available mappings: {len(sku_mapping)} SKU numbers")
-            
-        except Exception as e:
-            print(f"Warning: Could not load SKU master file: {e}")
-            print("Continuing with original SKU numbers...")
-            
-        return df
-        
-    def perform_analysis(self, df):
-        """Perform comprehensive analysis of rejected units"""
-        analysis = {}
-        
-        # Basic statistics
-        analysis['total_rejections'] = len(df)
-        analysis['total_quantity'] = df['Quantity'].sum() if 'Quantity' in df.columns else 0
-        analysis['date_range'] = (df['Date'].min(), df['Date'].max()) if 'Date' in df.columns else (None, None)
-        
-        # Rejection reasons analysis (E80 format uses 'Reject reason')
-        if 'Reject reason' in df.columns:
-            analysis['rejection_reasons'] = df['Reject reason'].value_counts().to_dict()
-            
-        # Source/Line analysis (E80 format uses 'Source')
-        if 'Source' in df.columns:
-            analysis['line_breakdown'] = df['Source'].value_counts().to_dict()
-            
-        # Time-based analysis - convert to periods
-        if 'Date' in df.columns and 'Reject datetime' in df.columns:
-            # Use the datetime column for proper time analysis
-            df['Month'] = df['Reject datetime'].dt.to_period('M')
-            analysis['monthly_trends'] = df.groupby('Month')['Quantity'].sum().to_dict()
-            
-            # Add period analysis based on Pepsi's period calendar
-            df['Period'] = self.get_period_from_date(df['Reject datetime'])
-            analysis['period_trends'] = df.groupby('Period')['Quantity'].sum().to_dict()
-            
-        # Product analysis (E80 format uses 'Sku')
-        if 'Sku' in df.columns:
-            analysis['product_breakdown'] = df['Sku'].value_counts().to_dict()
-            
-        return analysis
-        
-    def get_period_from_date(self, date_series):
-        """Convert dates to Pepsi period numbers based on the period calendar"""
-        periods = []
-        for date in date_series:
-            if pd.isna(date):
-                periods.append('Unknown')
-                continue
-                
-            # Convert to date if it's datetime
-            if hasattr(date, 'date'):
-                date = date.date()
-            
-            # Period definitions based on the calendar
-            if date >= pd.Timestamp('2024-12-29').date() and date <= pd.Timestamp('2025-01-25').date():
-                periods.append('Period 1')
-            elif date >= pd.Timestamp('2025-01-26').date() and date <= pd.Timestamp('2025-02-22').date():
-                periods.append('Period 2')
-            elif date >= pd.Timestamp('2025-02-23').date() and date <= pd.Timestamp('2025-03-22').date():
-                periods.append('Period 3')
-            elif date >= pd.Timestamp('2025-03-23').date() and date <= pd.Timestamp('2025-04-19').date():
-                periods.append('Period 4')
-            elif date >= pd.Timestamp('2025-04-20').date() and date <= pd.Timestamp('2025-05-17').date():
-                periods.append('Period 5')
-            elif date >= pd.Timestamp('2025-05-18').date() and date <= pd.Timestamp('2025-06-14').date():
-                periods.append('Period 6')
-            elif date >= pd.Timestamp('2025-06-15').date() and date <= pd.Timestamp('2025-07-12').date():
-                periods.append('Period 7')
-            elif date >= pd.Timestamp('2025-07-13').date() and date <= pd.Timestamp('2025-08-09').date():
-                periods.append('Period 8')
-            elif date >= pd.Timestamp('2025-08-10').date() and date <= pd.Timestamp('2025-09-06').date():
-                periods.append('Period 9')
-            elif date >= pd.Timestamp('2025-09-07').date() and date <= pd.Timestamp('2025-10-04').date():
-                periods.append('Period 10')
-            elif date >= pd.Timestamp('2025-10-05').date() and date <= pd.Timestamp('2025-11-01').date():
-                periods.append('Period 11')
-            elif date >= pd.Timestamp('2025-11-02').date() and date <= pd.Timestamp('2025-11-29').date():
-                periods.append('Period 12')
-            elif date >= pd.Timestamp('2025-11-30').date() and date <= pd.Timestamp('2025-12-27').date():
-                periods.append('Period 13')
-            else:
-                periods.append('Unknown')
-                
-        return periods
-        
-    def update_dashboard(self):
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing metrics
-        for i in reversed(range(self.metrics_layout.count())):
-            self.metrics_layout.itemAt(i).widget().setParent(None)
-            
-        # Create metric cards with filtered data
-        total_rejections = len(self.filtered_data)
-        
-        # Get top rejection reason from filtered data
-        top_reason = "Unknown"
-        if 'Reject reason' in self.filtered_data.columns:
-            rejection_counts = self.filtered_data['Reject reason'].value_counts()
-            if len(rejection_counts) > 0:
-                top_reason = rejection_counts.index[0]
-        
-        # Calculate date range from filtered data
-        date_range = "No Data"
-        if 'Reject datetime' in self.filtered_data.columns:
-            # Remove NaT values and get valid dates
-            valid_dates = self.filtered_data['Reject datetime'].dropna()
-            if len(valid_dates) > 0:
-                min_date = valid_dates.min().strftime('%m/%d/%Y')
-                max_date = valid_dates.max().strftime('%m/%d/%Y')
-                date_range = f"{min_date} - {max_date}"
-            
-        metrics = [
-            ("Total Rejections", f"{total_rejections:,}", self.theme.get_color('danger')),
-            ("Top Reason", top_reason[:20], self.theme.get_color('info')),
-            ("Date Range", date_range, self.theme.get_color('success')),
-            ("Est. Lost Time", "TBD - Ask Oscar", self.theme.get_color('warning')),
-            ("Est. Cost Impact", "TBD - Ask Oscar", self.theme.get_color('purple'))
-        ]
-        
-        for i, (title, value, color) in enumerate(metrics):
-            card = MetricCard(title, value, color, self.theme)
-            self.metrics_layout.addWidget(card, 0, i)
-        
-    def update_trends(self):
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.trends_figure.clear()
-        
-        # Create subplots (only 2 charts now)
-        ax1 = self.trends_figure.add_subplot(1, 2, 1)
-        ax2 = self.trends_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme for plots
-        self.trends_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Plot 1: Rejection reasons pie chart (filtered) with accurate percentages
-        if 'Reject reason' in filtered_data.columns:
-            rejection_counts = filtered_data['Reject reason'].value_counts()
-            total_rejections = rejection_counts.sum()
-            
-            # Get top 5 reasons
-            top_reasons = rejection_counts.head(5)
-            other_count = rejection_counts.iloc[5:].sum() if len(rejection_counts) > 5 else 0
-            
-            # Prepare data for pie chart
-            pie_labels = list(top_reasons.index)
-            pie_counts = list(top_reasons.values)
-            
-            # Add "Other" slice if there are more than 5 reasons
-            if other_count > 0:
-                pie_labels.append('One of the other 20 Reasons')
-                pie_counts.append(other_count)
-            
-            colors = ['#e74c3c', '#f39c12', '#f1c40f', '#2ecc71', '#3498db', '#9b59b6']
-            wedges, texts, autotexts = ax1.pie(pie_counts, labels=pie_labels, autopct='%1.1f%%', 
-                                             colors=colors[:len(pie_labels)], 
-                                             textprops={'color': 'white', 'fontweight': 'bold'})
-            ax1.set_title('Top Rejection Reasons', color='white', fontweight='bold', fontsize=16)
-            
-        # Plot 2: Period trends (filtered)
-        if 'Reject datetime' in filtered_data.columns:
-            # Calculate period trends for filtered data
-            filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-            period_trends = filtered_data.groupby('Period')['Quantity'].sum()
-            
-            # Sort periods numerically to ensure correct chronological order
-            # Extract number from "Period X" format for proper sorting
-            periods = sorted(period_trends.keys(), key=lambda x: int(x.split()[-1]))
-           
-            quantities = [period_trends[period] for period in periods]
-            
-            # Create clean period labels (just the numbers)
-            period_labels = [period.split()[-1] for period in periods]
-            
-            ax2.plot(periods, quantities, marker='o', color='#e74c3c', linewidth=3, markersize=8)
-            ax2.set_title('Period Rejection Trends', color='white', fontweight='bold', fontsize=16)
-            ax2.set_xlabel('Period', color='white', fontsize=12)
-            ax2.set_ylabel('Rejected Quantity', color='white', fontsize=12)
-            ax2.set_xticks(range(len(periods)))
-            ax2.set_xticklabels(period_labels)
-            ax2.tick_params(axis='x', rotation=0, colors='white')
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white')
-
-            # Add value labels on line plot points
-            for i, (period, quantity) in enumerate(zip(periods, quantities)):
-                ax2.text(i, quantity + max(quantities) * 0.02, f'{int(quantity)}', 
-                        ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-        # Style all axes
-        for ax in [ax1, ax2]:
-            ax.tick_params(colors='white')
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.trends_figure.tight_layout()
-        self.trends_canvas.draw()
-        
-    def update_production_analysis(self):
-        """Update production line and product analysis"""
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.production_figure.clear()
-        
-        # Create subplots
-        ax1 = self.production_figure.add_subplot(1, 2, 1)
-        ax2 = self.production_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.production_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Plot 1: Line breakdown (using filtered data)
-        if 'Source' in filtered_data.columns:
-            line_counts = filtered_data['Source'].value_counts()
-            
-            bars = ax1.bar(line_counts.index, line_counts.values, color='#3498db', edgecolor='white', linewidth=1)
-            ax1.set_title('Rejections by Production Line', color='white', fontweight='bold', fontsize=16)
-            ax1.set_ylabel('Number of Rejections', color='white', fontsize=12)
-            ax1.tick_params(axis='x', colors='white', rotation=45)
-            ax1.tick_params(axis='y', colors='white')
-            ax1.grid(True, alpha=0.3, color='white', axis='y')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-        # Plot 2: Product breakdown (using filtered data)
-        if 'Sku' in filtered_data.columns:
-            product_counts = filtered_data['Sku'].value_counts().head(8)
-            
-            bars = ax2.barh(product_counts.index, product_counts.values, color='#9b59b6', edgecolor='white', linewidth=1)
-            ax2.set_title('Rejections by Product', color='white', fontweight='bold', fontsize=16)
-            ax2.set_xlabel('Number of Rejections', color='white', fontsize=12)
-            ax2.tick_params(axis='x', colors='white')
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white', axis='x')
-            
-            # Add value labels on horizontal bars
-            for bar in bars:
-                width = bar.get_width()
-                ax2.text(width + 0.1, bar.get_y() + bar.get_height()/2.,
-                        f'{int(width)}', ha='left', va='center', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-        # Style all axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.production_figure.tight_layout()
-        self.production_canvas.draw()
-        
-    def update_production_lines(self):
-        """Update production lines consolidation analysis"""
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.production_lines_figure.clear()
-        
-        # Create subplots
-        ax1 = self.production_lines_figure.add_subplot(1, 2, 1)
-        ax2 = self.production_lines_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.production_lines_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Apply period filter
-        if hasattr(self, 'production_lines_period_checkboxes') and self.production_lines_period_checkboxes:
-            selected_periods = [period for period, checkbox in self.production_lines_period_checkboxes.items() if checkbox.isChecked()]
-            if selected_periods:
-                filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-                filtered_data = filtered_data[filtered_data['Period'].isin(selected_periods)]
-        
-        # Apply line filter
-        if hasattr(self, 'production_lines_line_checkboxes') and self.production_lines_line_checkboxes:
-            selected_lines = [line for line, checkbox in self.production_lines_line_checkboxes.items() if checkbox.isChecked()]
-            if selected_lines:
-                filtered_data = filtered_data[filtered_data['Source'].isin(selected_lines)]
-        
-        # Define line consolidation mapping based on EOL numbers
-        def consolidate_line(source):
-            """Consolidate production lines based on EOL numbers"""
-            if pd.isna(source):
-                return 'Unknown'
-            
-            source_str = str(source).upper()
-            
-            # Check for IBC first (Inbound Conveyor by Car Wash)
-            if 'IBC' in source_str:
-                return 'IBC (Inbound Conveyor)'
-            # Check for EOL patterns
-            elif 'EOL01' in source_str or 'EOL_01' in source_str:
-                return 'Aquafina/Propel 1'
-            elif 'EOL02' in source_str or 'EOL_02' in source_str:
-                return 'Aquafina/Propel 2'
-            elif 'EOL03' in source_str or 'EOL_03' in source_str:
-                return 'Can Line 3'
-            elif 'EOL04' in source_str or 'EOL_04' in source_str:
-                return 'Can Line 4'
-            elif 'EOL05' in source_str or 'EOL_05' in source_str:
-                return 'Bottle Line 5'
-            elif 'EOL06' in source_str or 'EOL_06' in source_str:
-                return 'Bottle Line 6'
-            # Check for simple number patterns (but not if it's IBC)
-            elif source_str == '1' or source_str.endswith('1'):
-                return 'Aquafina/Propel 1'
-            elif source_str == '2' or source_str.endswith('2'):
-                return 'Aquafina/Propel 2'
-            elif source_str == '3' or source_str.endswith('3'):
-                return 'Can Line 3'
-            elif source_str == '4' or source_str.endswith('4'):
-                return 'Can Line 4'
-            elif source_str == '5' or source_str.endswith('5'):
-                return 'Bottle Line 5'
-            elif source_str == '6' or source_str.endswith('6'):
-                return 'Bottle Line 6'
-            else:
-                return source_str  # Keep original if no pattern matches
-        
-        # Create consolidated data
-        if 'Source' in filtered_data.columns:
-            # Map individual lines to consolidated lines
-            filtered_data['Consolidated_Line'] = filtered_data['Source'].apply(consolidate_line)
-            
-            # Plot 1: Consolidated production lines
-            consolidated_counts = filtered_data['Consolidated_Line'].value_counts()
-            
-            colors = ['#e74c3c', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e']
-            bars = ax1.bar(consolidated_counts.index, consolidated_counts.values, 
-                          color=colors[:len(consolidated_counts)], edgecolor='white', linewidth=1)
-            ax1.set_title('Rejections by Consolidated Production Line', color='white', fontweight='bold', fontsize=14)
-            ax1.set_ylabel('Number of Rejections', color='white', fontsize=12)
-            ax1.tick_params(axis='x', colors='white', rotation=45)
-            ax1.tick_params(axis='y', colors='white')
-            ax1.grid(True, alpha=0.3, color='white', axis='y')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-            # Plot 2: Detailed breakdown showing individual lines within consolidated groups
-            detailed_data = {}
-            detailed_labels = []
-            detailed_counts = []
-            detailed_colors = []
-            
-            color_palette = ['#e74c3c', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e', '#e67e22', '#95a5a6']
-            
-            for consolidated_line in consolidated_counts.index:
-                # Get individual lines that map to this consolidated line
-                individual_lines = filtered_data[filtered_data['Consolidated_Line'] == consolidated_line]['Source'].value_counts()
-                
-                for i, (individual_line, count) in enumerate(individual_lines.items()):
-                    detailed_labels.append(f"{individual_line}\n({consolidated_line})")
-                    detailed_counts.append(count)
-                    detailed_colors.append(color_palette[i % len(color_palette)])
-            
-            bars = ax2.bar(range(len(detailed_labels)), detailed_counts, color=detailed_colors, edgecolor='white', linewidth=1)
-            ax2.set_title('Individual Lines Within Consolidated Groups', color='white', fontweight='bold', fontsize=14)
-            ax2.set_ylabel('Number of Rejections', color='white', fontsize=12)
-            ax2.set_xticks(range(len(detailed_labels)))
-            ax2.set_xticklabels(detailed_labels, rotation=45, ha='right')
-            ax2.tick_params(axis='x', colors='white')
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white', axis='y')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.8))
-        else:
-            # No data available
-            ax1.text(0.5, 0.5, 'No Production Line Data Available', ha='center', va='center', 
-                    transform=ax1.transAxes, color='white', fontsize=16)
-            ax2.text(0.5, 0.5, 'No Production Line Data Available', ha='center', va='center', 
-                    transform=ax2.transAxes, color='white', fontsize=16)
-        
-        # Style all axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.production_lines_figure.tight_layout()
-        self.production_lines_canvas.draw()
-        
-    def update_advanced_tracking(self):
-        """Update advanced tracking with rejection reason categories"""
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.category_figure.clear()
-        
-        # Create subplots
-        ax1 = self.category_figure.add_subplot(1, 2, 1)
-        ax2 = self.category_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.category_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Categorize rejection reasons using filtered data
-        dimensional_issues = []
-        tag_tracking_issues = []
-        uncategorized_issues = []
-        
-        if 'Reject reason' in filtered_data.columns:
-            rejection_counts = filtered_data['Reject reason'].value_counts()
-            for reason, count in rejection_counts.items():
-                if pd.isna(reason):
-                    continue
-                reason_lower = str(reason).lower()
-                if any(keyword in reason_lower for keyword in ['dimension', 'size', 'measurement', 'weight', 'position', 'height', 'width', 'length', 'tolerance', 'maximum']):
-                    dimensional_issues.append((reason, count))
-                elif any(keyword in reason_lower for keyword in ['tag', 'label', 'lpn', 'barcode', 'duplicate', 'unit data not found', 'tracking', 'expected', 'exist', 'system', 'error', 'timeout', 'failed', 'check error']):
-                    tag_tracking_issues.append((reason, count))
-                else:
-                    uncategorized_issues.append((reason, count))
-        
-        # Show uncategorized issues for user to categorize
-        if uncategorized_issues:
-            print("Uncategorized rejection reasons that need categorization:")
-            for reason, count in uncategorized_issues:
-                print(f"  - '{reason}': {count} occurrences")
-        
-        # Plot 1: Category breakdown (two categories now)
-        categories = ['Dimensional Issues', 'Tag/Tracking/System Issues']
-        category_counts = [sum(count for _, count in dimensional_issues),
-                          sum(count for _, count in tag_tracking_issues)]
+        # Nothing left to render lazily
+        self.dirty_views.clear()
+        self.prerender_timer.stop()
         
-        colors = ['#e74c3c', '#f39c12']
-        wedges, texts, autotexts = ax1.pie(category_counts, labels=categories, autopct='%1.1f%%', 
-                                          colors=colors, textprops={'color': 'white', 'fontweight': 'bold'})
-        ax1.set_title('Rejection Categories', color='white', fontweight='bold', fontsize=14)
+        # Clear metrics
+        for i in reversed(range(self.metrics_layout.count())):
+            self.metrics_layout.itemAt(i).widget().setParent(None)
         
-        # Plot 2: Top reasons by category
-        all_issues = dimensional_issues + tag_tracking_issues
-        all_issues.sort(key=lambda x: x[1], reverse=True)
         
-        top_reasons = all_issues[:8]
-        reasons = [reason for reason, _ in top_reasons]
-        counts = [count for _, count in top_reasons]
+        # Clear the charts of every tab built so far
+        for panel in self.chart_panels:
+            panel.clear()
         
-        bars = ax2.barh(reasons, counts, color='#3498db', edgecolor='white', linewidth=1)
-        ax2.set_title('Top Rejection Reasons', color='white', fontweight='bold', fontsize=14)
-        ax2.set_xlabel('Number of Rejections', color='white', fontsize=12)
-        ax2.tick_params(axis='x', colors='white')
-        ax2.tick_params(axis='y', colors='white')
-        ax2.grid(True, alpha=0.3, color='white', axis='x')
-        
-        # Add value labels on horizontal bars
-        for bar in bars:
-            width = bar.get_width()
-            ax2.text(width + 0.1, bar.get_y() + bar.get_height()/2.,
-                    f'{int(width)}', ha='left', va='center', color='white', fontweight='bold',
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-        
-        # Style axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.category_figure.tight_layout()
-        self.category_canvas.draw()
+        # Clear analysis table
+        if self.analysis_model is not None:
+            self.analysis_model.set_frame(pd.DataFrame())
         
-    def update_dimensional_rejects(self):
-        """Update dimensional rejects analysis"""
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.dimensional_figure.clear()
-        
-        # Create subplots
-        ax1 = self.dimensional_figure.add_subplot(1, 2, 1)
-        ax2 = self.dimensional_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.dimensional_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Apply period filter
-        if hasattr(self, 'dimensional_period_checkboxes') and self.dimensional_period_checkboxes:
-            selected_periods = [period for period, checkbox in self.dimensional_period_checkboxes.items() if checkbox.isChecked()]
-            if selected_periods:
-                filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-                filtered_data = filtered_data[filtered_data['Period'].isin(selected_periods)]
-        
-        # Apply line filter
-        if hasattr(self, 'dimensional_line_checkboxes') and self.dimensional_line_checkboxes:
-            selected_lines = [line for line, checkbox in self.dimensional_line_checkboxes.items() if checkbox.isChecked()]
-            if selected_lines:
-                filtered_data = filtered_data[filtered_data['Source'].isin(selected_lines)]
-        
-        # Define dimensional keywords
-        dimensional_keywords = ['dimension', 'size', 'measurement', 'weight', 'position', 'height', 'width', 'length', 'tolerance', 'maximum']
-        
-        # Filter for dimensional rejects
-        dimensional_data = filtered_data[
-            filtered_data['Reject reason'].str.contains('|'.join(dimensional_keywords), case=False, na=False)
-        ]
         
-        if len(dimensional_data) > 0:
-            # Plot 1: Dimensional rejection reasons breakdown
-            reason_counts = dimensional_data['Reject reason'].value_counts().head(10)
-            
-            bars = ax1.barh(range(len(reason_counts)), reason_counts.values, color='#e74c3c', edgecolor='white', linewidth=1)
-            ax1.set_yticks(range(len(reason_counts)))
-            ax1.set_yticklabels([reason[:30] + '...' if len(reason) > 30 else reason for reason in reason_counts.index], color='white')
-            ax1.set_xlabel('Number of Rejections', color='white', fontsize=12)
-            ax1.set_title('Dimensional Rejection Reasons', color='white', fontweight='bold', fontsize=16)
-            ax1.tick_params(axis='x', colors='white')
-            ax1.grid(True, alpha=0.3, color='white', axis='x')
-            
-            # Add value labels on horizontal bars
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                ax1.text(width + 0.1, bar.get_y() + bar.get_height()/2.,
-                        f'{int(width)}', ha='left', va='center', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-            # Plot 2: Dimensional rejects by production line
-            line_counts = dimensional_data['Source'].value_counts()
-            
-            bars = ax2.bar(line_counts.index, line_counts.values, color='#f39c12', edgecolor='white', linewidth=1)
-            ax2.set_xlabel('Production Line', color='white', fontsize=12)
-            ax2.set_ylabel('Number of Rejections', color='white', fontsize=12)
-            ax2.set_title('Dimensional Rejects by Production Line', color='white', fontweight='bold', fontsize=16)
-            ax2.tick_params(axis='x', colors='white', rotation=45)
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white', axis='y')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-        else:
-            # No dimensional data
-            ax1.text(0.5, 0.5, 'No Dimensional Rejects Found', ha='center', va='center', 
-                    transform=ax1.transAxes, color='white', fontsize=16)
-            ax2.text(0.5, 0.5, 'No Dimensional Rejects Found', ha='center', va='center', 
-                    transform=ax2.transAxes, color='white', fontsize=16)
-        
-        # Style all axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.dimensional_figure.tight_layout()
-        self.dimensional_canvas.draw()
+    def selected_files_text(self):
+        if len(self.current_files) > 1:
+            return f"📁 {len(self.current_files)} files loaded: {', '.join(os.path.basename(path) for path in self.current_files)}"
+        return f"📁 File loaded: {os.path.basename(self.current_file)}"
         
-    def update_tag_tracking_rejects(self):
-        """Update tag/tracking rejects analysis"""
-        if self.filtered_data is None:
+    def process_data(self):
+        if not self.current_file:
+            QMessageBox.warning(self, "Error", "Please select a file first")
+            return
+        if self.ingest_thread is not None:
             return
             
-        # Clear existing plots
-        self.tag_tracking_figure.clear()
-        
-        # Create subplots
-        ax1 = self.tag_tracking_figure.add_subplot(1, 2, 1)
-        ax2 = self.tag_tracking_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.tag_tracking_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Apply period filter
-        if hasattr(self, 'tag_tracking_period_checkboxes') and self.tag_tracking_period_checkboxes:
-            selected_periods = [period for period, checkbox in self.tag_tracking_period_checkboxes.items() if checkbox.isChecked()]
-            if selected_periods:
-                filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-                filtered_data = filtered_data[filtered_data['Period'].isin(selected_periods)]
-        
-        # Apply line filter
-        if hasattr(self, 'tag_tracking_line_checkboxes') and self.tag_tracking_line_checkboxes:
-            selected_lines = [line for line, checkbox in self.tag_tracking_line_checkboxes.items() if checkbox.isChecked()]
-            if selected_lines:
-                filtered_data = filtered_data[filtered_data['Source'].isin(selected_lines)]
-        
-        # Define tag/tracking keywords
-        tag_tracking_keywords = ['tag', 'label', 'lpn', 'barcode', 'duplicate', 'unit data not found', 'tracking', 'expected', 'exist']
-        
-        # Filter for tag/tracking rejects
-        tag_tracking_data = filtered_data[
-            filtered_data['Reject reason'].str.contains('|'.join(tag_tracking_keywords), case=False, na=False)
-        ]
-        
-        if len(tag_tracking_data) > 0:
-            # Plot 1: Tag/Tracking rejection reasons breakdown
-            reason_counts = tag_tracking_data['Reject reason'].value_counts().head(10)
-            
-            bars = ax1.barh(range(len(reason_counts)), reason_counts.values, color='#3498db', edgecolor='white', linewidth=1)
-            ax1.set_yticks(range(len(reason_counts)))
-            ax1.set_yticklabels([reason[:30] + '...' if len(reason) > 30 else reason for reason in reason_counts.index], color='white')
-            ax1.set_xlabel('Number of Rejections', color='white', fontsize=12)
-            ax1.set_title('Tag/Tracking Rejection Reasons', color='white', fontweight='bold', fontsize=16)
-            ax1.tick_params(axis='x', colors='white')
-            ax1.grid(True, alpha=0.3, color='white', axis='x')
-            
-            # Add value labels on horizontal bars
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                ax1.text(width + 0.1, bar.get_y() + bar.get_height()/2.,
-                        f'{int(width)}', ha='left', va='center', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-            # Plot 2: Tag/Tracking rejects by production line
-            line_counts = tag_tracking_data['Source'].value_counts()
-            
-            bars = ax2.bar(line_counts.index, line_counts.values, color='#9b59b6', edgecolor='white', linewidth=1)
-            ax2.set_xlabel('Production Line', color='white', fontsize=12)
-            ax2.set_ylabel('Number of Rejections', color='white', fontsize=12)
-            ax2.set_title('Tag/Tracking Rejects by Production Line', color='white', fontweight='bold', fontsize=16)
-            ax2.tick_params(axis='x', colors='white', rotation=45)
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white', axis='y')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
+        # Load, clean and analyze on a worker thread so the window stays responsive
+        self.ingest_thread = QThread(self)
+        base = None
+        if self.incremental_checkbox.isChecked() and self.current_data is not None:
+            base = (self.current_data, self.analysis_results)
+        if len(self.current_files) > 1:
+            self.ingest_worker = MultiFileIngestWorker(self.current_files, self.data_cache, self.pipeline.cache_key(),
+                                                       self.pipeline.clean_data, self.pipeline.perform_analysis, base=base,
+                                                       build_engine=self.pipeline.build_engine)
         else:
-            # No tag/tracking data
-            ax1.text(0.5, 0.5, 'No Tag/Tracking Rejects Found', ha='center', va='center', 
-                    transform=ax1.transAxes, color='white', fontsize=16)
-            ax2.text(0.5, 0.5, 'No Tag/Tracking Rejects Found', ha='center', va='center', 
-                    transform=ax2.transAxes, color='white', fontsize=16)
-        
-        # Style all axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.tag_tracking_figure.tight_layout()
-        self.tag_tracking_canvas.draw()
+            self.ingest_worker = IngestWorker(self.current_file, self.data_cache, self.pipeline.cache_key(),
+                                              self.pipeline.clean_data, self.pipeline.perform_analysis, base=base,
+                                              store=self.pipeline.store_cleaned, build_engine=self.pipeline.build_engine)
+        self.ingest_worker.moveToThread(self.ingest_thread)
+        self.ingest_thread.started.connect(self.ingest_worker.run)
+        self.ingest_worker.progress.connect(self.on_ingest_progress)
+        self.ingest_worker.loaded.connect(self.on_ingest_loaded)
+        self.ingest_worker.invalid.connect(self.on_ingest_invalid)
+        self.ingest_worker.failed.connect(self.on_ingest_failed)
+        self.ingest_worker.cancelled.connect(self.on_ingest_cancelled)
+        self.ingest_thread.finished.connect(self.ingest_worker.deleteLater)
+        self.ingest_thread.finished.connect(self.ingest_thread.deleteLater)
         
-    def update_time_analysis(self):
-        """Update time-of-day analysis"""
-        if self.filtered_data is None:
-            return
-            
-        # Clear existing plots
-        self.time_figure.clear()
-        
-        # Create subplots
-        ax1 = self.time_figure.add_subplot(1, 2, 1)
-        ax2 = self.time_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.time_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Apply period filter
-        if hasattr(self, 'time_period_checkboxes') and self.time_period_checkboxes:
-            selected_periods = [period for period, checkbox in self.time_period_checkboxes.items() if checkbox.isChecked()]
-            if selected_periods:
-                filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-                filtered_data = filtered_data[filtered_data['Period'].isin(selected_periods)]
-        
-        # Apply line filter
-        if hasattr(self, 'time_line_checkboxes') and self.time_line_checkboxes:
-            selected_lines = [line for line, checkbox in self.time_line_checkboxes.items() if checkbox.isChecked()]
-            if selected_lines:
-                filtered_data = filtered_data[filtered_data['Source'].isin(selected_lines)]
-        
-        # Extract hour from datetime
-        if 'Reject datetime' in filtered_data.columns:
-            filtered_data['Hour'] = filtered_data['Reject datetime'].dt.hour
-            filtered_data['DayOfWeek'] = filtered_data['Reject datetime'].dt.day_name()
-            
-            # Plot 1: Rejections by hour
-            hourly_counts = filtered_data['Hour'].value_counts().sort_index()
-            bars = ax1.bar(hourly_counts.index, hourly_counts.values, color='#e74c3c', 
-                          edgecolor='white', linewidth=1)
-            ax1.set_title('Rejections by Hour of Day', color='white', fontweight='bold', fontsize=12)
-            ax1.set_xlabel('Hour', color='white')
-            ax1.set_ylabel('Number of Rejections', color='white')
-            ax1.tick_params(axis='x', colors='white')
-            ax1.tick_params(axis='y', colors='white')
-            ax1.grid(True, alpha=0.3, color='white', axis='y')
-
-            worst_hour = hourly_counts.idxmax()
-            best_hour = hourly_counts.idxmin()
-            
-            comparison_labels = [f'Worst Hour\n({worst_hour}:00)'+'\n', f'Best Hour\n({best_hour}:00)'+'\n']
-            colors = ['#e74c3c', '#2ecc71']
-            
-            max_height = bars[0].get_height()
-            min_height = bars[0].get_height()
-            for bar in bars:
-                if bar.get_height() > max_height:
-                    max_height = bar.get_height()
-                if bar.get_height() < min_height:
-                    min_height = bar.get_height()
-
-            # Add value labels on top of bars
-            for bar in bars:
-                height = bar.get_height()
-                if height == max_height:
-                    color = colors[0]
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        comparison_labels[0] + f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor=color, alpha=0.8))
-                elif height == min_height:
-                    color = colors[1]
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        comparison_labels[1] + f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor='green', alpha=0.8))
-                else:
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                            f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                            bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.8))
-                
-            
-            # Plot 2: Rejections by day of week
-            dow_counts = filtered_data['DayOfWeek'].value_counts()
-            dow_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            dow_counts = dow_counts.reindex([d for d in dow_order if d in dow_counts.index])
+        self.process_btn.setEnabled(False)
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(True)
+        self.cancel_load_btn.setVisible(True)
+        self.ingest_thread.start()
+        
+    def cancel_ingest(self):
+        """Ask the running ingestion worker to stop after its current batch"""
+        if self.ingest_worker is not None:
+            self.ingest_worker.cancel()
+            self.statusBar().showMessage("Cancelling load...")
             
-            bars = ax2.bar(dow_counts.index, dow_counts.values, color='#3498db', 
-                          edgecolor='white', linewidth=1)
-            ax2.set_title('Rejections by Day of Week', color='white', fontweight='bold', fontsize=12)
-            ax2.set_xlabel('Day of Week', color='white')
-            ax2.set_ylabel('Number of Rejections', color='white')
-            ax2.tick_params(axis='x', colors='white', rotation=45)
-            ax2.tick_params(axis='y', colors='white')
-            ax2.grid(True, alpha=0.3, color='white', axis='y')
+    def finish_ingest(self):
+        """Tear down the worker thread and restore the upload controls"""
+        if self.ingest_thread is not None:
+            self.ingest_thread.quit()
+            self.ingest_thread.wait()
+        self.ingest_thread = None
+        self.ingest_worker = None
+        self.load_progress.setVisible(False)
+        self.cancel_load_btn.setVisible(False)
+        self.process_btn.setEnabled(self.current_file is not None)
+        
+    def on_ingest_progress(self, percent, message):
+        if percent < 0:
+            self.load_progress.setRange(0, 0)  # Busy indicator when the row count is unknown
+        else:
+            self.load_progress.setRange(0, 100)
+            self.load_progress.setValue(percent)
+        self.statusBar().showMessage(message)
+        self.status_label.setText(message)
+        
+    def on_ingest_loaded(self, result):
+        self.finish_ingest()
+        source = ", loaded from cache" if result['from_cache'] else ""
+        if 'files' in result:
+            source += f", {len(result['files'])} exports merged, skipped {result['merged_duplicates']:,} rows found in an earlier export"
+        if 'appended' in result:
+            source += f", appended {result['appended']:,} new rows, skipped {result['duplicates']:,} duplicates"
+        stats = {} if result['from_cache'] else self.sku_master.last_stats
+        if 'files' in result:
+            # Each export was resolved in its own process; add up their SKU matches
+            file_stats = [f['sku_stats'] for f in result['files'] if f['sku_stats']]
+            errors = [f['error'] for f in file_stats if 'error' in f]
+            stats = {}
+            if errors:
+                stats = {'error': errors[0]}
+            elif file_stats:
+                stats = {'hits': sum(f['hits'] for f in file_stats), 'rows': sum(f['rows'] for f in file_stats)}
+        if 'error' in stats:
+            source += f", SKU master unavailable: {stats['error']}"
+        elif stats:
+            source += f", {stats['hits']:,} of {stats['rows']:,} SKUs matched the item master"
+        status = f"Data analyzed successfully! (Sheet: {result['sheet']}{source}) - Switched to Dashboard tab"
+        if 'files' in result:
+            # Rows/second of each export's parse, one line per file
+            status += ''.join(f"\n{describe_export_throughput(f)}" for f in result['files'])
+        try:
+            self.show_analysis(result['engine'], result['analysis'], status)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error processing file: {str(e)}")
+        loaded_from = f"{len(self.current_files)} files" if len(self.current_files) > 1 else os.path.basename(self.current_file)
+        self.statusBar().showMessage(f"Loaded {len(result['data']):,} rows from {loaded_from}", 5000)
+        
+    def on_ingest_invalid(self, message):
+        self.finish_ingest()
+        self.statusBar().clearMessage()
+        self.status_label.setText(self.selected_files_text())
+        QMessageBox.warning(self, "Invalid Data Format", message)
+        
+    def on_ingest_failed(self, message):
+        self.finish_ingest()
+        self.statusBar().clearMessage()
+        self.status_label.setText(self.selected_files_text())
+        QMessageBox.critical(self, "Error", f"Error processing file: {message}")
+        
+    def on_ingest_cancelled(self):
+        self.finish_ingest()
+        self.statusBar().showMessage("Load cancelled", 5000)
+        self.status_label.setText("Load cancelled - click Analyze Data to try again")
+        
+    def abort_ingest(self):
+        """Stop a running load without reporting back (file cleared or window closing)"""
+        if self.ingest_worker is not None:
+            self.ingest_worker.blockSignals(True)
+            self.ingest_worker.cancel()
+            self.finish_ingest()
+            self.statusBar().clearMessage()
+        
+    def closeEvent(self, event):
+        self.abort_ingest()
+        self.aggregation_runner.shutdown()
+        super().closeEvent(event)
             
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{int(height)}', ha='center', va='bottom', color='white', fontweight='bold', fontsize=8,
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.8))
-
-        # Style all axes
-        for ax in [ax1, ax2]:
-            for spine in ax.spines.values():
-                spine.set_color('white')
-                
-        self.time_figure.tight_layout()
-        self.time_canvas.draw()
-        
-
-
-    def update_page_from_prefix(self, prefix):
-        """Update the appropriate page based on the prefix"""
-        if prefix == "production":
-            self.update_production_analysis()
-        elif prefix == "production_lines":
-            self.update_production_lines()
-        elif prefix == "advanced_tracking":
-            self.update_advanced_tracking()
-        elif prefix == "dimensional":
-            self.update_dimensional_rejects()
-        elif prefix == "tag_tracking":
-            self.update_tag_tracking_rejects()
-        elif prefix == "time":
-            self.update_time_analysis()
-        elif prefix == "sku":
-            self.update_sku_analysis()
-        elif prefix == "rejection":
-            self.update_rejection_rate_analysis()
-
-    def update_sku_analysis(self):
-        """Update Product analysis"""
-        if self.filtered_data is None:
+    def show_analysis(self, engine, analysis, status_message):
+        """Display an analyzed dataset (its engine was built by the ingest worker) in every tab"""
+        self.engine = engine
+        self.current_data = self.engine.data
+        self.filtered_data = FilteredRows(self.current_data)  # Every row until the filters resolve
+        self.analysis_results = analysis
+        self.incremental_checkbox.setEnabled(True)
+        self.refresh_scheduler.cancel()  # Every tab is redrawn below anyway
+        self.aggregation_runner.invalidate()
+        self.dataset_version += 1
+        self.aggregate_cache.clear()
+        
+        # Update filters first; each chart tab then renders when it is shown
+        self.update_filters()
+        self.mark_views_dirty()
+        
+        # Filter checkboxes are now populated in update_filters method
+        
+        # Switch to Dashboard tab (2nd page)
+        self.tab_widget.setCurrentIndex(1)
+        self.render_visible_view()
+        
+        self.status_label.setText(status_message)
+        
+    def update_dashboard(self, metrics=None):
+        metrics = metrics if metrics is not None else self.view_metrics('dashboard')
+        if metrics is None:
             return
             
-        # Clear existing plots
-        self.sku_figure.clear()
-        
-        # Create subplots
-        ax1 = self.sku_figure.add_subplot(1, 1, 1)
-        # ax2 = self.sku_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.sku_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Plot 1: Top Products by rejection count (with full product descriptions)
-        num_products = 20
-        total_rejections = filtered_data['Sku'].value_counts().sum()
-        top_rejections = filtered_data['Sku'].value_counts().head(num_products).sum()
-        percentage_top = (top_rejections / total_rejections) * 100
-        if 'Sku' in filtered_data.columns:
-            sku_counts = filtered_data['Sku'].value_counts().head(num_products)
-            
-            bars = ax1.bar(range(len(sku_counts)), sku_counts.values, color='#e74c3c', edgecolor='white', linewidth=1)
-            ax1.set_title('Top Products by Rejection Count (Top ' + str(num_products) + ' account for ' + f'{percentage_top:.3f}' + '% of all rejections)', color='white', fontsize=12, fontweight='bold')
-            ax1.set_xlabel('Product', color='white')
-            ax1.set_ylabel('Number of Rejections', color='white')
-            ax1.set_xticks(range(len(sku_counts)))
-            ax1.set_xticklabels(sku_counts.index, rotation=-90, color='white')
-            ax1.tick_params(colors='white')
-            ax1.grid(True, alpha=0.3, color='white')
-            
-            # Add value labels on bars
-            for i, (bar, value) in enumerate(zip(bars, sku_counts.values)):
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, 
-                        str(value), ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.8))
-            
-            # Set dark theme for subplot
-            ax1.set_facecolor(self.theme.get_color('card_bg'))
-            for spine in ax1.spines.values():
-                spine.set_color('white')
-        
-        # # Plot 2: Pie chart of all Products
-        # if 'Sku' in filtered_data.columns:
-        #     sku_counts = filtered_data['Sku'].value_counts()
-            
-        #     # Get top 8 SKUs and group the rest as "Other"
-        #     top_skus = sku_counts.head(8)
-        #     other_count = sku_counts.iloc[8:].sum() if len(sku_counts) > 8 else 0
-            
-        #     if other_count > 0:
-        #         pie_data = list(top_skus.values) + [other_count]
-        #         pie_labels = list(top_skus.index) + ['Other']
-        #     else:
-        #         pie_data = list(top_skus.values)
-        #         pie_labels = list(top_skus.index)
-            
-        #     colors = ['#e74c3c', '#3498db', '#f39c12', '#2ecc71', '#9b59b6', '#1abc9c', '#34495e', '#e67e22', '#95a5a6']
-            
-        #     wedges, texts, autotexts = ax2.pie(pie_data, labels=pie_labels, autopct='%1.1f%%', 
-        #                                       colors=colors[:len(pie_data)], startangle=90)
-        #     ax2.set_title('Product Distribution', color='white', fontsize=12, fontweight='bold')
-            
-        #     # Set text colors to white
-        #     for text in texts:
-        #         text.set_color('white')
-        #     for autotext in autotexts:
-        #         autotext.set_color('white')
-        #         autotext.set_fontweight('bold')
-            
-        #     # Set dark theme for subplot
-        #     ax2.set_facecolor(self.theme.get_color('card_bg'))
+        # Create metric cards with filtered data
+        total_rejections = metrics['total_rejections']
+        top_reason = metrics['top_reason'] or "Unknown"
         
-        # # Plot 3: Product rejection rate by production line (with full product descriptions)
-        # if 'Sku' in filtered_data.columns and 'Source' in filtered_data.columns:
-        #     # Get top 5 SKUs
-        #     top_skus = filtered_data['Sku'].value_counts().head(5).index
-            
-        #     # Create heatmap-style data
-        #     line_sku_data = filtered_data.groupby(['Source', 'Sku']).size().unstack(fill_value=0)
-        #     line_sku_data = line_sku_data[top_skus]  # Only show top SKUs
-            
-        #     # Create bar chart showing SKU rejections by line
-        #     x = np.arange(len(line_sku_data.index))
-        #     width = 0.15
-            
-        #     for i, sku in enumerate(top_skus):
-        #         ax3.bar(x + i * width, line_sku_data[sku], width, 
-        #                label=sku, edgecolor='white', linewidth=1)
-            
-        #     ax3.set_title('Product Rejections by Production Line', color='white', fontsize=12, fontweight='bold')
-        #     ax3.set_xlabel('Production Line', color='white')
-        #     ax3.set_ylabel('Number of Rejections', color='white')
-        #     ax3.set_xticks(x + width * 2)
-        #     ax3.set_xticklabels(line_sku_data.index, rotation=45, color='white')
-        #     ax3.tick_params(colors='white')
-        #     ax3.legend(fontsize=8)
-        #     ax3.grid(True, alpha=0.3, color='white')
+        # Date range of the filtered data
+        date_range = "No Data"
+        min_date, max_date = metrics['date_range']
+        if min_date is not None:
+            date_range = f"{min_date.strftime('%m/%d/%Y')} - {max_date.strftime('%m/%d/%Y')}"
             
-        #     # Set dark theme for subplot
-        #     ax3.set_facecolor(self.theme.get_color('card_bg'))
-        #     for spine in ax3.spines.values():
-        #         spine.set_color('white')
+        cards = [
+            ("Total Rejections", f"{total_rejections:,}", self.theme.get_color('danger')),
+            ("Top Reason", top_reason[:20], self.theme.get_color('info')),
+            ("Date Range", date_range, self.theme.get_color('success')),
+            ("Est. Lost Time", "TBD - Ask Oscar", self.theme.get_color('warning')),
+            ("Est. Cost Impact", "TBD - Ask Oscar", self.theme.get_color('purple'))
+        ]
         
-        # # Plot 4: Product rejection trends by period (with full product descriptions)
-        # if 'Sku' in filtered_data.columns and 'Period' in filtered_data.columns:
-        #     # Get top 3 SKUs for trend analysis
-        #     top_skus = filtered_data['Sku'].value_counts().head(3).index
-            
-        #     # Create period series data
-        #     for i, sku in enumerate(top_skus):
-        #         sku_data = filtered_data[filtered_data['Sku'] == sku]
-        #         period_counts = sku_data.groupby('Period').size()
-                
-        #         # Sort periods numerically
-        #         period_counts = period_counts.sort_index()
-                
-        #         ax4.plot(period_counts.index, period_counts.values, 
-        #                 marker='o', linewidth=2, label=sku, markersize=4)
-            
-        #     ax4.set_title('Product Rejection Trends by Period', color='white', fontsize=12, fontweight='bold')
-        #     ax4.set_xlabel('Period', color='white')
-        #     ax4.set_ylabel('Rejections per Period', color='white')
-        #     ax4.tick_params(colors='white')
-        #     ax4.legend(fontsize=8)
-        #     ax4.grid(True, alpha=0.3, color='white')
-            
-        #     # Set dark theme for subplot
-        #     ax4.set_facecolor(self.theme.get_color('card_bg'))
-        #     for spine in ax4.spines.values():
-        #         spine.set_color('white')
+        # Cards are created once and their values updated on later refreshes
+        if self.metrics_layout.count() != len(cards):
+            for i in reversed(range(self.metrics_layout.count())):
+                self.metrics_layout.itemAt(i).widget().setParent(None)
+            for i, (title, value, color) in enumerate(cards):
+                card = MetricCard(title, value, color, self.theme)
+                self.metrics_layout.addWidget(card, 0, i)
+        else:
+            for i, (title, value, color) in enumerate(cards):
+                self.metrics_layout.itemAt(i).widget().set_value(value)
         
-        self.sku_figure.tight_layout()
-        self.sku_canvas.draw()
-    
-    def update_rejection_rate_analysis(self):
-        """Update rejection rate analysis"""
+    def update_analysis_table(self):
+        """Show the globally filtered rows in the Analysis table"""
         if self.filtered_data is None:
             return
             
-        # Clear existing plots
-        self.rejection_figure.clear()
-        
-        # Create 2 subplots - overall rate and per production line
-        ax1 = self.rejection_figure.add_subplot(1, 2, 1)
-        ax2 = self.rejection_figure.add_subplot(1, 2, 2)
-        
-        # Set dark theme
-        self.rejection_figure.patch.set_facecolor(self.theme.get_color('card_bg'))
-        
-        # Use the globally filtered data
-        filtered_data = self.filtered_data.copy()
-        
-        # Production data - EXACT numbers Oscar provided
-        production_totals = {
-            'Aquafina/Propel 1': 36720,  # Aquafina/Propel 1
-            'Aquafina/Propel 2': 34407,  # Aquafina/Propel 2
-            'Can Line 3': 54269,         # Can line 3
-            'Can Line 4': 70981,         # Can line 4
-            'Bottle Line 5': 62106,      # Bottle line 5
-            'Bottle Line 6': 53596       # Bottle line 6
-        }
-        
-        # Use the EXACT same consolidation method as the production lines tab
-        def consolidate_line(source):
-            """Consolidate production lines based on EOL numbers - EXACT COPY from production lines tab"""
-            if pd.isna(source):
-                return 'Unknown'
-            
-            source_str = str(source).upper()
-            
-            # Check for IBC first (Inbound Conveyor by Car Wash)
-            if 'IBC' in source_str:
-                return 'IBC (Inbound Conveyor)'
-            # Check for EOL patterns
-            elif 'EOL01' in source_str or 'EOL_01' in source_str:
-                return 'Aquafina/Propel 1'
-            elif 'EOL02' in source_str or 'EOL_02' in source_str:
-                return 'Aquafina/Propel 2'
-            elif 'EOL03' in source_str or 'EOL_03' in source_str:
-                return 'Can Line 3'
-            elif 'EOL04' in source_str or 'EOL_04' in source_str:
-                return 'Can Line 4'
-            elif 'EOL05' in source_str or 'EOL_05' in source_str:
-                return 'Bottle Line 5'
-            elif 'EOL06' in source_str or 'EOL_06' in source_str:
-                return 'Bottle Line 6'
-            # Check for simple number patterns (but not if it's IBC)
-            elif source_str == '1' or source_str.endswith('1'):
-                return 'Aquafina/Propel 1'
-            elif source_str == '2' or source_str.endswith('2'):
-                return 'Aquafina/Propel 2'
-            elif source_str == '3' or source_str.endswith('3'):
-                return 'Can Line 3'
-            elif source_str == '4' or source_str.endswith('4'):
-                return 'Can Line 4'
-            elif source_str == '5' or source_str.endswith('5'):
-                return 'Bottle Line 5'
-            elif source_str == '6' or source_str.endswith('6'):
-                return 'Bottle Line 6'
-            else:
-                return source_str  # Keep original if no pattern matches
-        
-        # Calculate rejection rates by line
-        if 'Source' in filtered_data.columns:
-            # Use the EXACT same consolidation method as production lines tab
-            filtered_data['Consolidated_Line'] = filtered_data['Source'].apply(consolidate_line)
-            consolidated_rejections = filtered_data['Consolidated_Line'].value_counts().to_dict()
-            
-            # Calculate rejection rates for all production lines (including those with 0 rejections)
-            rejection_rates = {}
-            rejection_details = {}  # Store raw numbers for display
-            
-            # Initialize all production lines
-            for line in production_totals:
-                rejection_count = consolidated_rejections.get(line, 0)  # 0 if no rejections
-                production_total = production_totals[line]
-                rejection_rate = (rejection_count / production_total) * 100
-                rejection_rates[line] = rejection_rate
-                rejection_details[line] = {
-                    'rejections': rejection_count,
-                    'production': production_total,
-                    'rate': rejection_rate
-                }
-            
-            # Plot 1: Overall rejection rate (single bar chart)
-            total_rejections = len(filtered_data)
-            total_production = sum(production_totals.values())
-            overall_rate = (total_rejections / total_production) * 100
-            
-            categories = ['Overall Rejection Rate']
-            values = [overall_rate]
-            colors = ['#e74c3c']
-            
-            bars = ax1.bar(categories, values, color=colors, edgecolor='white', linewidth=1)
-            ax1.set_title(f'Overall Rejection Rate: {overall_rate:.2f}%', color='white', fontsize=16, fontweight='bold')
-            ax1.set_ylabel('Rejection Rate (%)', color='white')
-            ax1.tick_params(colors='white')
-            ax1.grid(True, alpha=0.3, color='white')
-            
-            # Add value label on bar with raw numbers
-            for bar, value in zip(bars, values):
-                label_text = f'{value:.2f}%\n({total_rejections:,}/{total_production:,})'
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
-                        label_text, ha='center', va='bottom', color='white', fontweight='bold',
-                        bbox=dict(boxstyle='round,pad=0.3', facecolor='black', alpha=0.7), fontsize=12)
-            
-            # Set dark theme for subplot
-            ax1.set_facecolor(self.theme.get_color('card_bg'))
-            for spine in ax1.spines.values():
-                spine.set_color('white')
-            
-            # Plot 2: Rejection rates by production line
-            if rejection_rates:
-                lines = list(rejection_rates.keys())
-                rates = list(rejection_rates.values())
-                
-                bars = ax2.bar(range(len(lines)), rates, color='#e74c3c', edgecolor='white', linewidth=1)
-                ax2.set_title('Rejection Rate by Production Line', color='white', fontsize=16, fontweight='bold')
-                ax2.set_xlabel('Production Line', color='white')
-                ax2.set_ylabel('Rejection Rate (%)', color='white')
-                ax2.set_xticks(range(len(lines)))
-                ax2.set_xticklabels(lines, rotation=45, color='white')
-                ax2.tick_params(colors='white')
-                ax2.grid(True, alpha=0.3, color='white')
-                
-                # Add value labels on bars with raw numbers
-                for i, (bar, value) in enumerate(zip(bars, rates)):
-                    line = lines[i]
-                    details = rejection_details[line]
-                    label_text = f'{value:.2f}%\n({details["rejections"]:,}/{details["production"]:,})'
-                    ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(rates)*0.01,
-                            label_text, ha='center', va='bottom', color='white', fontweight='bold',
-                            bbox=dict(boxstyle='round,pad=0.3', facecolor='black', alpha=0.7), fontsize=10)
-                
-                # Set dark theme for subplot
-                ax2.set_facecolor(self.theme.get_color('card_bg'))
-                for spine in ax2.spines.values():
-                    spine.set_color('white')
-            else:
-                # If no rejection rates calculated, show a message
-                ax2.text(0.5, 0.5, 'No production line data available\nfor rejection rate calculation', 
-                        ha='center', va='center', transform=ax2.transAxes, 
-                        color='white', fontsize=14, fontweight='bold')
-                ax2.set_title('Rejection Rate by Production Line', color='white', fontsize=16, fontweight='bold')
-                ax2.set_facecolor(self.theme.get_color('card_bg'))
-        
-        self.rejection_figure.tight_layout()
-        self.rejection_canvas.draw()
+        # Reasons present in the filtered rows; keep the chosen one if it is still there
+        reasons = sorted({MISSING_LABEL if pd.isna(reason) else str(reason) for reason in self.filtered_data.column('Reject reason').unique()})
+        current_reason = self.reason_filter.currentText()
+        self.reason_filter.blockSignals(True)
+        self.reason_filter.clear()
+        self.reason_filter.addItems(["All Reasons"] + reasons)
+        self.reason_filter.setCurrentText(current_reason if current_reason in reasons else "All Reasons")
+        self.reason_filter.blockSignals(False)
+        
+        self.analysis_model.filters = {}
+        if self.reason_filter.currentText() != "All Reasons":
+            self.analysis_model.filters['Reject reason'] = self.reason_filter.currentText()
+        self.analysis_model.search = self.analysis_search.text()
+        self.analysis_model.set_frame(self.filtered_data.data, self.filtered_data.rows)
+        
+    def apply_analysis_table_filters(self, *_):
+        reason = self.reason_filter.currentText()
+        self.analysis_model.filters = {} if reason in ("", "All Reasons") else {'Reject reason': reason}
+        self.analysis_model.set_search(self.analysis_search.text())
         
     def update_filters(self):
         if self.current_data is None:
             return
             
-        # Calculate periods for the data
-        self.current_data['Period'] = self.get_period_from_date(self.current_data['Reject datetime'])
+        # Periods were assigned when the analytics engine was built
         available_periods = set(self.current_data['Period'].unique())
-        available_lines = sorted(self.current_data['Source'].unique())
-        available_skus = sorted(self.current_data['Sku'].unique())
-        
-        # Period definitions
-        period_definitions = {
-            'Period 1': 'Dec 29, 2024 - Jan 25, 2025',
-            'Period 2': 'Jan 26, 2025 - Feb 22, 2025',
-            'Period 3': 'Feb 23, 2025 - Mar 22, 2025',
-            'Period 4': 'Mar 23, 2025 - Apr 19, 2025',
-            'Period 5': 'Apr 20, 2025 - May 17, 2025',
-            'Period 6': 'May 18, 2025 - Jun 14, 2025',
-            'Period 7': 'Jun 15, 2025 - Jul 12, 2025',
-            'Period 8': 'Jul 13, 2025 - Aug 9, 2025',
-            'Period 9': 'Aug 10, 2025 - Sep 6, 2025',
-            'Period 10': 'Sep 7, 2025 - Oct 4, 2025',
-            'Period 11': 'Oct 5, 2025 - Nov 1, 2025',
-            'Period 12': 'Nov 2, 2025 - Nov 29, 2025',
-            'Period 13': 'Nov 30, 2025 - Dec 27, 2025'
-        }
+        # Lines and SKUs as the filter index knows them (missing ones as MISSING_LABEL)
+        available_lines = sorted(self.engine.index.values.get('Source', []), key=str)
+        available_skus = sorted(self.engine.index.values.get('Sku', []), key=str)
         
-        # Update global period checkboxes
-        for checkbox in self.global_period_checkboxes.values():
-            checkbox.setParent(None)
-        self.global_period_checkboxes.clear()
+        # Show every period of the fiscal years present in the data
+        data_years = sorted({self.period_calendar.fiscal_year_of_label(p) for p in available_periods
+                             if p != PepsiPeriodCalendar.UNKNOWN})
         
-        # Create periods in correct order (1-13)
-        for i in range(1, 14):
-            period = f"Period {i}"
-            if period in period_definitions:
-                date_range = period_definitions[period]
-                
-                # Create container for checkbox and solo button
-                period_container = QWidget()
-                period_container_layout = QHBoxLayout()
-                period_container_layout.setContentsMargins(0, 0, 0, 0)
-                
-                checkbox = QCheckBox(f"{period}: {date_range}")
-                if period in available_periods:
-                    checkbox.setChecked(True)
-                    checkbox.setEnabled(True)
-                    checkbox.setStyleSheet("color: white;")
-                else:
-                    checkbox.setChecked(False)
-                    checkbox.setEnabled(False)
-                    checkbox.setStyleSheet("color: gray;")
-                checkbox.stateChanged.connect(self.update_all_tabs)
-                
-                # Add solo button
-                solo_btn = QPushButton("Solo")
-                solo_btn.setMaximumWidth(50)
-                solo_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #f39c12;
-                        color: white;
-                        border: none;
-                        padding: 2px 5px;
-                        border-radius: 2px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #e67e22;
-                    }}
-                """)
-                solo_btn.clicked.connect(lambda checked, p=period: self.solo_period(p))
-                
-                period_container_layout.addWidget(checkbox)
-                period_container_layout.addWidget(solo_btn)
-                period_container_layout.addStretch()
-                period_container.setLayout(period_container_layout)
-                
-                self.global_period_checkboxes[period] = checkbox
-                self.global_period_widget_layout.addWidget(period_container)
-        
-        # Update global line checkboxes
-        for checkbox in self.global_line_checkboxes.values():
-            checkbox.setParent(None)
-        self.global_line_checkboxes.clear()
-        
-        for line in available_lines:
-            if pd.notna(line):
-                # Create container for checkbox and solo button
-                line_container = QWidget()
-                line_container_layout = QHBoxLayout()
-                line_container_layout.setContentsMargins(0, 0, 0, 0)
-                
-                checkbox = QCheckBox(str(line))
-                # Set IBC01_SHAPE to be unchecked by default
-                if str(line) == "IBC01_SHAPE":
-                    checkbox.setChecked(False)
-                else:
-                    checkbox.setChecked(True)
-                checkbox.stateChanged.connect(self.update_all_tabs)
-                
-                # Add solo button
-                solo_btn = QPushButton("Solo")
-                solo_btn.setMaximumWidth(50)
-                solo_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #f39c12;
-                        color: white;
-                        border: none;
-                        padding: 2px 5px;
-                        border-radius: 2px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #e67e22;
-                    }}
-                """)
-                solo_btn.clicked.connect(lambda checked, l=line: self.solo_line(l))
-                
-                line_container_layout.addWidget(checkbox)
-                line_container_layout.addWidget(solo_btn)
-                line_container_layout.addStretch()
-                line_container.setLayout(line_container_layout)
-                
-                self.global_line_checkboxes[line] = checkbox
-                self.global_line_widget_layout.addWidget(line_container)
-        
-        # Update global SKU checkboxes
-        for checkbox in self.global_sku_checkboxes.values():
-            checkbox.setParent(None)
-        self.global_sku_checkboxes.clear()
-        
-        for sku in available_skus:
-            if pd.notna(sku):
-                # Create container for checkbox and solo button
-                sku_container = QWidget()
-                sku_container_layout = QHBoxLayout()
-                sku_container_layout.setContentsMargins(0, 0, 0, 0)
-                
-                checkbox = QCheckBox(str(sku))
-                checkbox.setChecked(True)
-                checkbox.stateChanged.connect(self.update_all_tabs)
-                
-                # Add solo button
-                solo_btn = QPushButton("Solo")
-                solo_btn.setMaximumWidth(50)
-                solo_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #f39c12;
-                        color: white;
-                        border: none;
-                        padding: 2px 5px;
-                        border-radius: 2px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #e67e22;
-                    }}
-                """)
-                solo_btn.clicked.connect(lambda checked, s=sku: self.solo_sku(s))
-                
-                sku_container_layout.addWidget(checkbox)
-                sku_container_layout.addWidget(solo_btn)
-                sku_container_layout.addStretch()
-                sku_container.setLayout(sku_container_layout)
-                
-                self.global_sku_checkboxes[sku] = checkbox
-                self.global_sku_widget_layout.addWidget(sku_container)
+        # Update global period list: periods in calendar order, those without data greyed out
+        periods = self.period_calendar.periods_of_years(data_years)
+        self.global_period_model.set_items(periods, [f"{period}: {self.period_calendar.describe(period)}" for period in periods],
+                                           enabled=[period in available_periods for period in periods])
+        
+        # Update global line list (IBC01_SHAPE is unchecked by default)
+        lines = [line for line in available_lines if pd.notna(line)]
+        self.global_line_model.set_items(lines, checked=[str(line) != "IBC01_SHAPE" for line in lines])
+        
+        # Update global SKU list
+        self.global_sku_model.set_items([sku for sku in available_skus if pd.notna(sku)])
+        
+        # Tab filters start out empty for the new data
+        for view in self.view_filter_models:
+            self.populate_view_filters(view)
         
         # Initialize filtered data with all data selected
         self.apply_filters()
         
     def select_all_periods(self):
-        """Select all period checkboxes"""
-        for checkbox in self.global_period_checkboxes.values():
-            if checkbox.isEnabled():
-                checkbox.setChecked(True)
-        self.update_all_tabs()
+        """Select all periods that have data"""
+        self.global_period_model.set_checked(True)
         
     def reset_periods(self):
-        """Reset all period checkboxes to unchecked"""
-        for checkbox in self.global_period_checkboxes.values():
-            checkbox.setChecked(False)
-        self.update_all_tabs()
+        """Reset all periods to unchecked"""
+        self.global_period_model.set_checked(False)
         
     def select_all_lines(self):
-        """Select all production line checkboxes"""
-        for checkbox in self.global_line_checkboxes.values():
-            checkbox.setChecked(True)
-        self.update_all_tabs()
+        """Select all production lines"""
+        self.global_line_model.set_checked(True)
         
     def reset_lines(self):
-        """Reset all production line checkboxes to unchecked"""
-        for checkbox in self.global_line_checkboxes.values():
-            checkbox.setChecked(False)
-        self.update_all_tabs()
+        """Reset all production lines to unchecked"""
+        self.global_line_model.set_checked(False)
         
     def select_all_skus(self):
-        """Select all SKU checkboxes"""
-        for checkbox in self.global_sku_checkboxes.values():
-            checkbox.setChecked(True)
-        self.update_all_tabs()
+        """Select all SKUs"""
+        self.global_sku_model.set_checked(True)
         
     def reset_skus(self):
-        """Reset all SKU checkboxes to unchecked"""
-        for checkbox in self.global_sku_checkboxes.values():
-            checkbox.setChecked(False)
-        self.update_all_tabs()
+        """Reset all SKUs to unchecked"""
+        self.global_sku_model.set_checked(False)
         
     def solo_period(self, period):
         """Solo a specific period (uncheck all others)"""
-        for p, checkbox in self.global_period_checkboxes.items():
-            checkbox.setChecked(p == period)
-        self.update_all_tabs()
+        self.global_period_model.solo(period)
         
     def solo_line(self, line):
         """Solo a specific production line (uncheck all others)"""
-        for l, checkbox in self.global_line_checkboxes.items():
-            checkbox.setChecked(l == line)
-        self.update_all_tabs()
+        self.global_line_model.solo(line)
         
     def solo_sku(self, sku):
         """Solo a specific SKU (uncheck all others)"""
-        for s, checkbox in self.global_sku_checkboxes.items():
-            checkbox.setChecked(s == sku)
-        self.update_all_tabs()
+        self.global_sku_model.solo(sku)
         
     def update_all_tabs(self):
         """Update all tabs when global filters change"""
-        # Update filtered data
-        self.apply_filters()
-        
-        # Update all tabs
-        self.update_dashboard()
-        self.update_trends()
-        self.update_production_analysis()
-        self.update_production_lines()
-        self.update_advanced_tracking()
-        self.update_dimensional_rejects()
-        self.update_tag_tracking_rejects()
-        self.update_time_analysis()
-        self.update_sku_analysis()
-            
-    def apply_filters(self):
         if self.current_data is None:
             return
             
-        # Apply global filters
-        filtered_data = self.current_data.copy()
-        
-        # Apply period filter
-        if 'Reject datetime' in filtered_data.columns and hasattr(self, 'global_period_checkboxes'):
-            # Get selected periods
-            selected_periods = [period for period, checkbox in self.global_period_checkboxes.items() if checkbox.isChecked()]
-            
-            if selected_periods:
-                # Calculate periods for all data
-                filtered_data['Period'] = self.get_period_from_date(filtered_data['Reject datetime'])
-                # Filter to only selected periods
-                filtered_data = filtered_data[filtered_data['Period'].isin(selected_periods)]
-        
-        # Apply line filter (E80 format uses 'Source') - multi-select
-        if hasattr(self, 'global_line_checkboxes'):
-            selected_lines = [line for line, checkbox in self.global_line_checkboxes.items() if checkbox.isChecked()]
-            if selected_lines:
-                filtered_data = filtered_data[filtered_data['Source'].isin(selected_lines)]
-        
-        # Apply SKU filter - multi-select
-        if hasattr(self, 'global_sku_checkboxes'):
-            selected_skus = [sku for sku, checkbox in self.global_sku_checkboxes.items() if checkbox.isChecked()]
-            if selected_skus:
-                filtered_data = filtered_data[filtered_data['Sku'].isin(selected_skus)]
+        # Revisited filter states come straight from the cache
+        snapshot = self.current_filter_snapshot()
+        key = filter_state_key(self.dataset_version, snapshot.selections)
+        cached = self.aggregate_cache.get(key)
+        if cached is not None:
+            self.aggregation_runner.invalidate()  # Anything in flight is for an older state
+            self.show_filtered(*cached, selections=snapshot.selections)
+            return
             
+        # Otherwise resolve them (and the visible tab's metrics) on the worker pool;
+        # on_filters_resolved redraws the visible tab
+        self.pending_filter_key = key
+        self.pending_snapshot = snapshot
+        self.aggregation_runner.submit(resolve_filters, snapshot)
+        
+    def register_view(self, page, view, render):
+        """Register a tab page whose charts are drawn by render from the engine's view metrics"""
+        self.view_renderers[page] = render
+        self.view_names[page] = view
+        
+    def view_metrics(self, view):
+        """Metrics of one engine view under the current global filters (cached per filter state)"""
+        if self.engine is None or self.filtered_cube is None:
+            return None
+        view_selections = self.view_selections.get(view, ())
+        key = filter_state_key(self.dataset_version, self.filter_selections, view, view_selections)
+        metrics = self.aggregate_cache.get(key)
+        if metrics is None:
+            metrics = self.engine.metrics(view, self.filtered_cube, view_selections)
+            self.aggregate_cache.put(key, metrics, estimate_nbytes(metrics))
+        return metrics
+        
+    def mark_views_dirty(self):
+        self.dirty_views = set(self.view_renderers)
+        
+    def set_view_selection(self, view, selections):
+        """Set one view's own filter ({column: values}); only that view's tab is recomputed.
+
+        The global filter result is reused from the cache: the view's metrics
+        come from the globally filtered cube narrowed by selections.
+        """
+        if self.engine is None:
+            return
+        view_selections = self.engine.normalize(selections)
+        if view_selections == self.view_selections.get(view, ()):
+            return
+        if view_selections:
+            self.view_selections[view] = view_selections
+        else:
+            self.view_selections.pop(view, None)
+        self.dirty_views.update(page for page, name in self.view_names.items() if name == view)
+        self.render_view(self.tab_widget.currentWidget())
+        
+    def render_view(self, page):
+        """Redraw a tab page if its charts are out of date; returns True if it rendered"""
+        self.build_tab(page)
+        if page not in self.dirty_views or self.filtered_cube is None:
+            return False
+        self.dirty_views.discard(page)
+        self.view_renderers[page]()
+        return True
+        
+    def render_visible_view(self, *_):
+        self.render_view(self.tab_widget.currentWidget())
+        if self.prerender_next_tab and self.dirty_views:
+            self.prerender_timer.start()
+        
+    def prerender_next_view(self):
+        """While idle, draw the tab to the right of the current one so switching to it is instant"""
+        next_page = self.tab_widget.widget(self.tab_widget.currentIndex() + 1)
+        if next_page is not None:
+            self.render_view(next_page)
             
-        # Store filtered data
+    def current_filter_snapshot(self):
+        """Immutable view of the loaded data, the checked global filter values and the visible tab's view"""
+        visible_view = self.view_names.get(self.tab_widget.currentWidget())
+        selections = self.engine.normalize({
+            'Period': self.global_period_model.checked_values(),
+            'Source': self.global_line_model.checked_values(),
+            'Sku': self.global_sku_model.checked_values(),
+        })
+        views = (visible_view,) if visible_view else ()
+        return FilterSnapshot(self.engine, selections, views,
+                              tuple((view, self.view_selections[view]) for view in views if view in self.view_selections))
+        
+    def apply_filters(self):
+        """Resolve the global filters on the GUI thread (used while loading data)"""
+        if self.current_data is None:
+            return
+        snapshot = self.current_filter_snapshot()
+        key = filter_state_key(self.dataset_version, snapshot.selections)
+        result = self.aggregate_cache.get(key)
+        if result is None:
+            result = self.engine.filter(dict(snapshot.selections))
+            self.aggregate_cache.put(key, result, filtered_result_nbytes(result))
+        self.store_filtered(*result, selections=snapshot.selections)
+        
+    def store_filtered(self, filtered_data, filtered_cube, selections=()):
+        # Store the filtered row selection (a view of current_data, never a copy)
         self.filtered_data = filtered_data
+        self.filtered_cube = filtered_cube
+        self.filter_selections = selections
         print(f"Filtered data: {len(filtered_data)} rows (original: {len(self.current_data)} rows)")
-            
         
+    def show_filtered(self, filtered_data, filtered_cube, selections=()):
+        self.store_filtered(filtered_data, filtered_cube, selections)
+        
+        # Only the visible tab is redrawn now; the others when they are shown
+        self.mark_views_dirty()
+        self.render_visible_view()
+        
+    def on_filters_resolved(self, generation, result):
+        if not self.aggregation_runner.accept(generation) or self.current_data is None:
+            return
+        filtered_data, filtered_cube, view_metrics = result
+        selections = self.pending_snapshot.selections
+        view_selections = dict(self.pending_snapshot.view_selections)
+        self.aggregate_cache.put(self.pending_filter_key, (filtered_data, filtered_cube),
+                                 filtered_result_nbytes((filtered_data, filtered_cube)))
+        for view, metrics in view_metrics.items():
+            key = filter_state_key(self.dataset_version, selections, view, view_selections.get(view, ()))
+            self.aggregate_cache.put(key, metrics, estimate_nbytes(metrics))
+        self.show_filtered(filtered_data, filtered_cube, selections)
+        
+    def on_filters_failed(self, generation, message):
+        if self.aggregation_runner.accept(generation):
+            print(f"Warning: Could not apply filters: {message}")
+            
+
+MODULE_IMPORTED = time.perf_counter()
+
+def startup_report(app_created, window_created, tab_build_seconds=None):
+    """Print how long it took to get the first window on screen, what was deferred and which tabs were built"""
+    shown = time.perf_counter()
+    built = [f"{title} {seconds * 1000:.0f} ms" for title, seconds in (tab_build_seconds or {}).items()]
+    loaded = [f"{name} {seconds * 1000:.0f} ms" for name, seconds in DEFERRED_IMPORT_SECONDS.items() if seconds is not None]
+    deferred = [name for name, seconds in DEFERRED_IMPORT_SECONDS.items() if seconds is None]
+    if 'matplotlib' not in sys.modules:
+        deferred.append('matplotlib')
+    print(f"Startup: imports {(MODULE_IMPORTED - IMPORT_STARTED) * 1000:.0f} ms, "
+          f"Qt app {(app_created - MODULE_IMPORTED) * 1000:.0f} ms, "
+          f"window {(window_created - app_created) * 1000:.0f} ms, "
+          f"first window shown after {(shown - IMPORT_STARTED) * 1000:.0f} ms"
+          + (f"; loaded during startup: {', '.join(loaded)}" if loaded else "")
+          + (f"; deferred: {', '.join(deferred)}" if deferred else "")
+          + (f"; tabs built: {', '.join(built)}" if built else ""))
+    
+def preload_deferred_modules():
+    """Import the deferred modules in the background so the first load and chart tab don't wait on them"""
+    for name in list(DEFERRED_IMPORT_SECONDS) + ['matplotlib.backends.backend_qt5agg']:
+        importlib.import_module(name)
+    
+class AggDashboard(DashboardCharts):                    #Window-free DashboardCharts host drawing onto Agg figures
+    """Draws one tab's charts exactly as the window does, without Qt, for the batch CLI"""
+    def __init__(self, theme=None):
+        self.theme = theme if theme is not None else ModernTheme()
+
+    def render(self, view, metrics):
+        """Figure of one engine view's chart drawn from its metrics"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        prefix, method, figure_kwargs = self.CHARTS[view]
+        figure = Figure(**figure_kwargs)
+        FigureCanvasAgg(figure)
+        setattr(self, f'{prefix}_figure', figure)
+        setattr(self, f'{prefix}_panel', ChartPanel(figure, None))
+        getattr(self, method)(metrics)
+        return figure
+
+def render_batch_chart(task):
+    """Process pool task: draw one view's chart and save it in each format; returns (view, paths, seconds)"""
+    view, metrics, stem, formats = task
+    started = time.perf_counter()
+    figure = AggDashboard().render(view, metrics)
+    paths = []
+    for fmt in formats:
+        figure.savefig(f"{stem}.{fmt}", format=fmt)
+        paths.append(f"{stem}.{fmt}")
+    return view, paths, time.perf_counter() - started
+
+def json_metrics(value):
+    """Metrics dicts (Series, Timestamps, numpy scalars, tuples) as plain JSON values"""
+    if isinstance(value, pd.Series):
+        return {str(key): json_metrics(item) for key, item in value.items()}
+    if isinstance(value, dict):
+        return {str(key): json_metrics(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, pd.Index, np.ndarray)):
+        return [json_metrics(item) for item in value]
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return None if isinstance(value, float) and value != value else value
+    return str(value)
+
+def load_filter_spec(spec):
+    """Filter spec from a JSON file or string: {column: values} for the global filters (RejectAnalyticsEngine.FILTER_COLUMNS)
+    plus an optional "tabs": {view: {column: values}} with each tab's own filter"""
+    if not spec:
+        return {}, {}
+    if os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            spec = f.read()
+    spec = json.loads(spec)
+    if not isinstance(spec, dict):
+        raise ValueError("expected a JSON object such as {\"Source\": [\"EOL01_SHAPE\"]}")
+    view_specs = spec.pop('tabs', {})
+    if not isinstance(view_specs, dict) or not all(isinstance(selections, dict) for selections in view_specs.values()):
+        raise ValueError("\"tabs\" must be an object of {view: {column: values}}")
+    for selections in [spec] + list(view_specs.values()):
+        for column, values in selections.items():
+            if column not in RejectAnalyticsEngine.FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter column '{column}' (expected one of {', '.join(RejectAnalyticsEngine.FILTER_COLUMNS)})")
+            if not isinstance(values, list):
+                raise ValueError(f"Values of filter column '{column}' must be a list")
+    for view in view_specs:
+        if view not in RejectAnalyticsEngine.VIEWS:
+            raise ValueError(f"Unknown tab view '{view}' (expected one of {', '.join(RejectAnalyticsEngine.VIEWS)})")
+    return spec, view_specs
+
+def batch_output_names(paths):
+    """Output sub-directory name per export: its file name, plus a hash of its folder when names collide"""
+    names = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    counts = Counter(names)
+    folder_id = lambda path: hashlib.sha1(os.path.dirname(os.path.abspath(path)).encode('utf-8')).hexdigest()[:8]
+    return [name if counts[name] == 1 else f"{name}-{folder_id(path)}" for name, path in zip(names, paths)]
+
+def run_batch(argv):
+    """Headless batch run: every chart tab as PNG/SVG plus a JSON metrics file per export; returns an exit code"""
+    parser = argparse.ArgumentParser(prog='rejected_units_analyzer.py --batch',
+                                     description="Render the dashboard charts and metrics of E80 exports without a display.")
+    parser.add_argument('workbooks', nargs='+', help="E80 rejected units exports (.xlsx)")
+    parser.add_argument('--filters', help="JSON filter spec or a file holding one, e.g. "
+                                          "'{\"Source\": [\"EOL01_SHAPE\"], \"tabs\": {\"time\": {\"Period\": [...]}}}'")
+    parser.add_argument('--output', default='batch_output', help="Directory for one sub-directory of output per export")
+    parser.add_argument('--formats', default='png,svg', help="Comma-separated chart formats (default png,svg)")
+    parser.add_argument('--workers', type=int, default=None, help="Chart rendering processes (default: one per core)")
+    args = parser.parse_args(argv)
+    formats = [fmt.strip().lower() for fmt in args.formats.split(',') if fmt.strip()]
+    try:
+        selections, view_specs = load_filter_spec(args.filters)
+    except (ValueError, OSError) as e:
+        print(f"Error: Invalid filter spec: {e}")
+        return 2
+    
+    # Seconds spent per stage, summed over every export
+    timings = OrderedDict((stage, 0.0) for stage in ('read', 'clean', 'analyze', 'metrics', 'write json', 'render charts'))
+    @contextmanager
+    def stage(name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[name] += time.perf_counter() - started
+    
+    # An export listed twice is processed once; same-named exports from different folders get their own directories
+    workbooks = list({os.path.abspath(path): path for path in args.workbooks}.values())
+    pipeline = RejectPipeline()
+    tasks, failures = [], 0
+    for path, name in zip(workbooks, batch_output_names(workbooks)):
+        try:
+            with stage('read'):
+                file_hash = pipeline.cache.file_hash(path)
+                cached = pipeline.cache.find(file_hash, pipeline.cache_key())
+                if cached is None:
+                    data_sheet, df = read_e80_workbook(path)
+                    validate_e80_export(data_sheet, df)
+                else:
+                    data_sheet, df = cached
+            if cached is None:
+                with stage('clean'):
+                    df = pipeline.clean_data(df)
+                    try:
+                        pipeline.store_cleaned(file_hash, data_sheet, pipeline.cache_key(), df)
+                    except Exception as e:
+                        print(f"Warning: Could not write cache entry: {e}")
+            with stage('analyze'):
+                analysis = pipeline.perform_analysis(df)
+                engine = pipeline.build_engine(df, analysis)
+            with stage('metrics'):
+                filtered_rows, filtered_cube = engine.filter(selections)
+                view_metrics = {view: engine.metrics(view, filtered_cube, engine.normalize(view_specs.get(view, {})))
+                                for view in engine.VIEWS}
+        except Exception as e:
+            print(f"Error: Could not process {path}: {e}")
+            failures += 1
+            continue
+        
+        output_dir = os.path.join(args.output, name)
+        os.makedirs(output_dir, exist_ok=True)
+        with stage('write json'):
+            with open(os.path.join(output_dir, 'metrics.json'), 'w', encoding='utf-8') as f:
+                json.dump({'workbook': os.path.abspath(path), 'sheet': data_sheet, 'from_cache': cached is not None,
+                           'rows': len(df), 'filtered_rows': len(filtered_rows),
+                           'filters': selections, 'tab_filters': view_specs,
+                           'metrics': json_metrics(view_metrics)}, f, indent=2)
+        tasks.extend((view, view_metrics[view], os.path.join(output_dir, view), formats)
+                     for view in DashboardCharts.CHARTS)
+        print(f"{name}: {len(df):,} rows, {len(filtered_rows):,} after filters{' (cached)' if cached is not None else ''}")
+    
+    # Each chart is drawn and saved in its own process
+    chart_seconds = OrderedDict()
+    if tasks and formats:
+        with stage('render charts'):
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                for view, paths, seconds in executor.map(render_batch_chart, tasks):
+                    chart_seconds[view] = chart_seconds.get(view, 0.0) + seconds
+    
+    print(f"Wrote {len(tasks) * len(formats)} chart files for {len(workbooks) - failures} of "
+          f"{len(workbooks)} exports to {os.path.abspath(args.output)}")
+    print("Stage timings:")
+    for name, seconds in timings.items():
+        print(f"  {name:14s} {seconds:8.3f}s")
+    for view, seconds in chart_seconds.items():
+        print(f"    {view:18s} {seconds:8.3f}s (in worker)")
+    return 1 if failures else 0
 
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == '--batch':
+        sys.exit(run_batch(sys.argv[2:]))
+    if len(sys.argv) >= 2 and sys.argv[1] == '--benchmark-load':
+        for path in sys.argv[2:] or ['Rejected Units - All Lines - 2025 YTD.xlsx']:
+            benchmark_workbook_load(path)
+        return
+    
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
@@ -2770,8 +4810,22 @@ def main():
     app.setApplicationVersion("1.0")
     app.setOrganizationName("PepsiCo - Stone Mountain")
     
+    app_created = time.perf_counter()
+    
     window = RejectedUnitsAnalyzer()
     window.show()
+    window_created = time.perf_counter()
+    
+    # Report time-to-first-window once the event loop has painted it; --benchmark-startup
+    # exits right after, otherwise the deferred imports are warmed up while a file is picked
+    benchmark_startup = '--benchmark-startup' in sys.argv[1:]
+    def first_window_shown():
+        startup_report(app_created, window_created, window.tab_build_seconds)
+        if benchmark_startup:
+            app.quit()
+        else:
+            threading.Thread(target=preload_deferred_modules, daemon=True).start()
+    QTimer.singleShot(0, first_window_shown)
     
     sys.exit(app.exec_())
 
@@ -0,0 +1,58 @@
+import pandas as pd
+
+import rejected_units_analyzer as rua
+
+
+def counting_registry(calls):
+    """DerivedColumnRegistry whose builders record their column name on every call"""
+    registry = rua.DerivedColumnRegistry()
+    for name, column in list(registry.columns.items()):
+        def compute(*inputs, _compute=column.compute, _name=name):
+            calls.append(_name)
+            return _compute(*inputs)
+        registry.register(name, column.inputs, compute)
+    return registry
+
+
+def cleaned_frame(times, reasons):
+    return pd.DataFrame({
+        'Source': pd.Categorical(['EOL01_SHAPE', 'EOL03A_SHAPE', 'EOL05_SHAPE'][:len(times)]),
+        'Reject reason': pd.Categorical(reasons),
+        'Reject datetime': pd.to_datetime(times),
+    })
+
+
+def test_materialize_computes_each_column_once():
+    calls = []
+    registry = counting_registry(calls)
+    df = cleaned_frame(['2025-01-06 07:30', '2025-02-11 19:05'], ['Height error', 'Label missing'])
+    registry.materialize(df)
+    assert calls == list(registry.columns)
+    registry.materialize(df)
+    assert calls == list(registry.columns)
+
+
+def test_dropped_columns_and_their_dependents_are_rebuilt():
+    calls = []
+    registry = counting_registry(calls)
+    df = registry.materialize(cleaned_frame(['2025-01-06 07:30', '2025-02-11 19:05'], ['Height error', 'Label missing']))
+    del calls[:]
+    df = df.drop(columns=['Category', 'Hour'])
+    df['Shift'] = df['Shift'].cat.set_categories([])  # Stale: must follow the rebuilt Hour
+    registry.materialize(df)
+    assert calls == ['Category', 'Hour', 'Shift']
+    assert list(df['Shift'].astype(str)) == list(registry.materialize(cleaned_frame(
+        ['2025-01-06 07:30', '2025-02-11 19:05'], ['Height error', 'Label missing']))['Shift'].astype(str))
+
+
+def test_appended_rows_reuse_existing_columns():
+    calls = []
+    registry = counting_registry(calls)
+    base = registry.materialize(cleaned_frame(['2025-01-06 07:30', '2025-02-11 19:05'], ['Height error', 'Label missing']))
+    delta = registry.materialize(cleaned_frame(['2025-03-03 23:40'], ['Height error']))
+    del calls[:]
+    combined = rua.concat_cleaned([base, delta])
+    assert registry.missing(combined) == []
+    expected = registry.materialize(combined.drop(columns=list(registry.columns)))
+    for name in registry.columns:
+        assert list(combined[name].astype(object)) == list(expected[name].astype(object))
@@ -0,0 +1,40 @@
+import pandas as pd
+
+import rejected_units_analyzer as rua
+
+
+def write_export(path, stamps):
+    pd.DataFrame({
+        'Reject datetime': stamps,
+        'Source': 'EOL01_SHAPE',
+        'Reject reason': 'Height error',
+        'Lpn': [f"LPN{i}" for i in range(len(stamps))],
+        'Sku': '300043010',
+        'Log text': 'Height check failed',
+    }).to_excel(path, index=False, sheet_name='Rejects')
+
+
+def test_cutoff_matches_on_cache_miss_and_hit(tmp_path):
+    path = tmp_path / 'export.xlsx'
+    cutoff = pd.Timestamp('2025-03-01 08:00')
+    write_export(path, [pd.Timestamp('2025-02-27 10:00'), None, cutoff, pd.Timestamp('2025-03-02 12:30')])
+    cache = rua.ParsedWorkbookCache(str(tmp_path / 'cache'))
+    pipeline = rua.RejectPipeline(cache)
+    pipeline.sku_master = rua.SkuMasterService(str(tmp_path / 'no master.xlsx'), cache)
+    worker = rua.IngestWorker(str(path), cache, pipeline.cache_key(), pipeline.clean_data, pipeline.perform_analysis)
+
+    _, missed, from_cache = worker.load(cutoff)
+    assert not from_cache
+    _, full, _ = worker.load()  # Stores the whole export
+    assert list(full['Lpn'].astype(str)) == ['LPN0', 'LPN1', 'LPN2', 'LPN3']
+    _, hit, from_cache = worker.load(cutoff)
+    assert from_cache
+
+    # The undated row (LPN1) is left out of an incremental append either way
+    assert list(missed['Lpn'].astype(str)) == ['LPN2', 'LPN3']
+    assert list(hit['Lpn'].astype(str)) == ['LPN2', 'LPN3']
+
+
+def test_rows_since_drops_undated_rows():
+    df = pd.DataFrame({'Reject datetime': pd.to_datetime(['2025-03-01', None, '2025-02-01']), 'Lpn': ['a', 'b', 'c']})
+    assert list(rua.rows_since(df, pd.Timestamp('2025-03-01'))['Lpn']) == ['a']